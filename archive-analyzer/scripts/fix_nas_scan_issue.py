@@ -10,8 +10,10 @@ Issue #57: NAS 스캔 문제 해결 스크립트
 2. NAS 재스캔
 3. 새 데이터로 업데이트
 """
+import os
 import sys
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -21,6 +23,9 @@ ARCHIVE_DB = 'D:/AI/claude01/archive-analyzer/archive.db'
 POKERVOD_DB = 'D:/AI/claude01/shared-data/pokervod.db'
 NAS_ARCHIVE = Path(r'\\10.10.100.122\docker\GGPNAs\ARCHIVE')
 
+# SMB 경로 존재 확인 동시 요청 수 (I/O 대기 위주라 GIL 영향 적음)
+EXISTS_CHECK_WORKERS = 32
+
 
 def count_nas_files():
     """NAS 실제 파일 수 확인"""
@@ -54,20 +59,19 @@ def cleanup_invalid_records(db_path, path_column='path', dry_run=True):
     all_files = cursor.fetchall()
     print(f"  총 레코드: {len(all_files)}")
 
-    invalid_ids = []
-    for file_id, path in all_files:
-        if not Path(path).exists():
-            invalid_ids.append(file_id)
+    # NAS 왕복 지연을 겹치도록 존재 확인을 병렬 실행 (순서 유지)
+    with ThreadPoolExecutor(max_workers=EXISTS_CHECK_WORKERS) as executor:
+        exists = executor.map(os.path.exists, (path for _, path in all_files), chunksize=64)
+        invalid_ids = [file_id for (file_id, _), ok in zip(all_files, exists) if not ok]
 
     print(f"  유효하지 않은 레코드: {len(invalid_ids)}")
 
     if not dry_run and invalid_ids:
-        # 배치로 삭제
-        chunk_size = 100
-        for i in range(0, len(invalid_ids), chunk_size):
-            chunk = invalid_ids[i:i + chunk_size]
-            placeholders = ','.join('?' * len(chunk))
-            cursor.execute(f'DELETE FROM files WHERE id IN ({placeholders})', chunk)
+        # 삭제 대상을 임시 테이블에 적재 후 단일 DELETE (청크별 IN 쿼리 반복 제거)
+        cursor.execute('CREATE TEMP TABLE invalid_ids (id PRIMARY KEY)')
+        cursor.executemany('INSERT OR IGNORE INTO invalid_ids VALUES (?)', ((i,) for i in invalid_ids))
+        cursor.execute('DELETE FROM files WHERE id IN (SELECT id FROM invalid_ids)')
+        cursor.execute('DROP TABLE invalid_ids')
         conn.commit()
         print(f"  삭제 완료: {len(invalid_ids)} 레코드")
 
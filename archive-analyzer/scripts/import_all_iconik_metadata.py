@@ -138,9 +138,6 @@ def import_all(
     # DB에 임포트
     db = Database(db_path)
 
-    imported_matched = 0
-    imported_unmatched = 0
-
     for clip in all_clips:
         iconik_id = clip['iconik_id']
 
@@ -155,17 +152,13 @@ def import_all(
             clip['matched_file_path'] = None
             clip['match_confidence'] = None
 
-        try:
-            db.insert_clip_metadata(clip)
-            if clip['file_id']:
-                imported_matched += 1
-            else:
-                imported_unmatched += 1
-        except Exception as e:
-            logger.warning(f"Failed to insert clip {iconik_id}: {e}")
-
+    # 1000행 단위 트랜잭션으로 일괄 삽입 (실패 행은 Database에서 건너뜀)
+    imported, imported_matched = db.insert_clip_metadata_batch(all_clips)
     db.close()
 
+    # 매칭 건수는 실제로 삽입된 행 기준 (건너뛴 행 제외)
+    imported_unmatched = imported - imported_matched
+
     stats = {
         'total': len(all_clips),
         'matched': imported_matched,
@@ -79,23 +79,38 @@ def parse_bool_tag(value: str) -> bool:
     return bool(value and value.strip())
 
 
-def parse_csv_row(row: Dict[str, str]) -> Dict[str, Any]:
-    """CSV 행을 DB 레코드로 변환"""
-    clip = {}
+def parse_text(value: str) -> Optional[str]:
+    """빈 문자열은 None"""
+    return value if value else None
+
+
+# 정수 필드
+INT_FIELDS = frozenset(('time_start_ms', 'time_end_ms', 'year'))
+
+
+def _field_parser(db_field: str):
+    """DB 필드에 맞는 변환 함수 선택"""
+    if db_field.startswith('is_'):
+        return parse_bool_tag
+    if db_field in INT_FIELDS:
+        return parse_int
+    return parse_text
 
-    for csv_col, db_field in COLUMN_MAPPING.items():
-        value = row.get(csv_col, '').strip()
 
-        # 불리언 필드
-        if db_field.startswith('is_'):
-            clip[db_field] = parse_bool_tag(value)
-        # 정수 필드
-        elif db_field in ('time_start_ms', 'time_end_ms', 'year'):
-            clip[db_field] = parse_int(value)
-        else:
-            clip[db_field] = value if value else None
+# (CSV 컬럼, DB 필드, 변환 함수) - 필드 타입 판별은 모듈 로드 시 1회만 수행
+FIELD_PARSERS = tuple(
+    (csv_col, db_field, _field_parser(db_field))
+    for csv_col, db_field in COLUMN_MAPPING.items()
+)
+
 
-    return clip
+def parse_csv_row(row: Dict[str, str]) -> Dict[str, Any]:
+    """CSV 행을 DB 레코드로 변환"""
+    get = row.get
+    return {
+        db_field: parse(get(csv_col, '').strip())
+        for csv_col, db_field, parse in FIELD_PARSERS
+    }
 
 
 def load_csv(csv_path: str) -> List[Dict[str, Any]]:
@@ -222,8 +237,7 @@ def import_iconik_csv(
             file_map[record.path] = record.id
         logger.info(f"Loaded {len(file_paths)} files for matching")
 
-    # 클립 임포트
-    imported = 0
+    # 파일 매칭
     matched = 0
 
     for i, clip in enumerate(clips):
@@ -242,17 +256,12 @@ def import_iconik_csv(
                 clip['match_confidence'] = confidence
                 matched += 1
 
-        # DB에 삽입
-        try:
-            db.insert_clip_metadata(clip)
-            imported += 1
-        except Exception as e:
-            logger.warning(f"Failed to insert clip {clip.get('iconik_id')}: {e}")
-
         # 진행률 로깅
         if (i + 1) % 100 == 0:
             logger.info(f"Processed {i + 1}/{len(clips)} clips")
 
+    # DB에 일괄 삽입 (1000행 단위 트랜잭션)
+    imported, _ = db.insert_clip_metadata_batch(clips)
     db.close()
 
     stats = {
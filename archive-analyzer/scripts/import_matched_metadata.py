@@ -146,14 +146,7 @@ def merge_and_import(
     # DB에 임포트
     db = Database(db_path)
 
-    imported = 0
-    for clip in merged_clips:
-        try:
-            db.insert_clip_metadata(clip)
-            imported += 1
-        except Exception as e:
-            logger.warning(f"Failed to insert clip {clip['iconik_id']}: {e}")
-
+    imported, _ = db.insert_clip_metadata_batch(merged_clips)
     db.close()
 
     stats = {
@@ -6,8 +6,11 @@ MeiliSearch를 통한 파일/미디어/클립 검색 REST API를 제공합니다
     uvicorn archive_analyzer.api:app --reload --port 8000
 """
 
+import asyncio
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from html import escape
 from pathlib import Path
@@ -349,6 +352,24 @@ async def clear_all(request: Request):
 # Sync Endpoints (pokervod.db 동기화)
 # =============================================
 
+# SQLite는 단일 writer이므로 동기화 호출은 전용 스레드 1개에서 직렬 실행
+_sync_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pokervod-sync")
+
+
+def _run_sync_service(method: str, **kwargs):
+    """SyncService 생성(인덱스 보장 포함) 후 메서드 호출 - 워커 스레드에서 실행"""
+    from .sync import SyncService
+
+    return getattr(SyncService(), method)(**kwargs)
+
+
+async def _sync_call(method: str, **kwargs):
+    """블로킹 SQLite 동기화 호출을 이벤트 루프 밖에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _sync_executor, functools.partial(_run_sync_service, method, **kwargs)
+    )
+
 
 class SyncResultResponse(BaseModel):
     """동기화 결과 응답"""
@@ -386,10 +407,7 @@ async def get_sync_stats(request: Request):
     archive.db와 pokervod.db의 현재 레코드 수를 비교합니다.
     """
     try:
-        from .sync import SyncService
-
-        sync_service = SyncService()
-        stats = sync_service.get_sync_stats()
+        stats = await _sync_call("get_sync_stats")
         return SyncStatsResponse(**stats)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="필요한 파일을 찾을 수 없습니다")
@@ -409,10 +427,7 @@ async def sync_files(
     archive.db의 파일 정보를 pokervod.db로 동기화합니다.
     """
     try:
-        from .sync import SyncService
-
-        sync_service = SyncService()
-        result = sync_service.sync_files(dry_run=dry_run)
+        result = await _sync_call("sync_files", dry_run=dry_run)
         return SyncResultResponse(
             inserted=result.inserted,
             updated=result.updated,
@@ -439,10 +454,7 @@ async def sync_catalogs(
     archive.db의 파일 경로에서 카탈로그를 추출하여 pokervod.db에 동기화합니다.
     """
     try:
-        from .sync import SyncService
-
-        sync_service = SyncService()
-        result = sync_service.sync_catalogs(dry_run=dry_run)
+        result = await _sync_call("sync_catalogs", dry_run=dry_run)
         return SyncResultResponse(
             inserted=result.inserted,
             updated=result.updated,
@@ -467,10 +479,7 @@ async def sync_all(
     카탈로그와 파일을 순차적으로 동기화합니다.
     """
     try:
-        from .sync import SyncService
-
-        sync_service = SyncService()
-        results = sync_service.run_full_sync(dry_run=dry_run)
+        results = await _sync_call("run_full_sync", dry_run=dry_run)
 
         return FullSyncResponse(
             success=True,
@@ -8,7 +8,7 @@ import sqlite3
 import threading
 import time
 from contextlib import contextmanager
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Iterator, List, Optional, Tuple
 
@@ -101,13 +101,19 @@ class FileRecord:
     created_at: Optional[datetime] = None
 
     def to_dict(self) -> dict:
-        """딕셔너리로 변환"""
-        d = asdict(self)
-        if d["modified_at"]:
-            d["modified_at"] = d["modified_at"].isoformat()
-        if d["created_at"]:
-            d["created_at"] = d["created_at"].isoformat()
-        return d
+        """딕셔너리로 변환 (asdict 호출 없이 직접 생성)"""
+        return {
+            "id": self.id,
+            "path": self.path,
+            "filename": self.filename,
+            "extension": self.extension,
+            "size_bytes": self.size_bytes,
+            "modified_at": self.modified_at.isoformat() if self.modified_at else None,
+            "file_type": self.file_type,
+            "parent_folder": self.parent_folder,
+            "scan_status": self.scan_status,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
 
     @classmethod
     def from_row(cls, row: tuple, columns: list[str]) -> "FileRecord":
@@ -142,6 +148,12 @@ class Database:
 
     SCHEMA_VERSION = 1
 
+    # 연결 단위 PRAGMA (DB 파일에 영구 반영되는 journal_mode 등은 제외)
+    CONNECTION_PRAGMAS = (
+        "cache_size=-65536",
+        "temp_store=MEMORY",
+    )
+
     def __init__(self, db_path: str = "archive.db", stats_cache_ttl: int = 60):
         """
         Args:
@@ -168,8 +180,12 @@ class Database:
     def _get_connection(self) -> sqlite3.Connection:
         """데이터베이스 연결 반환 (스레드 안전)"""
         if self._connection is None:
-            self._local.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self._local.conn.row_factory = sqlite3.Row
+            # 스캔/임포트 반복 쿼리가 컴파일된 구문을 재사용하도록 구문 캐시 확대
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            for pragma in self.CONNECTION_PRAGMAS:
+                conn.execute(f"PRAGMA {pragma}")
+            self._local.conn = conn
         return self._connection
 
     @contextmanager
@@ -216,6 +232,8 @@ class Database:
 
         # 인덱스 생성
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_path ON files(path)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_extension ON files(extension)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_type ON files(file_type)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_status ON files(scan_status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_parent ON files(parent_folder)")
@@ -1001,20 +1019,49 @@ class Database:
         conn.commit()
         return cursor.lastrowid
 
-    def insert_clip_metadata_batch(self, clips: List[dict]) -> int:
+    def insert_clip_metadata_batch(
+        self, clips: List[dict], batch_size: int = 1000
+    ) -> Tuple[int, int]:
         """클립 메타데이터 일괄 삽입
 
+        batch_size개씩 executemany + 1회 커밋으로 삽입하며, 실패한 묶음은
+        롤백 후 행 단위로 재시도해 문제 행만 건너뛴다 (예외 종류 무관).
+
         Args:
             clips: 클립 메타데이터 딕셔너리 목록
+            batch_size: 트랜잭션당 행 수
 
         Returns:
-            삽입된 레코드 수
+            (삽입된 레코드 수, 그중 file_id가 매칭된 레코드 수)
         """
-        if not clips:
-            return 0
-
+        inserted = 0
+        matched = 0
+        for start in range(0, len(clips), batch_size):
+            batch = clips[start : start + batch_size]
+            try:
+                self._insert_clip_metadata_rows(batch)
+                done = batch
+            except Exception as e:
+                logger.warning(f"Batch insert failed, retrying row by row: {e}")
+                self._get_connection().rollback()
+                done = []
+                for clip in batch:
+                    try:
+                        self.insert_clip_metadata(clip)
+                        done.append(clip)
+                    except Exception as row_error:
+                        logger.warning(
+                            f"Failed to insert clip {clip.get('iconik_id')}: {row_error}"
+                        )
+            inserted += len(done)
+            matched += sum(1 for clip in done if clip.get("file_id"))
+        return inserted, matched
+
+    def _insert_clip_metadata_rows(self, clips: List[dict]):
+        """클립 메타데이터 묶음을 단일 트랜잭션으로 삽입"""
         conn = self._get_connection()
         cursor = conn.cursor()
+        updated_at = datetime.now().isoformat()
 
         data = [
             (
@@ -1048,7 +1095,7 @@ class Database:
                 c.get("file_id"),
                 c.get("matched_file_path"),
                 c.get("match_confidence"),
-                datetime.now().isoformat(),
+                updated_at,
             )
             for c in clips
         ]
@@ -1069,7 +1116,6 @@ class Database:
         )
 
         conn.commit()
-        return len(clips)
 
     def get_clip_metadata_by_iconik_id(self, iconik_id: str) -> Optional[dict]:
         """iconik ID로 클립 메타데이터 조회"""
@@ -15,7 +15,7 @@ import subprocess
 import tempfile
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
@@ -106,8 +106,8 @@ class MediaInfo:
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리 변환"""
-        d = asdict(self)
+        """딕셔너리 변환 (필드가 모두 스칼라라 asdict의 재귀 deepcopy 없이 얕은 복사)"""
+        d = self.__dict__.copy()
         d["resolution"] = self.resolution
         d["resolution_label"] = self.resolution_label
         d["duration_formatted"] = self.duration_formatted
@@ -274,6 +274,9 @@ class SMBMediaExtractor:
     # 파일 끝에 있는 경우 전체 다운로드 필요
     HEADER_SIZE = 512 * 1024  # 512KB (속도 최적화)
 
+    # 전체 다운로드 시 읽기 버퍼 크기 (파일 전체를 bytes로 올리지 않음)
+    COPY_CHUNK_SIZE = 1024 * 1024  # 1MB
+
     def __init__(
         self,
         connector: SMBConnector,
@@ -407,13 +410,18 @@ class SMBMediaExtractor:
 
             logger.debug(f"Downloading {download_size:,} bytes of {smb_path}")
 
-            # SMB에서 읽기
-            with self.connector.open_file(smb_path, mode="rb") as smb_file:
-                data = smb_file.read(download_size)
-
-            # 임시 파일에 저장
-            with open(temp_path, "wb") as f:
-                f.write(data)
+            # SMB에서 재사용 버퍼로 readinto → 임시 파일에 기록 (읽기마다 bytes 할당/복사 없음)
+            buffer = memoryview(bytearray(min(download_size, self.COPY_CHUNK_SIZE)))
+            remaining = download_size
+            with self.connector.open_file(smb_path, mode="rb") as smb_file, open(
+                temp_path, "wb", buffering=0
+            ) as f:
+                while remaining > 0:
+                    n = smb_file.readinto(buffer[: min(len(buffer), remaining)])
+                    if not n:
+                        break
+                    f.write(buffer[:n])
+                    remaining -= n
 
             return temp_path
 
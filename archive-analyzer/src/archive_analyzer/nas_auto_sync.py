@@ -109,7 +109,7 @@ class NASAutoSync:
         self.config = config or AutoSyncConfig()
         self.connector: Optional[SMBConnector] = None
         self.database: Optional[Database] = None
-        self._existing_paths: Set[str] = set()
+        self._existing_paths: Set[str] = set()  # 정규화된 경로
 
     def _connect(self) -> None:
         """SMB 및 DB 연결"""
@@ -141,13 +141,15 @@ class NASAutoSync:
             self.database = None
 
     def _load_existing_paths(self) -> Set[str]:
-        """기존 DB에 등록된 파일 경로 로드"""
+        """기존 DB에 등록된 파일 경로 로드 (정규화된 경로 set 하나만 유지)"""
         if self.database is None:
             return set()
 
         conn = self.database._get_connection()
         cursor = conn.execute("SELECT path FROM files")
-        paths = {row[0] for row in cursor.fetchall()}
+        # fetchall 리스트/원본 경로 set 없이 커서를 순회하며 바로 정규화
+        normalize = self._normalize_path
+        paths = {normalize(path) for (path,) in cursor}
         logger.info(f"기존 파일 수: {len(paths)}")
         return paths
 
@@ -172,9 +174,9 @@ class NASAutoSync:
         try:
             self._connect()
 
-            # 기존 경로 로드
+            # 기존 경로 로드 (대소문자/구분자 차이 흡수용, 정확히 같은 경로는 UNIQUE 제약이 처리)
             self._existing_paths = self._load_existing_paths()
-            existing_normalized = {self._normalize_path(p) for p in self._existing_paths}
+            existing_normalized = self._existing_paths
 
             logger.info(f"증분 스캔 시작: {self.config.archive_path}")
 
@@ -209,15 +211,15 @@ class NASAutoSync:
                         "scan_status": "scanned",
                     }
 
-                    if not dry_run:
+                    if dry_run:
+                        result.new_files += 1
+                    else:
                         batch.append(record)
-
-                    result.new_files += 1
                     logger.debug(f"새 파일: {info.path}")
 
                     # 배치 저장
                     if len(batch) >= self.config.batch_size:
-                        self._save_batch(batch)
+                        self._save_batch(batch, result)
                         batch = []
 
                 except Exception as e:
@@ -226,7 +228,7 @@ class NASAutoSync:
 
             # 남은 배치 저장
             if batch and not dry_run:
-                self._save_batch(batch)
+                self._save_batch(batch, result)
 
         except Exception as e:
             result.errors.append(f"스캔 오류: {str(e)}")
@@ -238,39 +240,63 @@ class NASAutoSync:
 
         return result
 
-    def _save_batch(self, batch: List[dict]) -> None:
-        """배치 저장"""
+    _INSERT_FILE_SQL = """
+        INSERT OR IGNORE INTO files (
+            path, filename, extension, size_bytes,
+            modified_at, file_type, parent_folder, scan_status
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _file_row(record: dict) -> tuple:
+        """files INSERT 파라미터"""
+        return (
+            record["path"],
+            record["filename"],
+            record["extension"],
+            record["size_bytes"],
+            record["modified_at"].isoformat() if record["modified_at"] else None,
+            record["file_type"],
+            record["parent_folder"],
+            record["scan_status"],
+        )
+
+    def _save_batch(
+        self, batch: List[dict], result: Optional[IncrementalScanResult] = None
+    ) -> int:
+        """배치 저장
+
+        중복 경로는 UNIQUE 제약 + INSERT OR IGNORE로 DB가 걸러내며,
+        total_changes 차이로 실제 삽입 건수를 집계한다.
+
+        Returns:
+            삽입된 레코드 수
+        """
         if not self.database or not batch:
-            return
+            return 0
 
         conn = self.database._get_connection()
-        cursor = conn.cursor()
-
-        for record in batch:
-            try:
-                cursor.execute(
-                    """
-                    INSERT OR IGNORE INTO files (
-                        path, filename, extension, size_bytes,
-                        modified_at, file_type, parent_folder, scan_status
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        record["path"],
-                        record["filename"],
-                        record["extension"],
-                        record["size_bytes"],
-                        record["modified_at"].isoformat() if record["modified_at"] else None,
-                        record["file_type"],
-                        record["parent_folder"],
-                        record["scan_status"],
-                    ),
-                )
-            except Exception as e:
-                logger.warning(f"배치 저장 오류: {record['path']} - {e}")
+        before = conn.total_changes
+        try:
+            conn.executemany(self._INSERT_FILE_SQL, [self._file_row(r) for r in batch])
+        except Exception as e:
+            # 문제 행만 건너뛰도록 행 단위로 재시도
+            logger.warning(f"배치 저장 오류, 행 단위 재시도: {e}")
+            conn.rollback()
+            before = conn.total_changes
+            for record in batch:
+                try:
+                    conn.execute(self._INSERT_FILE_SQL, self._file_row(record))
+                except Exception as row_error:
+                    logger.warning(f"배치 저장 오류: {record['path']} - {row_error}")
 
         conn.commit()
-        logger.debug(f"배치 저장: {len(batch)}건")
+        inserted = conn.total_changes - before
+        if result is not None:
+            result.new_files += inserted
+            result.skipped_files += len(batch) - inserted
+        logger.debug(f"배치 저장: {inserted}/{len(batch)}건")
+        return inserted
 
     def sync_to_pokervod(self, dry_run: bool = False) -> dict:
         """pokervod.db로 동기화
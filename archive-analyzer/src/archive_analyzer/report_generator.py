@@ -356,9 +356,7 @@ class ReportGenerator:
         ext_by_type = {}
         for ext_row in cursor.fetchall():
             ftype = ext_row[0] or "unknown"
-            if ftype not in ext_by_type:
-                ext_by_type[ftype] = {}
-            ext_by_type[ftype][ext_row[1] or "none"] = ext_row[2]
+            ext_by_type.setdefault(ftype, {})[ext_row[1] or "none"] = ext_row[2]
 
         stats_list = []
         for row in type_rows:
@@ -620,32 +618,24 @@ class ReportGenerator:
                 if not part:
                     continue
 
-                if part not in current.children:
-                    current.children[part] = FolderTreeNode(
+                child = current.children.get(part)
+                if child is None:
+                    child = current.children[part] = FolderTreeNode(
                         name=part,
                         full_path="/".join(parts[: i + 1]),
                         depth=i + 1,
                     )
 
-                current = current.children[part]
+                current = child
 
             # 리프 노드에 통계 추가
             current.file_count = stats.file_count
             current.total_size = stats.total_size
             current.video_count = stats.video_count
 
-        # 부모 노드 통계 집계
-        self._aggregate_tree_stats(root)
-
+        # 부모 노드로 통계를 집계하지 않음 (이중 계산 방지, 리프 노드만 실제 데이터 가짐)
         return root
 
-    def _aggregate_tree_stats(self, node: FolderTreeNode) -> None:
-        """트리 노드의 자식 통계를 부모로 집계"""
-        for child in node.children.values():
-            self._aggregate_tree_stats(child)
-            # 자식이 리프 노드가 아니면 합계에 포함 안함 (이중 계산 방지)
-            # 리프 노드만 실제 데이터 가짐
-
     def _gather_duration_stats(self, report: ArchiveReport) -> None:
         """재생시간별 통계 수집"""
         cursor = self._conn.cursor()
@@ -20,7 +20,7 @@ import os
 import sqlite3
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
 from google.oauth2.service_account import Credentials
@@ -34,6 +34,25 @@ try:
 except ImportError:
     TITLE_GENERATOR_AVAILABLE = False
 
+# xxhash (optional - 없으면 MD5로 대체, 둘 다 32자리 hex)
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+def content_hash(data: str) -> str:
+    """변경 감지용 데이터 해시 (보안 용도 아님)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(data.encode())
+    return hashlib.md5(data.encode()).hexdigest()
+
+
+# display_title 자동 생성 대상 테이블
+DISPLAY_TITLE_TABLES = frozenset({"catalogs", "subcatalogs", "files", "hands"})
+
 
 # =============================================
 # Configuration
@@ -239,7 +258,7 @@ class SheetsClient:
         """워크시트 데이터의 해시값 계산"""
         records = self.get_all_records(worksheet_name)
         data_str = json.dumps(records, sort_keys=True, default=str)
-        return hashlib.md5(data_str.encode()).hexdigest()
+        return content_hash(data_str)
 
 
 # =============================================
@@ -296,7 +315,7 @@ class DatabaseClient:
         """테이블 데이터의 해시값 계산"""
         _, rows = self.get_all_records(table_name)
         data_str = json.dumps(rows, sort_keys=True, default=str)
-        return hashlib.md5(data_str.encode()).hexdigest()
+        return content_hash(data_str)
 
     def upsert_record(self, table_name: str, record: Dict[str, Any], pk_column: str):
         """레코드 삽입 또는 업데이트"""
@@ -355,6 +374,14 @@ class DatabaseClient:
 # =============================================
 
 
+@dataclass(frozen=True)
+class TableHashes:
+    """테이블 1개의 DB/Sheet 해시 쌍 (동기화 후 통째로 교체)"""
+
+    db: str
+    sheet: str
+
+
 class SheetsSyncService:
     """Google Sheets <-> SQLite 양방향 동기화 서비스"""
 
@@ -362,7 +389,7 @@ class SheetsSyncService:
         self.config = config or SyncConfig()
         self.sheets = SheetsClient(self.config)
         self.db = DatabaseClient(self.config.db_path)
-        self._last_hashes: Dict[str, Dict[str, str]] = {}  # {table: {source: hash}}
+        self._last_hashes: Dict[str, TableHashes] = {}  # {table: 마지막 동기화 시점 해시}
 
         # Title Generator 초기화
         self.title_generator = TitleGenerator() if TITLE_GENERATOR_AVAILABLE else None
@@ -397,22 +424,19 @@ class SheetsSyncService:
         sheet_records = self.sheets.get_all_records(table_name)
 
         # 해시 비교로 변경 감지
-        db_hash = self.db.get_table_hash(table_name)
-        sheet_hash = self.sheets.get_worksheet_hash(table_name)
-
-        last_db_hash = self._last_hashes.get(table_name, {}).get("db")
-        last_sheet_hash = self._last_hashes.get(table_name, {}).get("sheet")
+        current = self._current_hashes(table_name)
+        last = self._last_hashes.get(table_name)
 
         stats = {"inserted": 0, "updated": 0, "deleted": 0}
 
         # 최초 실행 시 해시만 저장하고 스킵 (거짓 변경 방지)
-        if last_db_hash is None or last_sheet_hash is None:
-            self._last_hashes[table_name] = {"db": db_hash, "sheet": sheet_hash}
+        if last is None:
+            self._last_hashes[table_name] = current
             print("    (초기화 - 해시 저장)")
             return stats
 
-        db_changed = db_hash != last_db_hash
-        sheet_changed = sheet_hash != last_sheet_hash
+        db_changed = current.db != last.db
+        sheet_changed = current.sheet != last.sheet
 
         if not db_changed and not sheet_changed:
             # 변경 없음
@@ -433,14 +457,18 @@ class SheetsSyncService:
                 table_name, sheet_records, db_rows, pk_column, db_columns
             )
 
-        # 해시 저장
-        self._last_hashes[table_name] = {
-            "db": self.db.get_table_hash(table_name),
-            "sheet": self.sheets.get_worksheet_hash(table_name),
-        }
+        # 해시 저장 (동기화 반영 후 상태로 한 번에 교체)
+        self._last_hashes[table_name] = self._current_hashes(table_name)
 
         return stats
 
+    def _current_hashes(self, table_name: str) -> TableHashes:
+        """DB/Sheet 현재 해시"""
+        return TableHashes(
+            db=self.db.get_table_hash(table_name),
+            sheet=self.sheets.get_worksheet_hash(table_name),
+        )
+
     def _sync_sheet_to_db(
         self,
         table_name: str,
@@ -453,8 +481,13 @@ class SheetsSyncService:
         stats = {"inserted": 0, "updated": 0, "deleted": 0}
 
         # DB의 현재 PK 목록
-        db_pks = {self._serialize_value(row[pk_column]) for row in db_rows}
+        db_pks = {self._pk_key(row[pk_column]) for row in db_rows}
         sheet_pks = set()
+        # 스키마는 테이블당 1회만 조회 (행마다 PRAGMA 호출 방지)
+        type_map = self._get_type_map(table_name)
+        # 테이블별 후처리 여부도 루프 밖에서 1회 결정
+        calc_subcatalog = table_name == "subcatalogs"
+        generate_titles = table_name in DISPLAY_TITLE_TABLES and self.title_generator is not None
 
         for record in sheet_records:
             # 빈 행 스킵
@@ -462,7 +495,7 @@ class SheetsSyncService:
                 continue
 
             # 타입 변환
-            typed_record = self._convert_types(record, table_name)
+            typed_record = self._convert_types(record, table_name, type_map)
             pk_value = typed_record.get(pk_column)
 
             # #35 - PK None 처리 개선: 경고 로깅
@@ -473,19 +506,20 @@ class SheetsSyncService:
                 continue
 
             # subcatalogs: full_path_name 자동 계산
-            if table_name == "subcatalogs":
+            if calc_subcatalog:
                 typed_record = self._auto_calculate_subcatalog_fields(typed_record)
 
             # display_title 자동 생성 (비어있으면)
-            if table_name in ["catalogs", "subcatalogs", "files", "hands"]:
+            if generate_titles:
                 typed_record = self._auto_generate_display_title(table_name, typed_record)
 
-            sheet_pks.add(str(pk_value))
+            pk_key = self._pk_key(pk_value)
+            sheet_pks.add(pk_key)
 
             # DB에 upsert
             self.db.upsert_record(table_name, typed_record, pk_column)
 
-            if str(pk_value) in db_pks:
+            if pk_key in db_pks:
                 stats["updated"] += 1
             else:
                 stats["inserted"] += 1
@@ -512,6 +546,11 @@ class SheetsSyncService:
         self.sheets.update_worksheet(table_name, columns, sheet_rows)
         return {"inserted": 0, "updated": len(rows), "deleted": 0}
 
+    @staticmethod
+    def _pk_key(value: Any) -> str:
+        """PK 비교 키 (DB의 int PK와 시트의 str PK를 같은 값으로 취급)"""
+        return str(value)
+
     def _serialize_value(self, value: Any) -> Any:
         """값을 시트 호환 형식으로 변환"""
         if value is None:
@@ -522,17 +561,26 @@ class SheetsSyncService:
             return value
         return str(value)
 
-    def _convert_types(self, record: Dict[str, Any], table_name: str) -> Dict[str, Any]:
-        """시트 데이터를 DB 타입으로 변환"""
-        schema = self.db.get_table_schema(table_name)
-        type_map = {col["name"]: col["type"] for col in schema}
+    def _get_type_map(self, table_name: str) -> Dict[str, str]:
+        """컬럼명 -> 타입(대문자) 매핑"""
+        return {col["name"]: col["type"].upper() for col in self.db.get_table_schema(table_name)}
+
+    def _convert_types(
+        self,
+        record: Dict[str, Any],
+        table_name: str,
+        type_map: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """시트 데이터를 DB 타입으로 변환 (type_map 미지정 시 스키마 조회)"""
+        if type_map is None:
+            type_map = self._get_type_map(table_name)
 
         converted = {}
         for key, value in record.items():
             if key not in type_map:
                 continue
 
-            col_type = type_map[key].upper()
+            col_type = type_map[key]
 
             if value == "" or value is None:
                 converted[key] = None
@@ -702,10 +750,7 @@ class SheetsSyncService:
 
         # 초기 해시 설정
         for table_name in self.config.tables_to_sync:
-            self._last_hashes[table_name] = {
-                "db": self.db.get_table_hash(table_name),
-                "sheet": self.sheets.get_worksheet_hash(table_name),
-            }
+            self._last_hashes[table_name] = self._current_hashes(table_name)
 
         try:
             while True:
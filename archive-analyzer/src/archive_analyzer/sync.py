@@ -13,6 +13,7 @@ archive.db 데이터를 pokervod.db로 동기화합니다.
 import logging
 import re
 import sqlite3
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -25,7 +26,13 @@ from .utils.path import generate_file_id, normalize_path
 logger = logging.getLogger(__name__)
 
 # HLS 스트리밍 호환 확장자 (트랜스코딩 없이 재생 가능)
-HLS_COMPATIBLE_EXTENSIONS = ("mp4", "mov", "ts", "m4v", "m2ts", "mts")
+HLS_COMPATIBLE_EXTENSIONS = frozenset(("mp4", "mov", "ts", "m4v", "m2ts", "mts"))
+
+# UPDATE ... FROM 지원 여부 (SQLite 3.33+, 미만이면 상관 서브쿼리로 대체)
+SQLITE_HAS_UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
+
+# 동기화 시 갱신하는 미디어 컬럼
+_SYNC_UPDATE_COLUMNS = ("size_bytes", "duration_sec", "resolution", "codec", "fps", "bitrate_kbps")
 
 
 @dataclass
@@ -66,6 +73,16 @@ _PATTERNS_FILE = Path(__file__).parent.parent.parent / "config" / "catalog_patte
 # 캐시된 패턴 (지연 로드)
 _patterns_cache: Optional[Dict[str, Any]] = None
 
+# 컴파일된 정규식 패턴 (최초 분류 시 1회 컴파일 후 재사용)
+# 다단계 패턴은 선행 리터럴 토큰("wsop/", "hcl/" 등)별로 묶어 둔다
+_compiled_multilevel: Optional[
+    Dict[Optional[str], List[Tuple[re.Pattern, str, Optional[str], int]]]
+] = None
+
+# 정규식 선행 리터럴 토큰 (예: 'WSOP/WSOP-BR' → 'WSOP')
+_LITERAL_HEAD_RE = re.compile(r"([A-Za-z0-9_-]+)/")
+_compiled_legacy: Optional[List[Tuple[re.Pattern, str, Optional[str]]]] = None
+
 
 def _load_patterns() -> Dict[str, Any]:
     """YAML 패턴 파일 로드 (#20)
@@ -106,11 +123,50 @@ def get_legacy_patterns() -> List[Tuple[str, str, Optional[str]]]:
     ]
 
 
+def _intern_ids(catalog: str, subcatalog: Optional[str]) -> Tuple[str, Optional[str]]:
+    """카탈로그/서브카탈로그 ID 문자열 intern (패턴 간 중복 ID를 객체 하나로)"""
+    return sys.intern(catalog), sys.intern(subcatalog) if subcatalog else subcatalog
+
+
+def _get_compiled_multilevel_patterns() -> Dict[
+    Optional[str], List[Tuple[re.Pattern, str, Optional[str], int]]
+]:
+    """다단계 패턴 (IGNORECASE 컴파일본, 선행 토큰별 그룹, 캐시)
+
+    키는 소문자 "토큰/" 문자열이며, 경로에 이 문자열이 없으면 그룹 전체를
+    건너뛸 수 있다. 선행 리터럴이 없는 패턴은 None 키로 항상 검사한다.
+    """
+    global _compiled_multilevel
+
+    if _compiled_multilevel is None:
+        groups: Dict[Optional[str], List[Tuple[re.Pattern, str, Optional[str], int]]] = {}
+        for regex, catalog, subcatalog, depth in get_multilevel_patterns():
+            head = _LITERAL_HEAD_RE.match(regex)
+            key = f"{head.group(1).lower()}/" if head else None
+            groups.setdefault(key, []).append(
+                (re.compile(regex, re.IGNORECASE), *_intern_ids(catalog, subcatalog), depth)
+            )
+        _compiled_multilevel = groups
+    return _compiled_multilevel
+
+
+def _get_compiled_legacy_patterns() -> List[Tuple[re.Pattern, str, Optional[str]]]:
+    """레거시 패턴 (IGNORECASE 컴파일본, 캐시)"""
+    global _compiled_legacy
+
+    if _compiled_legacy is None:
+        _compiled_legacy = [
+            (re.compile(regex, re.IGNORECASE), *_intern_ids(catalog, subcatalog))
+            for regex, catalog, subcatalog in get_legacy_patterns()
+        ]
+    return _compiled_legacy
+
+
 def classify_path(path: str) -> Tuple[str, Optional[str]]:
     """경로에서 카테고리/서브카테고리 추출 (레거시 호환)"""
     normalized = normalize_path(path)  # #21 - 유틸 사용
-    for pattern, catalog, subcatalog in get_legacy_patterns():  # #20 - YAML 로드
-        if re.search(pattern, normalized, re.IGNORECASE):
+    for pattern, catalog, subcatalog in _get_compiled_legacy_patterns():  # #20 - YAML 로드
+        if pattern.search(normalized):
             return catalog, subcatalog
     return "OTHER", None
 
@@ -126,9 +182,9 @@ class SubcatalogMatch:
 
     @property
     def full_subcatalog_id(self) -> Optional[str]:
-        """연도가 포함된 전체 서브카탈로그 ID"""
+        """연도가 포함된 전체 서브카탈로그 ID (같은 ID는 같은 객체로 intern)"""
         if self.subcatalog_id and self.year and "{year}" in self.subcatalog_id:
-            return self.subcatalog_id.replace("{year}", self.year)
+            return sys.intern(self.subcatalog_id.replace("{year}", self.year))
         return self.subcatalog_id
 
 
@@ -144,19 +200,24 @@ def classify_path_multilevel(path: str) -> SubcatalogMatch:
         SubcatalogMatch 객체 (catalog_id, subcatalog_id, depth, year)
     """
     normalized = normalize_path(path)  # #21 - 유틸 사용
+    lowered = normalized.lower()
 
     best_match = None
     best_match_length = 0
     best_result = None
 
-    for pattern, catalog, subcatalog_template, depth in get_multilevel_patterns():  # #20
-        match = re.search(pattern, normalized, re.IGNORECASE)
-        if match:
-            match_length = len(match.group(0))
-            if match_length > best_match_length:
-                best_match_length = match_length
-                best_match = match
-                best_result = (catalog, subcatalog_template, depth)
+    for head, patterns in _get_compiled_multilevel_patterns().items():  # #20
+        # 선행 토큰이 경로에 없으면 해당 그룹의 정규식은 매칭될 수 없음
+        if head is not None and head not in lowered:
+            continue
+        for pattern, catalog, subcatalog_template, depth in patterns:
+            match = pattern.search(normalized)
+            if match:
+                match_length = len(match.group(0))
+                if match_length > best_match_length:
+                    best_match_length = match_length
+                    best_match = match
+                    best_result = (catalog, subcatalog_template, depth)
 
     if best_match and best_result:
         catalog, subcatalog_template, depth = best_result
@@ -182,10 +243,22 @@ def local_to_nas(local_path: str, config: SyncConfig) -> str:
 
 
 def format_resolution(width: Optional[int], height: Optional[int]) -> Optional[str]:
-    """해상도 문자열 생성"""
-    if width and height:
-        return f"{width}x{height}"
-    return None
+    """해상도 문자열 생성 (한쪽이라도 없으면 포맷하지 않고 None)"""
+    return f"{width}x{height}" if width and height else None
+
+
+def _is_sqlite_uri(db: str) -> bool:
+    """SQLite URI 여부 (file:...?mode=memory&cache=shared 등)"""
+    return db.startswith("file:")
+
+
+def _connect(db: str) -> sqlite3.Connection:
+    """SQLite 연결 (일반 경로와 file: URI 모두 지원)
+
+    uri=True여도 "file:"로 시작하지 않는 경로는 일반 파일명으로 처리되며,
+    이 연결에서 ATTACH하는 DB 경로에도 같은 규칙이 적용된다.
+    """
+    return sqlite3.connect(db, uri=True)
 
 
 class SyncService:
@@ -199,7 +272,7 @@ class SyncService:
     def _ensure_indexes(self) -> None:
         """pokervod.db 인덱스 생성 (#40 - nas_path 인덱스 추가)"""
         try:
-            conn = sqlite3.connect(self.config.pokervod_db)
+            conn = _connect(self.config.pokervod_db)
             cursor = conn.cursor()
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_files_nas_path ON files(nas_path)")
             conn.commit()
@@ -209,13 +282,13 @@ class SyncService:
             logger.warning(f"인덱스 생성 실패: {e}")
 
     def _validate_paths(self) -> None:
-        """DB 경로 유효성 검증"""
+        """DB 경로 유효성 검증 (file: URI는 SQLite가 직접 해석하므로 제외)"""
         archive_path = Path(self.config.archive_db)
-        if not archive_path.exists():
+        if not _is_sqlite_uri(self.config.archive_db) and not archive_path.exists():
             raise FileNotFoundError(f"archive.db를 찾을 수 없습니다: {archive_path}")
 
         pokervod_path = Path(self.config.pokervod_db)
-        if not pokervod_path.exists():
+        if not _is_sqlite_uri(self.config.pokervod_db) and not pokervod_path.exists():
             raise FileNotFoundError(f"pokervod.db를 찾을 수 없습니다: {pokervod_path}")
 
     def sync_files(self, dry_run: bool = False) -> SyncResult:
@@ -223,167 +296,206 @@ class SyncService:
 
         archive.db의 files + media_info를 pokervod.db의 files로 동기화
 
+        pokervod.db를 ATTACH해 UPDATE/INSERT를 SQLite 안에서 일괄 실행한다
+        (행 단위로 Python을 거치지 않음). SQLite 3.33 미만에서는 UPDATE ... FROM
+        대신 상관 서브쿼리로 갱신한다.
+
         Args:
             dry_run: True면 실제 쓰기 없이 시뮬레이션
 
         Returns:
             SyncResult 객체
         """
-        result = SyncResult()
-
-        # 소스 DB 연결
-        src_conn = sqlite3.connect(self.config.archive_db)
-        src_conn.row_factory = sqlite3.Row
+        if dry_run:
+            return self._count_pending_files()
 
-        # 대상 DB 연결
-        dst_conn = sqlite3.connect(self.config.pokervod_db)
-        dst_conn.row_factory = sqlite3.Row
+        source_sql, source_params = self._source_rows_sql()
+        now = datetime.now().isoformat()
 
+        conn = self._connect_attached()
         try:
-            # archive.db에서 비디오 파일 조회 (media_info 조인)
-            src_cursor = src_conn.cursor()
+            # 대상 행을 임시 테이블로 1회 구체화 (UPDATE/INSERT 공용)
+            conn.execute(f"CREATE TEMP TABLE sync_src AS {source_sql}", source_params)
+            total = conn.execute("SELECT COUNT(*) FROM temp.sync_src").fetchone()[0]
+            logger.info(f"동기화 대상 파일: {total}개")
+
+            # 같은 NAS 경로가 여러 번 나오면 마지막 행 값을 사용
+            latest = """
+                SELECT * FROM temp.sync_src
+                WHERE rowid IN (SELECT MAX(rowid) FROM temp.sync_src GROUP BY nas_path)
+            """
 
-            # HLS 필터링 조건 생성
-            if self.config.hls_only:
-                # HLS 호환 확장자만 필터링
-                ext_conditions = " OR ".join(
-                    f"LOWER(f.path) LIKE '%.{ext}'" for ext in HLS_COMPATIBLE_EXTENSIONS
-                )
-                hls_filter = f"AND ({ext_conditions})"
-                logger.info(f"HLS 호환 파일만 동기화: {HLS_COMPATIBLE_EXTENSIONS}")
-            else:
-                hls_filter = ""
+            # 기존 레코드 업데이트
+            self._update_existing(conn, latest, now)
 
-            src_cursor.execute(
+            # 신규 레코드 삽입 (ID 충돌 행은 건너뜀)
+            new_paths = conn.execute(
+                """
+                SELECT COUNT(DISTINCT nas_path) FROM temp.sync_src s
+                WHERE NOT EXISTS (SELECT 1 FROM pv.files p WHERE p.nas_path = s.nas_path)
+            """
+            ).fetchone()[0]
+            cursor = conn.execute(
                 f"""
+                INSERT OR IGNORE INTO pv.files (
+                    id, nas_path, filename, size_bytes,
+                    duration_sec, resolution, codec, fps, bitrate_kbps,
+                    analysis_status, created_at, updated_at
+                )
                 SELECT
-                    f.path,
-                    f.filename,
-                    f.size_bytes,
-                    m.video_codec as codec,
-                    m.width,
-                    m.height,
-                    m.duration_seconds,
-                    m.framerate as fps,
-                    m.bitrate as bitrate_kbps
-                FROM files f
-                LEFT JOIN media_info m ON f.id = m.file_id
-                WHERE f.file_type = 'video'
-                {hls_filter}
-            """
+                    gen_file_id(s.nas_path), s.nas_path, s.filename, s.size_bytes,
+                    s.duration_sec, s.resolution, s.codec, s.fps, s.bitrate_kbps,
+                    ?, ?, ?
+                FROM ({latest}) AS s
+                WHERE NOT EXISTS (SELECT 1 FROM pv.files p WHERE p.nas_path = s.nas_path)
+            """,
+                (self.config.default_analysis_status, now, now),
             )
 
-            files = src_cursor.fetchall()
-            logger.info(f"동기화 대상 파일: {len(files)}개")
-
-            dst_cursor = dst_conn.cursor()
-
-            for file_row in files:
-                try:
-                    # NAS 경로 변환
-                    nas_path = local_to_nas(file_row["path"], self.config)
-                    file_id = generate_file_id(nas_path)
-
-                    # 해상도 문자열
-                    resolution = format_resolution(file_row["width"], file_row["height"])
-
-                    # 기존 레코드 확인
-                    dst_cursor.execute(
-                        "SELECT id, updated_at FROM files WHERE nas_path = ?", (nas_path,)
-                    )
-                    existing = dst_cursor.fetchone()
-
-                    if existing:
-                        # 업데이트
-                        if not dry_run:
-                            dst_cursor.execute(
-                                """
-                                UPDATE files SET
-                                    size_bytes = ?,
-                                    duration_sec = ?,
-                                    resolution = ?,
-                                    codec = ?,
-                                    fps = ?,
-                                    bitrate_kbps = ?,
-                                    updated_at = ?
-                                WHERE nas_path = ?
-                            """,
-                                (
-                                    file_row["size_bytes"],
-                                    file_row["duration_seconds"],
-                                    resolution,
-                                    file_row["codec"],
-                                    file_row["fps"],
-                                    file_row["bitrate_kbps"],
-                                    datetime.now().isoformat(),
-                                    nas_path,
-                                ),
-                            )
-                        result.updated += 1
-                    else:
-                        # 새로 삽입
-                        if not dry_run:
-                            dst_cursor.execute(
-                                """
-                                INSERT INTO files (
-                                    id, nas_path, filename, size_bytes,
-                                    duration_sec, resolution, codec, fps, bitrate_kbps,
-                                    analysis_status, created_at, updated_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                                (
-                                    file_id,
-                                    nas_path,
-                                    file_row["filename"],
-                                    file_row["size_bytes"],
-                                    file_row["duration_seconds"],
-                                    resolution,
-                                    file_row["codec"],
-                                    file_row["fps"],
-                                    file_row["bitrate_kbps"],
-                                    self.config.default_analysis_status,
-                                    datetime.now().isoformat(),
-                                    datetime.now().isoformat(),
-                                ),
-                            )
-                        result.inserted += 1
-
-                except Exception as e:
-                    result.errors.append(f"{file_row['path']}: {str(e)}")
-                    logger.error(f"동기화 오류: {file_row['path']} - {e}")
+            result = SyncResult(
+                inserted=cursor.rowcount,
+                updated=total - new_paths,
+                skipped=new_paths - cursor.rowcount,
+            )
 
-            # 트랜잭션 커밋 (#33 - 롤백 로직 추가)
-            if not dry_run:
-                if (
-                    len(result.errors) > 0
-                    and len(result.errors) > (result.inserted + result.updated) * 0.5
-                ):
-                    # 에러가 50% 이상이면 롤백
-                    logger.warning(f"에러율 높음 ({len(result.errors)}건), 롤백 실행")
-                    dst_conn.rollback()
-                    result.inserted = 0
-                    result.updated = 0
-                else:
-                    dst_conn.commit()
+            # 트랜잭션 커밋 (#33 - 실패 시 전체 롤백)
+            conn.commit()
 
             logger.info(
                 f"동기화 완료: 삽입 {result.inserted}, "
-                f"업데이트 {result.updated}, 오류 {len(result.errors)}"
+                f"업데이트 {result.updated}, 건너뜀 {result.skipped}"
             )
 
         except Exception as e:
             # 예상치 못한 오류 시 롤백
             logger.exception(f"동기화 중 치명적 오류 발생: {e}")
             try:
-                dst_conn.rollback()
+                conn.rollback()
             except Exception:
                 pass
             raise
 
         finally:
-            src_conn.close()
-            dst_conn.close()
+            conn.close()
+
+        return result
+
+    def _update_existing(self, conn: sqlite3.Connection, latest: str, now: str) -> None:
+        """pv.files 중 NAS 경로가 일치하는 기존 레코드를 최신 원본 값으로 갱신"""
+        if SQLITE_HAS_UPDATE_FROM:
+            assignments = ", ".join(f"{col} = s.{col}" for col in _SYNC_UPDATE_COLUMNS)
+            conn.execute(
+                f"""
+                UPDATE pv.files AS t SET {assignments}, updated_at = ?
+                FROM ({latest}) AS s
+                WHERE t.nas_path = s.nas_path
+            """,
+                (now,),
+            )
+            return
+
+        # 3.33 미만: 최신 행을 nas_path 인덱스가 있는 임시 테이블로 만든 뒤 컬럼별 서브쿼리
+        conn.execute(f"CREATE TEMP TABLE sync_latest AS {latest}")
+        conn.execute("CREATE UNIQUE INDEX temp.idx_sync_latest ON sync_latest(nas_path)")
+        assignments = ", ".join(
+            f"{col} = (SELECT s.{col} FROM temp.sync_latest s WHERE s.nas_path = files.nas_path)"
+            for col in _SYNC_UPDATE_COLUMNS
+        )
+        conn.execute(
+            f"""
+            UPDATE pv.files SET {assignments}, updated_at = ?
+            WHERE nas_path IN (SELECT nas_path FROM temp.sync_latest)
+        """,
+            (now,),
+        )
+
+    def _connect_attached(self) -> sqlite3.Connection:
+        """archive.db 연결에 pokervod.db를 pv로 ATTACH (SQL 함수 등록 포함)
+
+        Python 헬퍼를 결정적(deterministic) SQL 함수로 등록해 변환 규칙을
+        한 곳에서만 관리한다.
+        """
+        config = self.config
+        conn = _connect(config.archive_db)
+        try:
+            conn.create_function("gen_file_id", 1, generate_file_id, deterministic=True)
+            conn.create_function(
+                "local_to_nas", 1, lambda path: local_to_nas(path, config), deterministic=True
+            )
+            conn.create_function("fmt_res", 2, format_resolution, deterministic=True)
+            conn.execute("ATTACH DATABASE ? AS pv", (config.pokervod_db,))
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _source_rows_sql(self) -> Tuple[str, Tuple[str, ...]]:
+        """동기화 대상 행 SELECT 문과 바인딩 파라미터
+
+        컬럼: nas_path, filename, size_bytes, duration_sec, resolution,
+        codec, fps, bitrate_kbps (pokervod.db files 컬럼명 기준)
+        """
+        params: Tuple[str, ...] = ()
+        hls_filter = ""
+        if self.config.hls_only:
+            # frozenset 순회 순서는 실행마다 다르므로 정렬 (SQL 문자열 고정)
+            hls_exts = sorted(HLS_COMPATIBLE_EXTENSIONS)
+            # 스캐너가 extension을 소문자 ".ext"로 저장 → idx_files_extension 사용 가능
+            placeholders = ", ".join("?" * len(hls_exts))
+            hls_filter = f"AND f.extension IN ({placeholders})"
+            params += tuple(f".{ext}" for ext in hls_exts)
+            logger.info(f"HLS 호환 파일만 동기화: {hls_exts}")
+
+        # local_to_nas / fmt_res는 _connect_attached()에서 등록한 SQL 함수
+        sql = f"""
+            SELECT
+                local_to_nas(f.path) AS nas_path,
+                f.filename,
+                f.size_bytes,
+                m.duration_seconds AS duration_sec,
+                fmt_res(m.width, m.height) AS resolution,
+                m.video_codec AS codec,
+                m.framerate AS fps,
+                m.bitrate AS bitrate_kbps
+            FROM main.files f
+            LEFT JOIN main.media_info m ON f.id = m.file_id
+            WHERE f.file_type = 'video'
+            {hls_filter}
+        """
+        return sql, params
+
+    def _count_pending_files(self) -> SyncResult:
+        """dry-run: 삽입/업데이트 예정 건수를 SQL 집계로 계산
+
+        pokervod.db를 ATTACH해 archive.db와 한 쿼리로 비교하므로
+        행을 Python으로 가져오지 않는다. 같은 NAS 경로가 여러 번 나오면
+        한 번만 삽입, 나머지는 업데이트로 센다 (sync_files와 동일).
+        """
+        source_sql, source_params = self._source_rows_sql()
+
+        conn = self._connect_attached()
+        try:
+            row = conn.execute(
+                f"""
+                WITH src AS ({source_sql})
+                SELECT
+                    COUNT(*),
+                    COUNT(DISTINCT CASE
+                        WHEN NOT EXISTS (
+                            SELECT 1 FROM pv.files p WHERE p.nas_path = src.nas_path
+                        ) THEN src.nas_path
+                    END)
+                FROM src
+            """,
+                source_params,
+            ).fetchone()
+        finally:
+            conn.close()
 
+        total, new_paths = row
+        result = SyncResult(inserted=new_paths, updated=total - new_paths)
+        logger.info(f"동기화 대상 파일: {total}개")
+        logger.info(f"[dry-run] 삽입 예정 {result.inserted}, 업데이트 예정 {result.updated}")
         return result
 
     def sync_catalogs(self, dry_run: bool = False) -> SyncResult:
@@ -399,10 +511,10 @@ class SyncService:
         """
         result = SyncResult()
 
-        src_conn = sqlite3.connect(self.config.archive_db)
+        src_conn = _connect(self.config.archive_db)
         src_conn.row_factory = sqlite3.Row
 
-        dst_conn = sqlite3.connect(self.config.pokervod_db)
+        dst_conn = _connect(self.config.pokervod_db)
         dst_conn.row_factory = sqlite3.Row
 
         try:
@@ -415,12 +527,11 @@ class SyncService:
 
             for row in src_cursor.fetchall():
                 match = classify_path_multilevel(row["path"])
-                if match.catalog_id not in catalogs_found:
-                    catalogs_found[match.catalog_id] = {}
+                subcatalogs = catalogs_found.setdefault(match.catalog_id, {})
 
                 subcatalog_id = match.full_subcatalog_id
-                if subcatalog_id and subcatalog_id not in catalogs_found[match.catalog_id]:
-                    catalogs_found[match.catalog_id][subcatalog_id] = match
+                if subcatalog_id:
+                    subcatalogs.setdefault(subcatalog_id, match)
 
             dst_cursor = dst_conn.cursor()
 
@@ -576,7 +687,7 @@ class SyncService:
         stats = {}
 
         # archive.db 통계
-        src_conn = sqlite3.connect(self.config.archive_db)
+        src_conn = _connect(self.config.archive_db)
         src_cursor = src_conn.cursor()
 
         src_cursor.execute("SELECT COUNT(*) FROM files WHERE file_type = 'video'")
@@ -588,7 +699,7 @@ class SyncService:
         src_conn.close()
 
         # pokervod.db 통계
-        dst_conn = sqlite3.connect(self.config.pokervod_db)
+        dst_conn = _connect(self.config.pokervod_db)
         dst_cursor = dst_conn.cursor()
 
         dst_cursor.execute("SELECT COUNT(*) FROM files")
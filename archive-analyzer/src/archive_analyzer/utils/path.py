@@ -58,6 +58,10 @@ def generate_file_id(nas_path: str) -> str:
     동일한 파일에 대해 항상 같은 ID가 생성됩니다.
     경로는 정규화 후 해싱됩니다.
 
+    ID는 pokervod.db files.id에 영구 저장되는 키이므로 해시 알고리즘을
+    바꾸면 기존 레코드와 ID가 달라집니다 (마이그레이션 필요).
+    보안 용도가 아니므로 usedforsecurity=False (FIPS 환경 호환).
+
     Args:
         nas_path: NAS 파일 경로
 
@@ -66,10 +70,10 @@ def generate_file_id(nas_path: str) -> str:
 
     Examples:
         >>> generate_file_id("//10.10.100.122/docker/GGPNAs/ARCHIVE/test.mp4")
-        'a1b2c3d4e5f6g7h8'
+        '31302c9ba6e7fbb7'
     """
     normalized = normalize_nas_path(nas_path, remove_prefix=False)
-    return hashlib.md5(normalized.encode()).hexdigest()[:16]
+    return hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()[:16]
 
 
 def extract_relative_path(full_path: str, base_marker: str = "ARCHIVE") -> str:
@@ -5,7 +5,7 @@ Issue #43: Docker 서버 배포 + GUI 모니터링
 FastAPI 기반 웹 대시보드:
 - 실시간 동기화 상태
 - 파일 변경 이력 조회
-- 로그 스트리밍 (WebSocket)
+- 로그 스트리밍 (SSE / WebSocket)
 - 수동 동기화/정합성 검증 트리거
 
 Usage:
@@ -13,22 +13,39 @@ Usage:
 """
 
 import asyncio
+import functools
+import gzip
+import hashlib
+import itertools
+import json
 import logging
 import os
+import random
+import re
 import sqlite3
-from collections import deque
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
-from fastapi import BackgroundTasks, FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from starlette.requests import Request
 
+# orjson (optional - 없으면 표준 json 인코더 사용)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -56,6 +73,8 @@ class WebConfig:
             self.sync_interval = int(interval)
         if port := os.environ.get("WEB_PORT"):
             self.port = int(port)
+        if buffer_size := os.environ.get("LOG_BUFFER_SIZE"):
+            self.log_buffer_size = int(buffer_size)
 
 
 # =============================================================================
@@ -69,11 +88,19 @@ class ServiceState:
 
     is_running: bool = False
     last_sync_time: Optional[datetime] = None
+    last_sync_time_iso: Optional[str] = None  # last_sync_time.isoformat() (기록 시 1회 변환)
     last_sync_result: Optional[Dict[str, Any]] = None
     sync_in_progress: bool = False
     error_message: Optional[str] = None
     log_buffer: Deque[str] = field(default_factory=lambda: deque(maxlen=1000))
-    connected_clients: List[WebSocket] = field(default_factory=list)
+    log_seq: int = 0  # 지금까지 적재된 로그 줄 수 (SSE 이벤트 id)
+    connected_clients: Set[WebSocket] = field(default_factory=set)
+    # /api/logs/stream 구독자 큐 (None은 구독 해제 표시)
+    log_streams: Set["asyncio.Queue[Optional[str]]"] = field(default_factory=set)
+    dashboard_subscribers: Set[WebSocket] = field(default_factory=set)  # /ws/dashboard
+    loop: Optional[asyncio.AbstractEventLoop] = None  # 워커 스레드 → 이벤트 루프 푸시용
+    sync_executor: Optional[ThreadPoolExecutor] = None  # 동기화 전용 워커 (1개)
+    sync_future: Optional[Future] = None  # 마지막으로 제출된 동기화/정합성 작업
     config: WebConfig = field(default_factory=WebConfig)
 
 
@@ -85,144 +112,569 @@ state = ServiceState()
 # =============================================================================
 
 
+# 라이브 로그 브로드캐스트 묶음 간격 (초) / 한 프레임 최대 줄 수
+LOG_COALESCE_SECONDS = 0.05
+LOG_BATCH_MAX_LINES = 128
+
+# SSE 연결 유지용 주석 전송 간격 (초, 프록시 유휴 타임아웃 방지)
+SSE_KEEPALIVE_SECONDS = 15
+
+# SSE 구독자별 미전송 이벤트 상한 (초과 시 구독 해제, 클라이언트는 Last-Event-ID로 재개)
+SSE_QUEUE_MAX_EVENTS = 256
+
+
 class WebSocketLogHandler(logging.Handler):
-    """WebSocket으로 로그 스트리밍"""
+    """WebSocket으로 로그 스트리밍
+
+    emit()은 호출 스레드(동기화 루프 등)에서 실행되므로 포맷팅을 하지 않고
+    (ts, level, msg) 튜플만 큐에 넣는다. 포맷팅/버퍼 적재/브로드캐스트는
+    이벤트 루프의 펌프 태스크에서 레코드당 1회 수행한다.
+    """
 
     def __init__(self, state: ServiceState):
         super().__init__()
         self.state = state
-        self.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
-        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[tuple]"] = None
+        self._pump_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """펌프 태스크 시작 (이벤트 루프 안에서 호출)"""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._pump_task = self._loop.create_task(self._pump())
+
+    async def stop(self):
+        """펌프 태스크 종료"""
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            try:
+                await self._pump_task
+            except asyncio.CancelledError:
+                pass
+            # 아직 펌프가 꺼내지 않은 레코드도 버퍼에 남김
+            while not self._queue.empty():
+                self._store([self._format_payload(*self._queue.get_nowait())])
+        self._pump_task = None
+        self._loop = None
 
     def emit(self, record: logging.LogRecord):
         try:
-            msg = self.format(record)
-            self.state.log_buffer.append(msg)
-            # WebSocket 클라이언트에 브로드캐스트
-            asyncio.create_task(self._broadcast(msg))
+            payload = (record.created, record.levelname, record.getMessage())
+            if self._loop is None or self._queue is None:
+                # 펌프 미기동 시 버퍼에만 적재
+                self._store([self._format_payload(*payload)])
+                return
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, payload)
         except Exception:
             pass
 
-    async def _broadcast(self, message: str):
-        disconnected = []
-        for client in self.state.connected_clients:
+    @staticmethod
+    def _format_payload(ts: float, level: str, msg: str) -> str:
+        return f"{datetime.fromtimestamp(ts).isoformat(timespec='seconds')} [{level}] {msg}"
+
+    def _store(self, lines: List[str]):
+        """버퍼 적재 및 줄 번호(log_seq) 증가"""
+        self.state.log_buffer.extend(lines)
+        self.state.log_seq += len(lines)
+
+    async def _pump(self):
+        """큐에서 레코드를 꺼내 포맷 후 버퍼 적재 및 브로드캐스트
+
+        짧은 구간(LOG_COALESCE_SECONDS)에 몰린 레코드는 최대 LOG_BATCH_MAX_LINES줄씩
+        {"type": "log", "data": [...]} 한 프레임으로 묶어 전송한다.
+        """
+        while True:
+            batch = [await self._queue.get()]
             try:
-                await client.send_text(message)
-            except Exception:
-                disconnected.append(client)
-        for client in disconnected:
-            self.state.connected_clients.remove(client)
+                await asyncio.sleep(LOG_COALESCE_SECONDS)
+            finally:
+                # 종료(취소) 시에도 받은 레코드는 버퍼에 남김
+                while len(batch) < LOG_BATCH_MAX_LINES and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                lines = [self._format_payload(*payload) for payload in batch]
+                self._store(lines)
+            if self.state.connected_clients or self.state.log_streams:
+                message = _dumps({"type": "log", "data": lines}).decode("utf-8")
+                _publish_sse(self.state.log_streams, _sse_event(message, self.state.log_seq))
+                if self.state.connected_clients:
+                    await self._broadcast(message)
+
+    async def _broadcast(self, message: str):
+        await _send_all(self.state.connected_clients, message)
+
+
+def _sse_event(message: str, event_id: Optional[int] = None) -> str:
+    """SSE 이벤트 직렬화 (message는 한 줄 JSON)"""
+    if event_id is None:
+        return f"data: {message}\n\n"
+    return f"id: {event_id}\ndata: {message}\n\n"
+
+
+def _publish_sse(streams: Set["asyncio.Queue[Optional[str]]"], event: str):
+    """SSE 구독자 큐에 이벤트 적재 (전송은 각 응답 제너레이터가 수행)
+
+    큐가 가득 찬(멈춘) 구독자는 집합에서 제거하고 대기 이벤트를 비운 뒤
+    종료 표시(None)를 넣어 응답을 끝낸다. 브라우저는 Last-Event-ID로 재연결한다.
+    """
+    for queue in list(streams):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            streams.discard(queue)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+
+def _log_backlog(last_event_id: Optional[str]) -> List[str]:
+    """SSE 재연결 시 Last-Event-ID 이후의 로그 줄 (없거나 서버 재시작이면 버퍼 전체)"""
+    buffer = state.log_buffer
+    try:
+        missing = state.log_seq - int(last_event_id)
+    except (TypeError, ValueError):
+        missing = len(buffer)
+    if missing < 0:
+        # 서버 재시작으로 줄 번호가 초기화된 경우
+        missing = len(buffer)
+    lines = list(itertools.islice(reversed(buffer), min(missing, len(buffer))))
+    lines.reverse()
+    return lines
+
+
+async def _send_all(clients: Set[WebSocket], message: str):
+    """WebSocket 클라이언트 집합에 병렬 전송, 실패한 클라이언트는 집합에서 제거"""
+    # 느린 클라이언트가 다른 클라이언트 전송을 지연시키지 않도록 병렬 전송
+    targets = list(clients)
+    results = await asyncio.gather(
+        *(client.send_text(message) for client in targets),
+        return_exceptions=True,
+    )
+    for client, result in zip(targets, results):
+        if isinstance(result, Exception):
+            clients.discard(client)
 
 
 # =============================================================================
 # Database Helpers
 # =============================================================================
 
+# 읽기 전용 연결 PRAGMA (journal_mode는 DB 파일에 영구 반영되므로 writer에서만 설정)
+_READ_PRAGMAS = (
+    "cache_size=-20000",
+    "temp_store=memory",
+    "mmap_size=268435456",
+)
+
+
+def _ro_uri(db_path: str) -> str:
+    """읽기 전용 SQLite URI (file:///...?mode=ro)"""
+    return f"{Path(db_path).resolve().as_uri()}?mode=ro"
+
+
+def _open(db_path: str, readonly: bool = True) -> sqlite3.Connection:
+    """PRAGMA가 적용된 SQLite 연결 생성
+
+    Args:
+        db_path: DB 파일 경로
+        readonly: True면 mode=ro + query_only 연결 (조회 엔드포인트용)
+    """
+    if readonly:
+        # 풀 연결 재사용 시 컴파일된 구문을 유지하도록 구문 캐시 확대, 조회 전용이므로 autocommit
+        conn = sqlite3.connect(
+            _ro_uri(db_path),
+            uri=True,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None,
+        )
+        for pragma in _READ_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        conn.execute("PRAGMA query_only=1")
+    else:
+        # journal_mode는 DB 파일에 영구 기록되어 nas_auto_sync와 공유되므로 변경하지 않음
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        for pragma in _READ_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+
+def _attach_readonly(conn: sqlite3.Connection, db_path: str, alias: str):
+    """다른 DB를 읽기 전용으로 ATTACH"""
+    conn.execute(f"ATTACH DATABASE ? AS {alias}", (_ro_uri(db_path),))
+
+
+# 스레드별 읽기 전용 연결 풀: (db_path, attach 대상) -> Connection
+_POOL = threading.local()
+_pool_registry: List[sqlite3.Connection] = []
+_pool_lock = threading.Lock()
+# close_pool() 호출마다 증가, 스레드별 풀이 이전 세대면 (닫힌 연결이므로) 버림
+_pool_generation = 0
+
+
+def _get_conn(db_path: str, attach_pv: Optional[str] = None) -> sqlite3.Connection:
+    """현재 스레드의 재사용 읽기 연결 반환 (없으면 생성)
+
+    Args:
+        db_path: main DB 경로
+        attach_pv: 지정 시 해당 DB를 pv 별칭으로 ATTACH한 연결
+    """
+    conns = getattr(_POOL, "conns", None)
+    if conns is None or getattr(_POOL, "generation", None) != _pool_generation:
+        conns = _POOL.conns = {}
+        _POOL.generation = _pool_generation
+
+    key = (db_path, attach_pv)
+    conn = conns.get(key)
+    if conn is None:
+        conn = _open(db_path)
+        if attach_pv:
+            _attach_readonly(conn, attach_pv, "pv")
+        conns[key] = conn
+        with _pool_lock:
+            _pool_registry.append(conn)
+    return conn
+
+
+def close_pool():
+    """모든 스레드의 풀 연결 종료 (앱 종료 시)
+
+    다른 스레드의 thread-local 캐시는 여기서 비울 수 없으므로 세대를 올려
+    각 스레드가 다음 _get_conn()에서 새 연결을 만들게 한다.
+    """
+    global _pool_generation
+    with _pool_lock:
+        _pool_generation += 1
+        for conn in _pool_registry:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _pool_registry.clear()
+    _POOL.conns = {}
+
+
+# 캐시 항목 최대 유지 시간 (mtime 변화를 놓치는 경우 대비)
+CACHE_TTL_SECONDS = 60
+
+# 함수별 캐시 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+CACHE_MAX_ENTRIES = 128
+
+# _ttl_cache로 등록된 함수 목록 (invalidate_caches()에서 일괄 초기화)
+_cached_functions: List[Any] = []
+
+# db_path -> file_history 테이블 존재 여부 (최초 확인 후 재사용)
+_history_table_exists: Dict[str, bool] = {}
+
+
+def _db_signature(*db_paths: str) -> Optional[Tuple[int, ...]]:
+    """DB 파일(+ WAL) mtime_ns 시그니처. 파일이 없으면 None"""
+    sig = []
+    for db_path in db_paths:
+        try:
+            sig.append(os.stat(db_path).st_mtime_ns)
+        except OSError:
+            return None
+        try:
+            # 빈 WAL(읽기 전용 연결이 생성)은 변경으로 보지 않음
+            wal = os.stat(f"{db_path}-wal")
+            sig.append(wal.st_mtime_ns if wal.st_size else 0)
+        except OSError:
+            sig.append(0)
+    return tuple(sig)
+
+
+def _ttl_cache(seconds: float, db_args: int = 1, maxsize: int = CACHE_MAX_ENTRIES):
+    """DB mtime + TTL 기반 메모이제이션 데코레이터
+
+    앞쪽 db_args개 위치 인자를 DB 경로로 보고, 해당 파일(+ WAL)의 mtime이
+    그대로이고 TTL 이내면 캐시된 결과를 반환한다. 에러 결과는 캐시하지 않는다.
+    반환값은 호출자 간 공유되므로 수정하지 않는다.
+    만료/무효 항목은 조회 시 제거하고, maxsize 초과 시 LRU 순으로 제거한다.
 
+    동일 키에 대한 동시 미스는 키별 락으로 직렬화하여 한 스레드만 쿼리를
+    실행하고 나머지는 그 결과를 재사용한다.
+    """
+
+    def decorator(fn):
+        cache: "OrderedDict[Tuple, Tuple[Tuple[int, ...], float, Any]]" = OrderedDict()
+        inflight: Dict[Tuple, threading.Lock] = {}
+        # cache / inflight 공용 락
+        lock = threading.Lock()
+
+        def lookup(key: Tuple, sig: Tuple[int, ...]):
+            with lock:
+                hit = cache.get(key)
+                if hit is None:
+                    return None
+                if hit[0] == sig and time.monotonic() < hit[1]:
+                    cache.move_to_end(key)
+                    return hit
+                # DB 변경 또는 TTL 만료 → 즉시 제거
+                del cache[key]
+                return None
+
+        def store(key: Tuple, entry: Tuple[Tuple[int, ...], float, Any]):
+            with lock:
+                cache[key] = entry
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            sig = _db_signature(*args[:db_args])
+            if sig is None:
+                return fn(*args, **kwargs)
+
+            key = args + tuple(sorted(kwargs.items()))
+            hit = lookup(key, sig)
+            if hit is not None:
+                return hit[2]
+
+            with lock:
+                key_lock = inflight.setdefault(key, threading.Lock())
+            with key_lock:
+                try:
+                    # 대기 중 다른 스레드가 채웠으면 재사용
+                    hit = lookup(key, sig)
+                    if hit is not None:
+                        return hit[2]
+                    result = fn(*args, **kwargs)
+                    if not (isinstance(result, dict) and "error" in result):
+                        store(key, (sig, time.monotonic() + seconds, result))
+                    return result
+                finally:
+                    # 대기 중인 스레드는 이미 락을 잡고 있으므로 키 항목만 정리
+                    # (그사이 새로 등록된 락은 건드리지 않음)
+                    with lock:
+                        if inflight.get(key) is key_lock:
+                            del inflight[key]
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                inflight.clear()
+
+        wrapper.cache_clear = cache_clear
+        wrapper._inflight = inflight
+        _cached_functions.append(wrapper)
+        return wrapper
+
+    return decorator
+
+
+def invalidate_caches():
+    """조회 캐시 전체 무효화 (동기화 작업 완료 시 호출)"""
+    for cached in _cached_functions:
+        cached.cache_clear()
+
+
+def _has_history_table(conn: sqlite3.Connection, db_path: str) -> bool:
+    """file_history 테이블 존재 여부 (DB별 1회 확인)"""
+    exists = _history_table_exists.get(db_path)
+    if exists is None:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='file_history'"
+        )
+        exists = cursor.fetchone() is not None
+        # 테이블이 아직 없으면 이후 생성될 수 있으므로 True만 고정
+        if exists:
+            _history_table_exists[db_path] = True
+    return exists
+
+
+def _collect_db_stats(
+    conn: sqlite3.Connection, db_path: str, schema: str = "main"
+) -> Dict[str, Any]:
+    """열린 연결의 지정 스키마(main 또는 ATTACH 별칭)에서 통계 수집"""
+    stats = {}
+    files = f"{schema}.files"
+
+    # 테이블 컬럼 확인
+    cursor = conn.execute(f"PRAGMA {schema}.table_info(files)")
+    columns = {row[1] for row in cursor.fetchall()}
+
+    # 전체 파일 수
+    cursor = conn.execute(f"SELECT COUNT(*) FROM {files}")
+    stats["total_files"] = cursor.fetchone()[0]
+
+    # 상태별 파일 수 (스키마에 따라 다른 컬럼 사용)
+    if "scan_status" in columns:
+        # archive.db
+        cursor = conn.execute(
+            f"""SELECT COALESCE(scan_status, 'unknown'), COUNT(*)
+               FROM {files} GROUP BY scan_status"""
+        )
+        stats["by_status"] = dict(cursor.fetchall())
+    elif "analysis_status" in columns:
+        # pokervod.db
+        cursor = conn.execute(
+            f"""SELECT COALESCE(analysis_status, 'unknown'), COUNT(*)
+               FROM {files} GROUP BY analysis_status"""
+        )
+        stats["by_status"] = dict(cursor.fetchall())
+    else:
+        stats["by_status"] = {}
+
+    # 파일 타입별 (archive.db only)
+    if "file_type" in columns:
+        cursor = conn.execute(
+            f"""SELECT file_type, COUNT(*)
+               FROM {files} GROUP BY file_type
+               ORDER BY COUNT(*) DESC LIMIT 10"""
+        )
+        stats["by_type"] = dict(cursor.fetchall())
+    elif "codec" in columns:
+        # pokervod.db - codec별 통계
+        cursor = conn.execute(
+            f"""SELECT COALESCE(codec, 'unknown'), COUNT(*)
+               FROM {files} GROUP BY codec
+               ORDER BY COUNT(*) DESC LIMIT 10"""
+        )
+        stats["by_type"] = dict(cursor.fetchall())
+    else:
+        stats["by_type"] = {}
+
+    # 최근 파일 (스키마에 따라 다른 컬럼)
+    if "path" in columns:
+        # archive.db
+        time_col = "created_at" if "created_at" in columns else "modified_at"
+        cursor = conn.execute(
+            f"""SELECT path, filename, {time_col}
+               FROM {files}
+               ORDER BY {time_col} DESC LIMIT 5"""
+        )
+        stats["recent_files"] = [
+            {"path": r[0], "filename": r[1], "updated_at": r[2]}
+            for r in cursor.fetchall()
+        ]
+    elif "nas_path" in columns:
+        # pokervod.db
+        cursor = conn.execute(
+            f"""SELECT nas_path, filename, updated_at
+               FROM {files}
+               ORDER BY updated_at DESC LIMIT 5"""
+        )
+        stats["recent_files"] = [
+            {"path": r[0], "filename": r[1], "updated_at": r[2]}
+            for r in cursor.fetchall()
+        ]
+    else:
+        stats["recent_files"] = []
+
+    # DB 파일 크기
+    stats["db_size_mb"] = round(Path(db_path).stat().st_size / (1024 * 1024), 2)
+
+    return stats
+
+
+@_ttl_cache(CACHE_TTL_SECONDS)
 def get_db_stats(db_path: str) -> Dict[str, Any]:
     """DB 통계 조회 (archive.db, pokervod.db 둘 다 지원)"""
     if not Path(db_path).exists():
         return {"error": f"DB not found: {db_path}"}
 
-    conn = sqlite3.connect(db_path)
     try:
-        stats = {}
-
-        # 테이블 컬럼 확인
-        cursor = conn.execute("PRAGMA table_info(files)")
-        columns = {row[1] for row in cursor.fetchall()}
-
-        # 전체 파일 수
-        cursor = conn.execute("SELECT COUNT(*) FROM files")
-        stats["total_files"] = cursor.fetchone()[0]
-
-        # 상태별 파일 수 (스키마에 따라 다른 컬럼 사용)
-        if "scan_status" in columns:
-            # archive.db
-            cursor = conn.execute(
-                """SELECT COALESCE(scan_status, 'unknown'), COUNT(*)
-                   FROM files GROUP BY scan_status"""
-            )
-            stats["by_status"] = dict(cursor.fetchall())
-        elif "analysis_status" in columns:
-            # pokervod.db
-            cursor = conn.execute(
-                """SELECT COALESCE(analysis_status, 'unknown'), COUNT(*)
-                   FROM files GROUP BY analysis_status"""
-            )
-            stats["by_status"] = dict(cursor.fetchall())
-        else:
-            stats["by_status"] = {}
-
-        # 파일 타입별 (archive.db only)
-        if "file_type" in columns:
-            cursor = conn.execute(
-                """SELECT file_type, COUNT(*)
-                   FROM files GROUP BY file_type
-                   ORDER BY COUNT(*) DESC LIMIT 10"""
-            )
-            stats["by_type"] = dict(cursor.fetchall())
-        elif "codec" in columns:
-            # pokervod.db - codec별 통계
-            cursor = conn.execute(
-                """SELECT COALESCE(codec, 'unknown'), COUNT(*)
-                   FROM files GROUP BY codec
-                   ORDER BY COUNT(*) DESC LIMIT 10"""
-            )
-            stats["by_type"] = dict(cursor.fetchall())
-        else:
-            stats["by_type"] = {}
-
-        # 최근 파일 (스키마에 따라 다른 컬럼)
-        if "path" in columns:
-            # archive.db
-            time_col = "created_at" if "created_at" in columns else "modified_at"
-            cursor = conn.execute(
-                f"""SELECT path, filename, {time_col}
-                   FROM files
-                   ORDER BY {time_col} DESC LIMIT 5"""
-            )
-            stats["recent_files"] = [
-                {"path": r[0], "filename": r[1], "updated_at": r[2]}
-                for r in cursor.fetchall()
-            ]
-        elif "nas_path" in columns:
-            # pokervod.db
-            cursor = conn.execute(
-                """SELECT nas_path, filename, updated_at
-                   FROM files
-                   ORDER BY updated_at DESC LIMIT 5"""
-            )
-            stats["recent_files"] = [
-                {"path": r[0], "filename": r[1], "updated_at": r[2]}
-                for r in cursor.fetchall()
-            ]
-        else:
-            stats["recent_files"] = []
+        return _collect_db_stats(_get_conn(db_path), db_path)
+    except Exception as e:
+        return {"error": str(e)}
 
-        # DB 파일 크기
-        stats["db_size_mb"] = round(Path(db_path).stat().st_size / (1024 * 1024), 2)
 
-        return stats
+@_ttl_cache(CACHE_TTL_SECONDS, db_args=2)
+def get_both_db_stats(archive_db: str, pokervod_db: str) -> Dict[str, Dict[str, Any]]:
+    """archive/pokervod 통계를 단일 연결(ATTACH)로 조회"""
+    if not (Path(archive_db).exists() and Path(pokervod_db).exists()):
+        # 한쪽이 없으면 개별 조회로 에러 정보 유지
+        return {
+            "archive": get_db_stats(archive_db),
+            "pokervod": get_db_stats(pokervod_db),
+        }
 
+    try:
+        conn = _get_conn(archive_db, attach_pv=pokervod_db)
+        result = {}
+        for key, db_path, schema in (
+            ("archive", archive_db, "main"),
+            ("pokervod", pokervod_db, "pv"),
+        ):
+            try:
+                result[key] = _collect_db_stats(conn, db_path, schema)
+            except Exception as e:
+                result[key] = {"error": str(e)}
+        return result
     except Exception as e:
-        return {"error": str(e)}
-    finally:
-        conn.close()
+        return {"archive": {"error": str(e)}, "pokervod": {"error": str(e)}}
+
+
+# HLS 호환 확장자 (sync.py와 동일, O(1) 멤버십 검사용 frozenset)
+HLS_COMPATIBLE_EXTENSIONS = frozenset(("mp4", "mov", "ts", "m4v", "m2ts", "mts"))
+
+# HLS 비호환 영상 확장자 (SQL LIKE 조건은 모듈 로드 시 1회, 정렬 순서로 생성)
+NON_HLS_EXTENSIONS = frozenset(("mxf", "webm", "mkv", "avi", "wmv", "flv"))
+_NON_HLS_PATTERNS = tuple(f"%.{ext}" for ext in sorted(NON_HLS_EXTENSIONS))
+_NON_HLS_PREDICATE = " OR ".join("f.filename LIKE ?" for _ in _NON_HLS_PATTERNS)
+
+# files.extension 컬럼(".mxf" 형식, 소문자)이 있으면 인덱스 가능한 IN 조건 사용
+_NON_HLS_EXT_VALUES = tuple(f".{ext}" for ext in sorted(NON_HLS_EXTENSIONS))
+_NON_HLS_EXT_PREDICATE = "f.extension IN ({})".format(",".join("?" * len(_NON_HLS_EXT_VALUES)))
 
 
-# HLS 호환 확장자 (sync.py와 동일)
-HLS_COMPATIBLE_EXTENSIONS = ("mp4", "mov", "ts", "m4v", "m2ts", "mts")
+# 인덱스 확인을 시도한 archive DB 경로 (성공/실패 무관, 프로세스당 1회)
+_indexed_dbs: set = set()
+
+
+def _ensure_indexes(db_path: str):
+    """매칭 쿼리용 인덱스 보장 (서버 시작 시 DB별 1회)
+
+    Database.init_schema가 만든 DB에는 이미 있으므로 외부에서 만든 DB용 보정이다.
+    잠겨 있거나 읽기 전용인 DB면 경고만 남기고 다시 시도하지 않는다.
+    """
+    if db_path in _indexed_dbs or not Path(db_path).exists():
+        return
+    _indexed_dbs.add(db_path)
+    conn = None
+    try:
+        conn = _open(db_path, readonly=False)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_files_path ON files(path)")
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+        if "extension" in columns:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_files_extension ON files(extension)")
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"인덱스 생성 실패 ({db_path}): {e}")
+    finally:
+        if conn is not None:
+            conn.close()
 
 
 def get_matching_summary(
     archive_db: str, pokervod_db: str
 ) -> Dict[str, Any]:
-    """매칭 요약 통계 계산"""
+    """매칭 요약 통계 계산 (DB mtime 기반 캐시)"""
+    return _query_matching_summary(archive_db, pokervod_db)
+
+
+# pokervod.db가 없을 때 pv.files 대신 쓰는 빈 결과 (쿼리 단일화)
+_EMPTY_PV_FILES = (
+    "(SELECT NULL AS id, NULL AS filename, NULL AS nas_path, NULL AS size_bytes WHERE 0)"
+)
+
+
+def _get_matching_conn(archive_db: str, pokervod_db: str) -> Tuple[sqlite3.Connection, str]:
+    """pokervod.db를 pv로 ATTACH한 archive 연결과 pv.files SQL 소스 반환"""
+    if Path(pokervod_db).exists():
+        return _get_conn(archive_db, attach_pv=pokervod_db), "pv.files"
+    return _get_conn(archive_db), _EMPTY_PV_FILES
+
+
+@_ttl_cache(CACHE_TTL_SECONDS, db_args=2)
+def _query_matching_summary(archive_db: str, pokervod_db: str) -> Dict[str, Any]:
     summary = {
         "synced": 0,
         "not_synced": 0,
+        "pending": 0,
         "duplicates": 0,
         "catalogs": [],
     }
@@ -230,96 +682,168 @@ def get_matching_summary(
     if not Path(archive_db).exists():
         return summary
 
-    conn_archive = sqlite3.connect(archive_db)
-    conn_pokervod = None
-    if Path(pokervod_db).exists():
-        conn_pokervod = sqlite3.connect(pokervod_db)
-
     try:
-        # archive.db 파일 수
-        cursor = conn_archive.execute("SELECT COUNT(*) FROM files")
-        total_archive = cursor.fetchone()[0]
-
-        # pokervod.db 파일 수 (매칭된 파일)
-        synced = 0
-        if conn_pokervod:
-            cursor = conn_pokervod.execute("SELECT COUNT(*) FROM files")
-            synced = cursor.fetchone()[0]
-
-        # HLS 비호환 (확장자 기반)
-        non_hls_extensions = tuple(
-            f"%.{ext}" for ext in ("mxf", "webm", "mkv", "avi", "wmv", "flv")
-        )
-        cursor = conn_archive.execute(
-            f"""SELECT COUNT(*) FROM files
-               WHERE {' OR '.join('filename LIKE ?' for _ in non_hls_extensions)}""",
-            non_hls_extensions,
-        )
-        not_synced = cursor.fetchone()[0]
-
-        # 중복 파일 수 (동일 파일명이 여러 경로에 존재)
-        cursor = conn_archive.execute(
-            """SELECT COUNT(*) FROM (
-                   SELECT filename, COUNT(*) as cnt FROM files
-                   GROUP BY filename HAVING cnt > 1
-               )"""
-        )
-        duplicate_groups = cursor.fetchone()[0]
+        conn_archive, pv_files = _get_matching_conn(archive_db, pokervod_db)
 
-        # 중복으로 인해 제외된 파일 수 (그룹당 n-1개)
-        cursor = conn_archive.execute(
-            """SELECT SUM(cnt - 1) FROM (
-                   SELECT filename, COUNT(*) as cnt FROM files
-                   GROUP BY filename HAVING cnt > 1
-               )"""
-        )
-        result = cursor.fetchone()[0]
-        duplicates_excluded = result if result else 0
+        # HLS 비호환 판정: extension 컬럼이 있으면 사용, 없으면 filename LIKE
+        columns = {row[1] for row in conn_archive.execute("PRAGMA main.table_info(files)")}
+        if "extension" in columns:
+            non_hls_predicate, non_hls_params = _NON_HLS_EXT_PREDICATE, _NON_HLS_EXT_VALUES
+        else:
+            non_hls_predicate, non_hls_params = _NON_HLS_PREDICATE, _NON_HLS_PATTERNS
 
-        # 카탈로그별 통계
+        # 카탈로그별 파일 수 + 매칭/HLS 비호환/중복 수를 단일 쿼리로 계산
+        # - synced: pokervod.db에 동일 filename 존재
+        # - not_synced: 미등록 + HLS 비호환 확장자
+        # - duplicates: 동일 filename 그룹당 n-1개 (idx_files_filename 인덱스 스캔)
         cursor = conn_archive.execute(
-            """SELECT
-                   CASE
-                       WHEN path LIKE '%/WSOP/%' OR path LIKE 'WSOP/%' THEN 'WSOP'
-                       WHEN path LIKE '%/HCL/%' OR path LIKE 'HCL/%' THEN 'HCL'
-                       WHEN path LIKE '%/PAD/%' OR path LIKE 'PAD/%' THEN 'PAD'
-                       WHEN path LIKE '%/MPP/%' OR path LIKE 'MPP/%' THEN 'MPP'
-                       WHEN path LIKE '%/GOG/%' OR path LIKE 'GOG/%' THEN 'GOG'
-                       WHEN path LIKE '%/GGMillions/%' OR path LIKE 'GGMillions/%' THEN 'GGMillions'
-                       ELSE 'Other'
-                   END as catalog,
-                   COUNT(*) as count
-               FROM files
+            f"""WITH dupes AS (
+                   SELECT COUNT(*) - 1 AS extra FROM main.files
+                   GROUP BY filename HAVING COUNT(*) > 1
+               ),
+               catalog_bucket AS (
+                   SELECT
+                       CASE
+                           WHEN path LIKE '%/WSOP/%' OR path LIKE 'WSOP/%' THEN 'WSOP'
+                           WHEN path LIKE '%/HCL/%' OR path LIKE 'HCL/%' THEN 'HCL'
+                           WHEN path LIKE '%/PAD/%' OR path LIKE 'PAD/%' THEN 'PAD'
+                           WHEN path LIKE '%/MPP/%' OR path LIKE 'MPP/%' THEN 'MPP'
+                           WHEN path LIKE '%/GOG/%' OR path LIKE 'GOG/%' THEN 'GOG'
+                           WHEN path LIKE '%/GGMillions/%' OR path LIKE 'GGMillions/%' THEN 'GGMillions'
+                           ELSE 'Other'
+                       END AS catalog,
+                       f.filename IN (SELECT filename FROM {pv_files}) AS is_synced,
+                       ({non_hls_predicate}) AS is_non_hls
+                   FROM main.files f
+               )
+               SELECT
+                   catalog,
+                   COUNT(*) AS count,
+                   COALESCE(SUM(is_synced), 0),
+                   COALESCE(SUM(NOT is_synced AND is_non_hls), 0),
+                   (SELECT COALESCE(SUM(extra), 0) FROM dupes)
+               FROM catalog_bucket
                GROUP BY catalog
-               ORDER BY count DESC"""
+               ORDER BY count DESC""",
+            non_hls_params,
         )
-        catalogs = [{"name": row[0], "count": row[1]} for row in cursor.fetchall()]
+        rows = cursor.fetchall()
+
+        synced = sum(row[2] for row in rows)
+        not_synced = sum(row[3] for row in rows)
+        duplicates_excluded = rows[0][4] if rows else 0
+        catalogs = [{"name": row[0], "count": row[1]} for row in rows]
+        # 미등록이지만 HLS 호환 → 다음 동기화 대상
+        pending = sum(row[1] for row in rows) - synced - not_synced
 
         summary = {
             "synced": synced,
             "not_synced": not_synced,
+            "pending": pending,
             "duplicates": duplicates_excluded,
             "catalogs": catalogs,
         }
 
     except Exception as e:
         logger.error(f"매칭 요약 계산 오류: {e}")
-    finally:
-        conn_archive.close()
-        if conn_pokervod:
-            conn_pokervod.close()
 
     return summary
 
 
+# 이 값보다 큰 per_page 요청은 아이템을 스트리밍 직렬화
+MATCHING_STREAM_THRESHOLD = 200
+
+# /api/matching 페이지 크기 상한 (캐시 키/응답 크기 제한)
+MATCHING_MAX_PER_PAGE = 1000
+
+# 매칭 테이블 정렬 컬럼 화이트리스트 (요청 값 -> SQL 컬럼)
+MATCHING_SORT_COLUMNS = {
+    "id": "id",
+    "path": "path",
+    "filename": "filename",
+    "size": "size_bytes",
+    "status": "status",
+}
+
+# 매칭 상태 필터 화이트리스트
+MATCHING_STATUSES = frozenset({"synced", "not_synced", "synced_with_duplicates"})
+
+
+def normalize_matching_params(
+    page: int, per_page: int, status: Optional[str], sort_by: str, order: str
+) -> Tuple[int, int, Optional[str], str, str]:
+    """/api/matching 파라미터 보정 (범위 제한 + 화이트리스트 외 값은 기본값)"""
+    order = order.lower()
+    return (
+        max(page, 1),
+        min(max(per_page, 1), MATCHING_MAX_PER_PAGE),
+        status if status in MATCHING_STATUSES else None,
+        sort_by if sort_by in MATCHING_SORT_COLUMNS else "id",
+        order if order in ("asc", "desc") else "asc",
+    )
+
+
 def get_matching_items(
     archive_db: str,
     pokervod_db: str,
     page: int = 1,
     per_page: int = 20,
     status_filter: Optional[str] = None,
+    sort_by: str = "id",
+    order: str = "asc",
+) -> tuple:
+    """1:1 매칭 아이템 목록 조회 (DB mtime 기반 캐시)"""
+    return _query_matching_items(
+        archive_db, pokervod_db, page, per_page, status_filter, sort_by, order
+    )
+
+
+def _row_to_item(row: tuple, dup_map: Dict[str, List[Tuple[int, str]]]) -> Dict[str, Any]:
+    """매칭 쿼리 행 → API 아이템 dict"""
+    source_id, path, filename, file_type, size_bytes = row[:5]
+
+    # 확장자로 HLS 호환 여부 확인
+    _, sep, tail = filename.rpartition(".")
+    ext = tail.lower() if sep else ""
+
+    target_info = None
+    if row[5] is not None:
+        target_info = {
+            "id": row[5],
+            "filename": filename,
+            "nas_path": row[6],
+            "size_bytes": row[7],
+        }
+
+    return {
+        "status": row[8],
+        "source": {
+            "id": source_id,
+            "path": path,
+            "filename": filename,
+            "file_type": file_type,
+            "size_bytes": size_bytes,
+        },
+        "target": target_info,
+        "is_hls_compatible": ext in HLS_COMPATIBLE_EXTENSIONS,
+        "duplicates": [
+            {"id": dup_id, "path": dup_path}
+            for dup_id, dup_path in dup_map.get(filename, ())
+            if dup_id != source_id
+        ],
+    }
+
+
+@_ttl_cache(CACHE_TTL_SECONDS, db_args=2)
+def _query_matching_items(
+    archive_db: str,
+    pokervod_db: str,
+    page: int,
+    per_page: int,
+    status_filter: Optional[str],
+    sort_by: str,
+    order: str,
 ) -> tuple:
-    """1:1 매칭 아이템 목록 조회"""
     items = []
     total = 0
     summary = {"synced": 0, "not_synced": 0, "synced_with_duplicates": 0}
@@ -327,190 +851,172 @@ def get_matching_items(
     if not Path(archive_db).exists():
         return items, total, summary
 
-    conn_archive = sqlite3.connect(archive_db)
-    conn_pokervod = None
-    pokervod_files = {}
-
-    if Path(pokervod_db).exists():
-        conn_pokervod = sqlite3.connect(pokervod_db)
-        # pokervod.db의 파일들을 filename으로 인덱싱
-        cursor = conn_pokervod.execute(
-            "SELECT id, filename, nas_path, size_bytes FROM files"
-        )
-        for row in cursor.fetchall():
-            pokervod_files[row[1]] = {
-                "id": row[0],
-                "filename": row[1],
-                "nas_path": row[2],
-                "size_bytes": row[3],
-            }
+    sort_col = MATCHING_SORT_COLUMNS.get(sort_by, "id")
+    direction = "DESC" if order.lower() == "desc" else "ASC"
 
     try:
-        # 중복 파일 목록 (동일 filename이 여러 path에 존재)
+        conn_archive, pv_files = _get_matching_conn(archive_db, pokervod_db)
+
+        # 매칭 상태는 SQL에서 계산 (pokervod 매칭은 filename LEFT JOIN,
+        # 동일 filename은 최대 id 1건), 필터/정렬/페이지네이션도 SQL에서 처리
+        matched_cte = f"""WITH matched AS (
+                   SELECT f.id, f.path, f.filename, f.file_type, f.size_bytes,
+                          p.id AS target_id, p.nas_path AS target_path,
+                          p.size_bytes AS target_size,
+                          CASE
+                              WHEN p.id IS NULL THEN 'not_synced'
+                              WHEN f.filename IN (
+                                  SELECT filename FROM main.files
+                                  GROUP BY filename HAVING COUNT(*) > 1
+                              ) THEN 'synced_with_duplicates'
+                              ELSE 'synced'
+                          END AS status
+                   FROM main.files f
+                   LEFT JOIN (
+                       SELECT MAX(id) AS id, filename, nas_path, size_bytes
+                       FROM {pv_files} GROUP BY filename
+                   ) p ON p.filename = f.filename
+               )"""
+        where = "WHERE (:status IS NULL OR status = :status)"
+
+        # 상태별 전체 건수 (단일 GROUP BY) → summary / total
         cursor = conn_archive.execute(
-            """SELECT filename FROM files
-               GROUP BY filename HAVING COUNT(*) > 1"""
+            f"{matched_cte} SELECT status, COUNT(*) FROM matched GROUP BY status"
         )
-        duplicate_filenames = {row[0] for row in cursor.fetchall()}
-
-        # 전체 파일 수
-        cursor = conn_archive.execute("SELECT COUNT(*) FROM files")
-        total = cursor.fetchone()[0]
+        for status, count in cursor:
+            summary[status] = count
+        total = summary.get(status_filter, 0) if status_filter else sum(summary.values())
 
         # 페이지네이션
-        offset = (page - 1) * per_page
         cursor = conn_archive.execute(
-            """SELECT id, path, filename, file_type, size_bytes
-               FROM files
-               ORDER BY id
-               LIMIT ? OFFSET ?""",
-            (per_page, offset),
+            f"""{matched_cte}
+               SELECT id, path, filename, file_type, size_bytes,
+                      target_id, target_path, target_size, status
+               FROM matched {where}
+               ORDER BY {sort_col} {direction}, id
+               LIMIT :limit OFFSET :offset""",
+            {
+                "status": status_filter,
+                "limit": per_page,
+                "offset": (page - 1) * per_page,
+            },
         )
+        rows = cursor.fetchall()
+
+        # 현재 페이지 파일명의 중복 경로를 1회 조회 후 그룹화
+        # ('synced' 상태는 중복이 없음이 확정이므로 조회 대상에서 제외)
+        dup_map: Dict[str, List[Tuple[int, str]]] = {}
+        page_filenames = list({row[2] for row in rows if row[8] != "synced"})
+        if page_filenames:
+            placeholders = ",".join("?" * len(page_filenames))
+            cursor = conn_archive.execute(
+                f"SELECT filename, id, path FROM files WHERE filename IN ({placeholders})",
+                page_filenames,
+            )
+            for dup_filename, dup_id, dup_path in cursor:
+                dup_map.setdefault(dup_filename, []).append((dup_id, dup_path))
 
-        for row in cursor.fetchall():
-            source_id, path, filename, file_type, size_bytes = row
-
-            # 확장자로 HLS 호환 여부 확인
-            ext = filename.split(".")[-1].lower() if "." in filename else ""
-            is_hls_compatible = ext in HLS_COMPATIBLE_EXTENSIONS
-
-            # 매칭 상태 결정
-            target_info = pokervod_files.get(filename)
-            is_duplicate = filename in duplicate_filenames
-
-            if target_info:
-                if is_duplicate:
-                    status = "synced_with_duplicates"
-                    summary["synced_with_duplicates"] += 1
-                else:
-                    status = "synced"
-                    summary["synced"] += 1
-            else:
-                status = "not_synced"
-                summary["not_synced"] += 1
-
-            # 필터 적용
-            if status_filter and status != status_filter:
-                continue
-
-            item = {
-                "status": status,
-                "source": {
-                    "id": source_id,
-                    "path": path,
-                    "filename": filename,
-                    "file_type": file_type,
-                    "size_bytes": size_bytes,
-                },
-                "target": target_info,
-                "is_hls_compatible": is_hls_compatible,
-            }
-
-            if is_duplicate:
-                # 중복 경로 조회
-                dup_cursor = conn_archive.execute(
-                    "SELECT id, path FROM files WHERE filename = ? AND id != ?",
-                    (filename, source_id),
-                )
-                item["duplicates"] = [
-                    {"id": r[0], "path": r[1]} for r in dup_cursor.fetchall()
-                ]
-            else:
-                item["duplicates"] = []
-
-            items.append(item)
+        items = [_row_to_item(row, dup_map) for row in rows]
 
     except Exception as e:
         logger.error(f"매칭 아이템 조회 오류: {e}")
-    finally:
-        conn_archive.close()
-        if conn_pokervod:
-            conn_pokervod.close()
 
     return items, total, summary
 
 
 def get_catalog_tree(archive_db: str, pokervod_db: str) -> List[Dict[str, Any]]:
-    """카탈로그별 트리 구조 생성"""
+    """카탈로그별 트리 구조 생성 (DB mtime 기반 캐시)"""
+    return _query_catalog_tree(archive_db, pokervod_db)
+
+
+# 트리 탭 카탈로그 정의 (표시 순서, path LIKE 패턴)
+CATALOG_TREE_PATTERNS = (
+    ("WSOP", "%WSOP%"),
+    ("HCL", "%HCL%"),
+    ("PAD", "%PAD%"),
+    ("MPP", "%MPP%"),
+    ("GOG", "%GOG%"),
+    ("GGMillions", "%GGMillions%"),
+)
+CATALOG_TREE_FILE_LIMIT = 50
+_CATALOG_TREE_CASE = "CASE {} ELSE NULL END".format(
+    " ".join(f"WHEN f.path LIKE '{pattern}' THEN '{name}'" for name, pattern in CATALOG_TREE_PATTERNS)
+)
+
+
+@_ttl_cache(CACHE_TTL_SECONDS, db_args=2)
+def _query_catalog_tree(archive_db: str, pokervod_db: str) -> List[Dict[str, Any]]:
     catalogs = []
 
     if not Path(archive_db).exists():
         return catalogs
 
-    conn_archive = sqlite3.connect(archive_db)
-    conn_pokervod = None
-    pokervod_files = set()
-
-    if Path(pokervod_db).exists():
-        conn_pokervod = sqlite3.connect(pokervod_db)
-        cursor = conn_pokervod.execute("SELECT filename FROM files")
-        pokervod_files = {row[0] for row in cursor.fetchall()}
-
     try:
-        # 카탈로그 정의
-        catalog_patterns = [
-            ("WSOP", "%WSOP%"),
-            ("HCL", "%HCL%"),
-            ("PAD", "%PAD%"),
-            ("MPP", "%MPP%"),
-            ("GOG", "%GOG%"),
-            ("GGMillions", "%GGMillions%"),
-        ]
+        conn_archive, pv_files = _get_matching_conn(archive_db, pokervod_db)
 
-        for catalog_name, pattern in catalog_patterns:
-            cursor = conn_archive.execute(
-                """SELECT id, path, filename, size_bytes
-                   FROM files WHERE path LIKE ?
-                   ORDER BY path""",
-                (pattern,),
+        # 카탈로그 태깅 + 카탈로그별 집계/상위 N개 파일을 단일 쿼리로 조회
+        cursor = conn_archive.execute(
+            f"""WITH tagged AS (
+                   SELECT {_CATALOG_TREE_CASE} AS catalog,
+                          f.id, f.path, f.filename, f.size_bytes,
+                          f.filename IN (SELECT filename FROM {pv_files}) AS is_synced
+                   FROM main.files f
+               ),
+               ranked AS (
+                   SELECT *,
+                          ROW_NUMBER() OVER (PARTITION BY catalog ORDER BY path) AS rn,
+                          COUNT(*) OVER (PARTITION BY catalog) AS total,
+                          SUM(is_synced) OVER (PARTITION BY catalog) AS synced
+                   FROM tagged WHERE catalog IS NOT NULL
+               )
+               SELECT catalog, total, synced, id, path, filename, size_bytes, is_synced
+               FROM ranked WHERE rn <= ?
+               ORDER BY catalog, rn""",
+            (CATALOG_TREE_FILE_LIMIT,),
+        )
+
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for row in cursor:
+            catalog = by_name.get(row[0])
+            if catalog is None:
+                catalog = by_name[row[0]] = {
+                    "name": row[0],
+                    "total_files": row[1],
+                    "synced": row[2],
+                    "not_synced": row[1] - row[2],
+                    "files": [],
+                }
+            catalog["files"].append(
+                {
+                    "name": row[5],
+                    "source_id": row[3],
+                    "path": row[4],
+                    "target_id": None,  # 간소화
+                    "status": "synced" if row[7] else "not_synced",
+                    "size_bytes": row[6],
+                }
             )
-            files = cursor.fetchall()
-
-            synced = sum(1 for f in files if f[2] in pokervod_files)
-            not_synced = len(files) - synced
-
-            catalog = {
-                "name": catalog_name,
-                "total_files": len(files),
-                "synced": synced,
-                "not_synced": not_synced,
-                "files": [
-                    {
-                        "name": f[2],
-                        "source_id": f[0],
-                        "path": f[1],
-                        "target_id": None,  # 간소화
-                        "status": "synced" if f[2] in pokervod_files else "not_synced",
-                        "size_bytes": f[3],
-                    }
-                    for f in files[:50]  # 첫 50개만
-                ],
-            }
-            if len(files) > 0:
-                catalogs.append(catalog)
+
+        catalogs = [
+            by_name[name] for name, _ in CATALOG_TREE_PATTERNS if name in by_name
+        ]
 
     except Exception as e:
         logger.error(f"카탈로그 트리 생성 오류: {e}")
-    finally:
-        conn_archive.close()
-        if conn_pokervod:
-            conn_pokervod.close()
 
     return catalogs
 
 
+@_ttl_cache(CACHE_TTL_SECONDS)
 def get_file_history(db_path: str, limit: int = 50) -> List[Dict[str, Any]]:
-    """파일 변경 이력 조회"""
+    """파일 변경 이력 조회 (DB mtime 불변 시 캐시 반환)"""
     if not Path(db_path).exists():
         return []
 
-    conn = sqlite3.connect(db_path)
+    conn = _get_conn(db_path)
     try:
         # file_history 테이블 존재 확인
-        cursor = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='file_history'"
-        )
-        if not cursor.fetchone():
+        if not _has_history_table(conn, db_path):
             return []
 
         cursor = conn.execute(
@@ -539,8 +1045,98 @@ def get_file_history(db_path: str, limit: int = 50) -> List[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"파일 이력 조회 오류: {e}")
         return []
-    finally:
-        conn.close()
+
+
+# 이력 이벤트 타입별 배지 CSS 클래스 (서버 측 렌더링)
+HISTORY_EVENT_CLASSES = {
+    "created": "bg-green-800 text-green-200",
+    "modified": "bg-yellow-800 text-yellow-200",
+    "moved": "bg-blue-800 text-blue-200",
+    "renamed": "bg-blue-800 text-blue-200",
+    "deleted": "bg-red-800 text-red-200",
+}
+DEFAULT_EVENT_CLASS = "bg-gray-700 text-gray-300"
+
+
+@_ttl_cache(CACHE_TTL_SECONDS)
+def get_history_max_id(db_path: str) -> int:
+    """file_history 최대 id 조회 (ETag 용, 테이블 없으면 0, DB mtime 기반 캐시)"""
+    if not Path(db_path).exists():
+        return 0
+
+    conn = _get_conn(db_path)
+    try:
+        if not _has_history_table(conn, db_path):
+            return 0
+        return conn.execute("SELECT COALESCE(MAX(id), 0) FROM file_history").fetchone()[0]
+    except Exception as e:
+        logger.error(f"파일 이력 MAX(id) 조회 오류: {e}")
+        return 0
+
+
+def build_matching_payload(result: tuple, page: int, per_page: int) -> Dict[str, Any]:
+    """get_matching_items 결과 → /api/matching 응답 데이터"""
+    items, total, summary = result
+    return {
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "items": items,
+        "summary": summary,
+    }
+
+
+def get_dashboard_bundle(archive_db: str, pokervod_db: str) -> Dict[str, Any]:
+    """대시보드용 DB 통계 + 매칭 요약을 한 스레드/한 ATTACH 연결에서 조회
+
+    두 조회 모두 (archive_db, pokervod_db) 풀 연결을 공유하므로 요청당
+    스레드 전환 1회, 연결 1개로 처리된다.
+    """
+    return {
+        "db_stats": get_both_db_stats(archive_db, pokervod_db),
+        "matching_summary": get_matching_summary(archive_db, pokervod_db),
+    }
+
+
+def build_dashboard_payload(
+    db_stats: Dict[str, Dict[str, Any]], matching_summary: Dict[str, Any]
+) -> Dict[str, Any]:
+    """통합 대시보드 응답 데이터 생성 (/api/dashboard)"""
+    archive_stats = db_stats["archive"]
+    pokervod_stats = db_stats["pokervod"]
+
+    return {
+        "source": {
+            "name": "NAS 아카이브",
+            "db_path": state.config.archive_db,
+            "total_files": archive_stats.get("total_files", 0),
+            "by_type": archive_stats.get("by_type", {}),
+            "db_size_mb": archive_stats.get("db_size_mb", 0),
+        },
+        "target": {
+            "name": "OTT 플랫폼",
+            "db_path": state.config.pokervod_db,
+            "total_files": pokervod_stats.get("total_files", 0),
+            "by_format": pokervod_stats.get("by_type", {}),
+            "excluded": {
+                "non_hls": matching_summary.get("not_synced", 0),
+                "duplicates": matching_summary.get("duplicates", 0),
+            },
+        },
+        "sync_status": {
+            "is_running": state.sync_in_progress,
+            "last_sync_time": state.last_sync_time_iso,
+            "last_result": state.last_sync_result,
+        },
+        # 사유별 건수 (요약 카드용, 매칭 테이블 조회 없이 캐시된 요약에서 제공)
+        "summary_counts": {
+            "synced": matching_summary.get("synced", 0),
+            "hls_incompatible": matching_summary.get("not_synced", 0),
+            "duplicate_excluded": matching_summary.get("duplicates", 0),
+            "pending_sync": matching_summary.get("pending", 0),
+        },
+        "catalogs": matching_summary.get("catalogs", []),
+    }
 
 
 # =============================================================================
@@ -548,11 +1144,86 @@ def get_file_history(db_path: str, limit: int = 50) -> List[Dict[str, Any]]:
 # =============================================================================
 
 
+def _record_sync_time():
+    """작업 완료 시각 기록 (응답용 ISO 문자열도 함께 캐시)"""
+    state.last_sync_time = datetime.now()
+    state.last_sync_time_iso = state.last_sync_time.isoformat()
+
+
+def warm_caches():
+    """대시보드/트리 조회 결과를 미리 계산해 캐시에 적재 (동기화 직후 첫 폴링 지연 제거)"""
+    archive_db, pokervod_db = state.config.archive_db, state.config.pokervod_db
+    try:
+        get_dashboard_bundle(archive_db, pokervod_db)
+        get_catalog_tree(archive_db, pokervod_db)
+    except Exception as e:
+        logger.warning(f"캐시 예열 실패: {e}")
+
+
+def notify_dashboard_subscribers():
+    """/ws/dashboard 구독자에게 최신 대시보드 데이터 푸시 (워커 스레드에서 호출)"""
+    loop = state.loop
+    if loop is None or not state.dashboard_subscribers:
+        return
+    try:
+        bundle = get_dashboard_bundle(state.config.archive_db, state.config.pokervod_db)
+        message = _dumps(
+            build_dashboard_payload(bundle["db_stats"], bundle["matching_summary"])
+        ).decode("utf-8")
+        asyncio.run_coroutine_threadsafe(
+            _send_all(state.dashboard_subscribers, message), loop
+        )
+    except Exception as e:
+        logger.warning(f"대시보드 푸시 실패: {e}")
+
+
+def _status_message() -> str:
+    """로그 스트림으로 보내는 상태 메시지 ({"type": "status", "payload": ...})"""
+    return _dumps(
+        {
+            "type": "status",
+            "payload": {
+                "is_running": state.is_running,
+                "sync_in_progress": state.sync_in_progress,
+                "last_sync_time": state.last_sync_time_iso,
+                "error_message": state.error_message,
+            },
+        }
+    ).decode("utf-8")
+
+
+async def _push_status():
+    """전송 시점의 상태로 메시지 생성 (시작/종료 알림 순서가 뒤바뀌어도 최신 상태 유지)"""
+    message = _status_message()
+    _publish_sse(state.log_streams, _sse_event(message))
+    await _send_all(state.connected_clients, message)
+
+
+def notify_status():
+    """로그 스트림(/ws/logs, /api/logs/stream) 구독자에게 상태 변경 푸시 (스레드 무관 호출 가능)"""
+    loop = state.loop
+    if loop is None or not (state.connected_clients or state.log_streams):
+        return
+    asyncio.run_coroutine_threadsafe(_push_status(), loop)
+
+
+def _finish_sync_job():
+    """작업 종료 공통 처리: 캐시 무효화/예열 후 진행 플래그 해제 및 대시보드 푸시"""
+    invalidate_caches()
+    warm_caches()
+    with _sync_lock:
+        state.sync_in_progress = False
+    notify_status()
+    notify_dashboard_subscribers()
+
+
 def run_sync_task():
-    """동기화 작업 실행 (백그라운드)"""
+    """동기화 작업 실행 (백그라운드)
+
+    submit_sync_job()으로 제출해야 한다 (진행 플래그는 제출 시 락 안에서 설정됨).
+    """
     from archive_analyzer.nas_auto_sync import AutoSyncConfig, NASAutoSync
 
-    state.sync_in_progress = True
     state.error_message = None
 
     try:
@@ -564,7 +1235,7 @@ def run_sync_task():
         service = NASAutoSync(config)
         result = service.run_once()
 
-        state.last_sync_time = datetime.now()
+        _record_sync_time()
         state.last_sync_result = result
         logger.info(f"동기화 완료: {result}")
 
@@ -573,14 +1244,16 @@ def run_sync_task():
         logger.error(f"동기화 실패: {e}")
 
     finally:
-        state.sync_in_progress = False
+        _finish_sync_job()
 
 
 def run_reconcile_task(dry_run: bool = True):
-    """정합성 검증 작업 실행 (백그라운드)"""
+    """정합성 검증 작업 실행 (백그라운드)
+
+    submit_sync_job()으로 제출해야 한다 (진행 플래그는 제출 시 락 안에서 설정됨).
+    """
     from archive_analyzer.nas_auto_sync import AutoSyncConfig, NASAutoSync
 
-    state.sync_in_progress = True
     state.error_message = None
 
     try:
@@ -594,7 +1267,7 @@ def run_reconcile_task(dry_run: bool = True):
             dry_run=dry_run,
         )
 
-        state.last_sync_time = datetime.now()
+        _record_sync_time()
         state.last_sync_result = {"reconcile": result}
         logger.info(f"정합성 검증 완료: {result}")
 
@@ -603,7 +1276,181 @@ def run_reconcile_task(dry_run: bool = True):
         logger.error(f"정합성 검증 실패: {e}")
 
     finally:
-        state.sync_in_progress = False
+        _finish_sync_job()
+
+
+# sync_in_progress 확인/설정을 원자적으로 수행하기 위한 락
+_sync_lock = threading.Lock()
+
+
+def submit_sync_job(fn, *args) -> Optional[Future]:
+    """동기화/정합성 작업을 전용 워커 스레드에 제출
+
+    요청 처리용 스레드풀과 분리하여 장시간 작업이 엔드포인트를 막지 않도록 한다.
+
+    Returns:
+        제출된 작업의 Future, 이미 작업이 진행 중이면 None
+    """
+    with _sync_lock:
+        if state.sync_in_progress:
+            return None
+        if state.sync_executor is None:
+            state.sync_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync")
+        # 워커가 작업을 시작하기 전 중복 요청 방지
+        state.sync_in_progress = True
+        state.sync_future = state.sync_executor.submit(fn, *args)
+    notify_status()
+    return state.sync_future
+
+
+# =============================================================================
+# JSON Response
+# =============================================================================
+
+
+def _dumps(content: Any) -> bytes:
+    """JSON 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if ORJSON_AVAILABLE:
+        # 통계 dict의 None 키(file_type NULL 등)도 표준 json처럼 "null"로 직렬화
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (orjson 미설치 시 표준 JSONResponse와 동일)"""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+# 스트리밍 직렬화 시 청크당 아이템 수
+STREAM_CHUNK_ITEMS = 100
+
+
+def _iter_json_items(payload: Dict[str, Any], key: str = "items"):
+    """payload[key] 리스트를 청크 단위로 직렬화하며 JSON 바이트 생성
+
+    전체 응답 바이트를 한 번에 만들지 않으므로 큰 페이지에서 피크 메모리를 줄인다.
+    """
+    head = _dumps({k: v for k, v in payload.items() if k != key})
+    yield head[:-1] + (b',"' if len(head) > 2 else b'"') + key.encode() + b'":['
+    items = payload[key]
+    for start in range(0, len(items), STREAM_CHUNK_ITEMS):
+        chunk = b",".join(_dumps(item) for item in items[start:start + STREAM_CHUNK_ITEMS])
+        yield (b"," if start else b"") + chunk
+    yield b"]}"
+
+
+# =============================================================================
+# HTTP Caching
+# =============================================================================
+
+# 조회 API 캐시 정책: 브라우저는 매 요청 재검증하고, 서버는 ETag 일치 시
+# 쿼리 없이 304 반환 (동기화 상태가 바로 반영되도록 max-age 미사용)
+API_CACHE_CONTROL = "no-cache"
+
+
+def _make_etag(*parts: Any) -> str:
+    """DB 시그니처/요청 파라미터 등으로 약한 ETag 생성 (페이로드 해시 불필요)"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _dashboard_etag(archive_db: str, pokervod_db: str) -> str:
+    """대시보드 데이터 ETag (DB 변경 또는 동기화 상태 변경 시에만 바뀜)"""
+    return _make_etag(
+        "dashboard",
+        _db_signature(archive_db),
+        _db_signature(pokervod_db),
+        state.last_sync_time,
+        state.sync_in_progress,
+    )
+
+
+async def _conditional_json(
+    request: Request, etag: str, build, stream: bool = False
+) -> Response:
+    """If-None-Match 일치 시 304, 아니면 await build() 결과를 ETag와 함께 반환
+
+    build는 페이로드를 반환하는 awaitable 팩토리 (DB 조회는 to_thread로 실행).
+    stream=True면 payload["items"]를 청크 단위로 직렬화해 스트리밍한다.
+    """
+    headers = {"ETag": etag, "Cache-Control": API_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    payload = await build()
+    if stream:
+        return StreamingResponse(
+            _iter_json_items(payload), media_type="application/json", headers=headers
+        )
+    return FastJSONResponse(payload, headers=headers)
+
+
+# 정적 파일 캐시 정책: 파일명에 콘텐츠 해시가 있으면(app.3f9a1c2b.js) URL 변경으로
+# 무효화되므로 1년 immutable, 그 외 파일은 매번 재검증
+STATIC_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+STATIC_DEFAULT_CACHE_CONTROL = "no-cache"
+_HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+
+def _make_static_files(directory: str):
+    """Cache-Control을 붙이는 StaticFiles 생성 (StaticFiles는 필요할 때만 import)"""
+    from fastapi.staticfiles import StaticFiles
+
+    class CachedStaticFiles(StaticFiles):
+        async def get_response(self, path: str, scope):
+            response = await super().get_response(path, scope)
+            if response.status_code == 200:
+                response.headers["Cache-Control"] = (
+                    STATIC_IMMUTABLE_CACHE_CONTROL
+                    if _HASHED_ASSET_RE.search(path)
+                    else STATIC_DEFAULT_CACHE_CONTROL
+                )
+            return response
+
+    return CachedStaticFiles(directory=directory)
+
+
+# 헬스 체크 본문 캐시: (상태 키, 직렬화된 본문)
+_health_body: Tuple[Tuple, bytes] = ((), b"")
+
+
+def _health_bytes() -> bytes:
+    """헬스 체크 JSON 본문 (상태 값이 바뀔 때만 직렬화, 프로브마다 dict 생성 없음)"""
+    global _health_body
+    key = (state.is_running, state.sync_in_progress, state.last_sync_time_iso, state.error_message)
+    if _health_body[0] != key:
+        _health_body = (
+            key,
+            _dumps(
+                {
+                    "status": "healthy" if state.is_running else "unhealthy",
+                    "sync_in_progress": state.sync_in_progress,
+                    "last_sync_time": state.last_sync_time_iso,
+                    "error": state.error_message,
+                }
+            ),
+        )
+    return _health_body[1]
+
+
+# 진행 중인 조회 태스크: (함수, 인자) -> Task
+_inflight: Dict[Tuple, "asyncio.Task"] = {}
+
+
+async def _singleflight(fn, *args) -> Any:
+    """동일 (fn, args)의 동시 요청은 첫 요청의 워커 스레드 결과를 공유
+
+    뒤따르는 요청이 워커 스레드를 점유한 채 캐시 락을 기다리지 않도록
+    이벤트 루프에서 합친다. 한 클라이언트의 취소가 다른 대기자에 전파되지 않도록 shield.
+    """
+    key = (fn, *args)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(fn, *args))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
 
 
 # =============================================================================
@@ -617,11 +1464,20 @@ async def lifespan(app: FastAPI):
     # Startup
     state.is_running = True
     state.config = WebConfig()
+    # 설정된 크기로 로그 버퍼 상한 적용 (기존 로그 유지)
+    state.log_buffer = deque(state.log_buffer, maxlen=state.config.log_buffer_size)
+
+    state.sync_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync")
+    state.loop = asyncio.get_running_loop()
 
     # 로그 핸들러 등록
     ws_handler = WebSocketLogHandler(state)
+    ws_handler.start()
     logging.getLogger("archive_analyzer").addHandler(ws_handler)
 
+    # 매칭 쿼리용 인덱스는 요청 경로가 아닌 시작 시 1회만 확인 (조회는 읽기 전용 연결)
+    await asyncio.to_thread(_ensure_indexes, state.config.archive_db)
+
     logger.info(f"Web 모니터링 서버 시작: http://{state.config.host}:{state.config.port}")
 
     yield
@@ -629,6 +1485,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     state.is_running = False
     logger.info("Web 모니터링 서버 종료")
+    logging.getLogger("archive_analyzer").removeHandler(ws_handler)
+    await ws_handler.stop()
+    state.sync_executor.shutdown(wait=False, cancel_futures=True)
+    state.sync_executor = None
+    state.loop = None
+    close_pool()
 
 
 def create_app() -> FastAPI:
@@ -638,21 +1500,42 @@ def create_app() -> FastAPI:
         description="NAS 자동 동기화 모니터링 대시보드",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
+    # JSON/대시보드 HTML 응답 압축 (폴링 트래픽 절감)
+    app.add_middleware(GZipMiddleware, minimum_size=512)
+
     # 템플릿 및 정적 파일
     templates_dir = Path(__file__).parent / "templates"
     static_dir = Path(__file__).parent / "static"
     dashboard_template = templates_dir / "dashboard.html"
 
     # 템플릿 파일이 실제로 존재하는지 확인
-    if dashboard_template.exists():
+    has_dashboard_template = dashboard_template.exists()
+    template_names = [
+        name for name in ("dashboard.html", "_history_rows.html")
+        if (templates_dir / name).exists()
+    ]
+
+    # 대시보드/부분 템플릿(htmx swap 용 HTML 조각) 공용 인스턴스
+    # Jinja2는 템플릿이 있을 때만 import (내장 대시보드만 쓰는 배포의 기동 시간 단축)
+    templates = None
+    if template_names:
+        from fastapi.templating import Jinja2Templates
+
+        # 배포 후 템플릿은 바뀌지 않으므로 렌더링마다 파일 stat 하지 않도록 auto_reload 해제
         templates = Jinja2Templates(directory=str(templates_dir))
-    else:
-        templates = None
+        templates.env.auto_reload = False
+        for template_name in template_names:
+            templates.get_template(template_name)  # 기동 시 1회 컴파일
+    app.state.templates = templates
 
     if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+        app.mount("/static", _make_static_files(str(static_dir)), name="static")
+
+    # 초기 데이터 인라인 대시보드 캐시: 대시보드 ETag -> (본문, gzip 본문), 최신 1개만 유지
+    embedded_pages: Dict[str, Tuple[bytes, bytes]] = {}
 
     # ==========================================================================
     # Routes
@@ -661,28 +1544,60 @@ def create_app() -> FastAPI:
     @app.get("/", response_class=HTMLResponse)
     async def dashboard(request: Request):
         """메인 대시보드"""
-        if templates:
+        if has_dashboard_template:
+            # 블로킹 SQLite 조회는 워커 스레드에서 병렬 실행
+            archive_stats, pokervod_stats = await asyncio.gather(
+                asyncio.to_thread(get_db_stats, state.config.archive_db),
+                asyncio.to_thread(get_db_stats, state.config.pokervod_db),
+            )
             return templates.TemplateResponse(
+                request,
                 "dashboard.html",
                 {
-                    "request": request,
                     "state": state,
-                    "archive_stats": get_db_stats(state.config.archive_db),
-                    "pokervod_stats": get_db_stats(state.config.pokervod_db),
+                    "archive_stats": archive_stats,
+                    "pokervod_stats": pokervod_stats,
                 },
             )
-        else:
-            return get_embedded_dashboard()
+        accept_encoding = request.headers.get("accept-encoding", "")
+        archive_db, pokervod_db = state.config.archive_db, state.config.pokervod_db
+        etag = _dashboard_etag(archive_db, pokervod_db)
+        # 인라인 데이터가 같으면 재방문 시 본문 없이 304
+        page_etag = _make_etag("index", etag)
+        if request.headers.get("if-none-match") == page_etag:
+            return Response(
+                status_code=304,
+                headers={"ETag": page_etag, "Cache-Control": API_CACHE_CONTROL},
+            )
+        page = embedded_pages.get(etag)
+        if page is None:
+            # 첫 화면 데이터(대시보드 + 매칭 1페이지)를 인라인해 초기 fetch 제거
+            bundle, matching = await asyncio.gather(
+                _singleflight(get_dashboard_bundle, archive_db, pokervod_db),
+                _singleflight(
+                    get_matching_items, archive_db, pokervod_db,
+                    1, EMBEDDED_MATCHING_PER_PAGE, None, "id", "asc",
+                ),
+            )
+            body = render_embedded_dashboard(
+                {
+                    "dashboard": build_dashboard_payload(
+                        bundle["db_stats"], bundle["matching_summary"]
+                    ),
+                    "matching": build_matching_payload(
+                        matching, 1, EMBEDDED_MATCHING_PER_PAGE
+                    ),
+                }
+            )
+            page = (body, gzip.compress(body))
+            embedded_pages.clear()
+            embedded_pages[etag] = page
+        return get_embedded_dashboard(accept_encoding, page, page_etag)
 
     @app.get("/health")
     async def health_check():
         """헬스 체크"""
-        return {
-            "status": "healthy" if state.is_running else "unhealthy",
-            "sync_in_progress": state.sync_in_progress,
-            "last_sync_time": state.last_sync_time.isoformat() if state.last_sync_time else None,
-            "error": state.error_message,
-        }
+        return Response(_health_bytes(), media_type="application/json")
 
     @app.get("/api/status")
     async def get_status():
@@ -690,7 +1605,7 @@ def create_app() -> FastAPI:
         return {
             "is_running": state.is_running,
             "sync_in_progress": state.sync_in_progress,
-            "last_sync_time": state.last_sync_time.isoformat() if state.last_sync_time else None,
+            "last_sync_time": state.last_sync_time_iso,
             "last_sync_result": state.last_sync_result,
             "error_message": state.error_message,
             "config": {
@@ -702,42 +1617,76 @@ def create_app() -> FastAPI:
         }
 
     @app.get("/api/stats")
-    async def get_stats():
+    async def get_stats(request: Request):
         """DB 통계 조회"""
-        return {
-            "archive": get_db_stats(state.config.archive_db),
-            "pokervod": get_db_stats(state.config.pokervod_db),
-        }
+        archive_db, pokervod_db = state.config.archive_db, state.config.pokervod_db
+        etag = _make_etag(
+            "stats", _db_signature(archive_db), _db_signature(pokervod_db)
+        )
+        return await _conditional_json(
+            request,
+            etag,
+            lambda: asyncio.to_thread(get_both_db_stats, archive_db, pokervod_db),
+        )
 
     @app.get("/api/history")
-    async def get_history(limit: int = 50):
+    async def get_history(request: Request, limit: int = 50):
         """파일 변경 이력 조회"""
-        return {
-            "history": get_file_history(state.config.archive_db, limit),
-        }
+        archive_db = state.config.archive_db
+        etag = _make_etag("history", _db_signature(archive_db), limit)
+
+        async def build():
+            history = await asyncio.to_thread(get_file_history, archive_db, limit)
+            return {"history": history}
+
+        return await _conditional_json(request, etag, build)
+
+    @app.get("/api/history.html", response_class=HTMLResponse)
+    async def get_history_html(request: Request, limit: int = 50):
+        """파일 변경 이력 (서버 렌더링 HTML 행, ETag 기반 304)"""
+        if templates is None:
+            return HTMLResponse(status_code=404)
+        archive_db = state.config.archive_db
+        # /api/history와 같이 DB 시그니처 기반 (외부 프로세스의 이력 기록도 반영)
+        max_id = await asyncio.to_thread(get_history_max_id, archive_db)
+        etag = _make_etag("history.html", _db_signature(archive_db), max_id, limit)
+        headers = {"ETag": etag, "Cache-Control": API_CACHE_CONTROL}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+
+        history = [
+            {
+                **item,
+                "event_class": HISTORY_EVENT_CLASSES.get(
+                    item["event_type"], DEFAULT_EVENT_CLASS
+                ),
+            }
+            for item in await asyncio.to_thread(get_file_history, archive_db, limit)
+        ]
+        return templates.TemplateResponse(
+            request, "_history_rows.html", {"history": history}, headers=headers
+        )
 
     @app.post("/api/sync")
-    async def trigger_sync(background_tasks: BackgroundTasks):
+    async def trigger_sync():
         """수동 동기화 트리거"""
-        if state.sync_in_progress:
-            return JSONResponse(
+        if submit_sync_job(run_sync_task) is None:
+            return FastJSONResponse(
                 status_code=409,
                 content={"error": "동기화가 이미 진행 중입니다"},
             )
 
-        background_tasks.add_task(run_sync_task)
         return {"message": "동기화 시작됨", "status": "started"}
 
     @app.post("/api/reconcile")
-    async def trigger_reconcile(background_tasks: BackgroundTasks, dry_run: bool = True):
+    async def trigger_reconcile(dry_run: bool = True):
         """정합성 검증 트리거"""
-        if state.sync_in_progress:
-            return JSONResponse(
+        if submit_sync_job(run_reconcile_task, dry_run) is None:
+            return FastJSONResponse(
                 status_code=409,
                 content={"error": "다른 작업이 진행 중입니다"},
             )
 
-        background_tasks.add_task(run_reconcile_task, dry_run)
         return {
             "message": "정합성 검증 시작됨",
             "status": "started",
@@ -747,91 +1696,137 @@ def create_app() -> FastAPI:
     @app.get("/api/logs")
     async def get_logs(limit: int = 100):
         """최근 로그 조회"""
-        logs = list(state.log_buffer)[-limit:]
+        # 뒤에서부터 limit개만 순회 (버퍼 전체 리스트 복사 없이 O(limit))
+        logs = list(itertools.islice(reversed(state.log_buffer), max(0, limit)))
+        logs.reverse()
         return {"logs": logs}
 
+    @app.get("/api/logs/stream")
+    async def stream_logs(request: Request):
+        """로그 실시간 스트리밍 (SSE, /ws/logs와 같은 메시지 형식)
+
+        브라우저 EventSource가 재연결과 Last-Event-ID 전송을 자동 처리하므로
+        끊긴 동안의 로그는 버퍼에 남아 있는 범위에서 이어서 전송한다.
+        """
+        last_event_id = request.headers.get("last-event-id")
+
+        async def events():
+            # 백로그 스냅샷과 구독 등록 사이에 await가 없어 중복/누락 없음
+            queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=SSE_QUEUE_MAX_EVENTS)
+            backlog, backlog_seq = _log_backlog(last_event_id), state.log_seq
+            state.log_streams.add(queue)
+            try:
+                # 재연결 간격을 클라이언트마다 분산 (동시 재접속 방지)
+                yield f"retry: {random.randint(1000, 5000)}\n\n"
+                yield _sse_event(_status_message())
+                if backlog:
+                    message = _dumps({"type": "log", "data": backlog}).decode("utf-8")
+                    yield _sse_event(message, backlog_seq)
+                while True:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": keepalive\n\n"
+                        continue
+                    if event is None:
+                        # 전송이 밀려 구독 해제됨 → 응답 종료 (클라이언트가 이어서 재연결)
+                        return
+                    yield event
+            finally:
+                state.log_streams.discard(queue)
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     # =========================================================================
     # Issue #45: 1:1 매칭 API
     # =========================================================================
 
     @app.get("/api/dashboard")
-    async def get_dashboard():
+    async def get_dashboard(request: Request):
         """통합 대시보드 데이터 (PRD 7.2)"""
-        archive_stats = get_db_stats(state.config.archive_db)
-        pokervod_stats = get_db_stats(state.config.pokervod_db)
+        archive_db, pokervod_db = state.config.archive_db, state.config.pokervod_db
+        etag = _dashboard_etag(archive_db, pokervod_db)
 
-        # 매칭 요약 계산
-        matching_summary = get_matching_summary(
-            state.config.archive_db, state.config.pokervod_db
-        )
+        async def build():
+            bundle = await _singleflight(get_dashboard_bundle, archive_db, pokervod_db)
+            return build_dashboard_payload(bundle["db_stats"], bundle["matching_summary"])
 
-        return {
-            "source": {
-                "name": "NAS 아카이브",
-                "db_path": state.config.archive_db,
-                "total_files": archive_stats.get("total_files", 0),
-                "by_type": archive_stats.get("by_type", {}),
-                "db_size_mb": archive_stats.get("db_size_mb", 0),
-            },
-            "target": {
-                "name": "OTT 플랫폼",
-                "db_path": state.config.pokervod_db,
-                "total_files": pokervod_stats.get("total_files", 0),
-                "by_format": pokervod_stats.get("by_type", {}),
-                "excluded": {
-                    "non_hls": matching_summary.get("not_synced", 0),
-                    "duplicates": matching_summary.get("duplicates", 0),
-                },
-            },
-            "sync_status": {
-                "is_running": state.sync_in_progress,
-                "last_sync_time": state.last_sync_time.isoformat() if state.last_sync_time else None,
-                "last_result": state.last_sync_result,
-            },
-            "catalogs": matching_summary.get("catalogs", []),
-        }
+        return await _conditional_json(request, etag, build)
 
     @app.get("/api/matching")
     async def get_matching(
+        request: Request,
         page: int = 1,
         per_page: int = 20,
         status: Optional[str] = None,
+        sort_by: str = "id",
+        order: str = "asc",
     ):
         """1:1 매칭 테이블 데이터 (PRD 7.3)"""
-        items, total, summary = get_matching_items(
-            state.config.archive_db,
-            state.config.pokervod_db,
-            page=page,
-            per_page=per_page,
-            status_filter=status,
+        archive_db, pokervod_db = state.config.archive_db, state.config.pokervod_db
+        # 캐시 키가 임의 값으로 늘어나지 않도록 getter 호출 전에 보정
+        page, per_page, status, sort_by, order = normalize_matching_params(
+            page, per_page, status, sort_by, order
         )
 
-        return {
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-            "items": items,
-            "summary": summary,
-        }
+        async def build():
+            result = await _singleflight(
+                get_matching_items,
+                archive_db,
+                pokervod_db,
+                page,
+                per_page,
+                status,
+                sort_by,
+                order,
+            )
+            return build_matching_payload(result, page, per_page)
+
+        etag = _make_etag(
+            "matching",
+            _db_signature(archive_db),
+            _db_signature(pokervod_db),
+            page,
+            per_page,
+            status,
+            sort_by,
+            order,
+        )
+        return await _conditional_json(
+            request, etag, build, stream=per_page > MATCHING_STREAM_THRESHOLD
+        )
 
     @app.get("/api/matching/tree")
-    async def get_matching_tree():
+    async def get_matching_tree(request: Request):
         """트리 구조 매칭 데이터 (PRD 7.4)"""
-        catalogs = get_catalog_tree(
-            state.config.archive_db, state.config.pokervod_db
+        archive_db, pokervod_db = state.config.archive_db, state.config.pokervod_db
+        etag = _make_etag(
+            "tree", _db_signature(archive_db), _db_signature(pokervod_db)
         )
-        return {"catalogs": catalogs}
+
+        async def build():
+            catalogs = await _singleflight(get_catalog_tree, archive_db, pokervod_db)
+            return {"catalogs": catalogs}
+
+        return await _conditional_json(request, etag, build)
 
     @app.websocket("/ws/logs")
     async def websocket_logs(websocket: WebSocket):
-        """로그 실시간 스트리밍 (WebSocket)"""
+        """로그 실시간 스트리밍 및 상태 변경 푸시 (WebSocket)"""
         await websocket.accept()
-        state.connected_clients.append(websocket)
+        state.connected_clients.add(websocket)
 
         try:
-            # 기존 로그 전송
-            for log in state.log_buffer:
-                await websocket.send_text(log)
+            # 현재 상태 후 기존 로그 전송 (로그는 단일 프레임)
+            await websocket.send_text(_status_message())
+            if state.log_buffer:
+                await websocket.send_text(
+                    _dumps({"type": "log", "data": list(state.log_buffer)}).decode("utf-8")
+                )
 
             # 연결 유지
             while True:
@@ -839,15 +1834,28 @@ def create_app() -> FastAPI:
         except WebSocketDisconnect:
             pass
         finally:
-            if websocket in state.connected_clients:
-                state.connected_clients.remove(websocket)
+            state.connected_clients.discard(websocket)
+
+    @app.websocket("/ws/dashboard")
+    async def websocket_dashboard(websocket: WebSocket):
+        """대시보드 데이터 푸시 (이 프로세스의 동기화 완료 시 전송)"""
+        await websocket.accept()
+        state.dashboard_subscribers.add(websocket)
+
+        try:
+            # 연결 유지
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            state.dashboard_subscribers.discard(websocket)
 
     return app
 
 
-def get_embedded_dashboard() -> HTMLResponse:
-    """내장 대시보드 HTML (Issue #45: 1:1 매칭 UI)"""
-    html = """
+# 내장 대시보드 HTML (Issue #45: 1:1 매칭 UI)
+EMBEDDED_DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -868,6 +1876,7 @@ def get_embedded_dashboard() -> HTMLResponse:
         .badge-synced { background: #166534; color: #86efac; }
         .badge-not-synced { background: #991b1b; color: #fca5a5; }
         .badge-duplicate { background: #854d0e; color: #fde047; }
+        dialog::backdrop { background: rgba(0, 0, 0, 0.5); }
     </style>
 </head>
 <body class="bg-gray-900 text-gray-100 min-h-screen">
@@ -908,6 +1917,7 @@ def get_embedded_dashboard() -> HTMLResponse:
                 <div class="text-xs text-gray-500 mb-1">pokervod.db</div>
                 <div id="target-count" class="text-2xl font-bold text-green-400">-</div>
                 <div class="text-xs text-gray-400">HLS 등록</div>
+                <div id="summary-counts" class="text-xs text-gray-500 mt-1"></div>
             </div>
 
             <!-- Actions -->
@@ -928,6 +1938,9 @@ def get_embedded_dashboard() -> HTMLResponse:
             <button id="tab-tree" onclick="showTab('tree')" class="px-4 py-2 text-gray-400 hover:text-gray-200">
                 🌳 카탈로그 트리
             </button>
+            <button id="tab-history" onclick="showTab('history')" class="px-4 py-2 text-gray-400 hover:text-gray-200">
+                🕘 변경 이력
+            </button>
             <button id="tab-logs" onclick="showTab('logs')" class="px-4 py-2 text-gray-400 hover:text-gray-200">
                 📜 로그
             </button>
@@ -978,6 +1991,44 @@ def get_embedded_dashboard() -> HTMLResponse:
             <div id="tree-container">
                 <div class="text-gray-500">로딩 중...</div>
             </div>
+            <template id="tpl-catalog">
+                <div class="mb-4">
+                    <div class="catalog-header flex items-center gap-2 cursor-pointer hover:bg-gray-700/50 p-2 rounded">
+                        <span>📂</span>
+                        <span class="name font-medium"></span>
+                        <span class="count text-sm text-gray-400"></span>
+                        <span class="synced text-xs text-green-500"></span>
+                        <span class="not-synced text-xs text-red-500"></span>
+                    </div>
+                    <div class="files hidden ml-6 border-l border-gray-700 pl-4"></div>
+                </div>
+            </template>
+            <template id="tpl-file">
+                <div class="flex items-center gap-2 text-sm py-1">
+                    <span class="status"></span>
+                    <span class="name text-gray-300"></span>
+                    <span class="size text-xs text-gray-600"></span>
+                </div>
+            </template>
+        </div>
+
+        <!-- Tab Content: File History (서버 렌더링 행, /api/history.html) -->
+        <div id="content-history" class="bg-gray-800 rounded-lg p-4 hidden">
+            <div class="overflow-x-auto">
+                <table class="w-full matching-table">
+                    <thead>
+                        <tr class="text-left border-b border-gray-700 text-gray-400">
+                            <th class="px-3 pb-2 w-40">시각</th>
+                            <th class="px-3 pb-2 w-24">이벤트</th>
+                            <th class="px-3 pb-2">파일</th>
+                            <th class="px-3 pb-2">경로</th>
+                        </tr>
+                    </thead>
+                    <tbody id="history-body">
+                        <tr><td colspan="4" class="py-8 text-center text-gray-500">로딩 중...</td></tr>
+                    </tbody>
+                </table>
+            </div>
         </div>
 
         <!-- Tab Content: Logs -->
@@ -994,88 +2045,129 @@ def get_embedded_dashboard() -> HTMLResponse:
         </div>
     </div>
 
+    <!-- confirm()/alert() 대체: 모달이 떠 있어도 메인 스레드(소켓 수신)는 멈추지 않음 -->
+    <dialog id="confirm-dlg" class="bg-gray-800 text-gray-100 rounded-lg p-4 w-80">
+        <form method="dialog">
+            <p class="message text-sm mb-4"></p>
+            <div class="flex justify-end gap-2">
+                <button value="cancel" class="cancel text-sm bg-gray-700 hover:bg-gray-600 px-3 py-1 rounded">취소</button>
+                <button value="ok" class="text-sm bg-blue-600 hover:bg-blue-700 px-3 py-1 rounded">확인</button>
+            </div>
+        </form>
+    </dialog>
+
     <script>
         let currentPage = 1;
         const perPage = 20;
+        const DASHBOARD_POLL_MS = 30000;
+
+        // 같은 종류의 요청이 겹치면 이전 요청을 취소 (네트워크 지연 시 요청 누적 방지)
+        const inflight = {};
+        function fetchLatest(key, url) {
+            inflight[key]?.abort();
+            const ctrl = new AbortController();
+            inflight[key] = ctrl;
+            return fetch(url, { signal: ctrl.signal });
+        }
+
+        // 비차단 모달: confirm이면 확인 여부, 아니면 닫힐 때 resolve
+        function showDialog(message, { confirm = false } = {}) {
+            const dlg = document.getElementById('confirm-dlg');
+            dlg.querySelector('.message').textContent = message;
+            dlg.querySelector('.cancel').hidden = !confirm;
+            dlg.returnValue = '';
+            dlg.showModal();
+            return new Promise(resolve => dlg.addEventListener(
+                'close', () => resolve(dlg.returnValue === 'ok'), { once: true }));
+        }
 
         // Tab switching
         function showTab(tab) {
-            ['table', 'tree', 'logs'].forEach(t => {
+            ['table', 'tree', 'history', 'logs'].forEach(t => {
                 document.getElementById('content-' + t).classList.toggle('hidden', t !== tab);
                 document.getElementById('tab-' + t).classList.toggle('tab-active', t === tab);
                 document.getElementById('tab-' + t).classList.toggle('text-gray-400', t !== tab);
             });
             if (tab === 'tree') loadTree();
+            if (tab === 'history') loadHistory();
         }
 
         // Load dashboard summary
+        function renderDashboard(data) {
+            document.getElementById('source-count').textContent = data.source?.total_files || 0;
+            document.getElementById('target-count').textContent = data.target?.total_files || 0;
+            const counts = data.summary_counts || {};
+            document.getElementById('summary-counts').textContent =
+                `대기 ${counts.pending_sync || 0} · HLS 비호환 ${counts.hls_incompatible || 0} · 중복 ${counts.duplicate_excluded || 0}`;
+            if (data.sync_status?.last_sync_time) {
+                document.getElementById('last-sync').textContent =
+                    '마지막: ' + new Date(data.sync_status.last_sync_time).toLocaleString('ko-KR');
+            }
+        }
+
         async function loadDashboard() {
             try {
-                const res = await fetch('/api/dashboard');
-                const data = await res.json();
-                document.getElementById('source-count').textContent = data.source?.total_files || 0;
-                document.getElementById('target-count').textContent = data.target?.total_files || 0;
-                if (data.sync_status?.last_sync_time) {
-                    document.getElementById('last-sync').textContent =
-                        '마지막: ' + new Date(data.sync_status.last_sync_time).toLocaleString('ko-KR');
-                }
+                const res = await fetchLatest('dashboard', '/api/dashboard');
+                renderDashboard(await res.json());
             } catch (e) {
-                console.error('Dashboard load error:', e);
+                if (e.name !== 'AbortError') console.error('Dashboard load error:', e);
             }
         }
 
         // Load matching table
+        function renderMatching(data) {
+            // Summary
+            const sum = data.summary || {};
+            document.getElementById('matching-summary').innerHTML =
+                `✅ ${sum.synced || 0} | ❌ ${sum.not_synced || 0} | ⚠️ ${sum.synced_with_duplicates || 0}`;
+
+            // Pagination
+            document.getElementById('pagination-info').textContent =
+                `${data.total}개 중 ${(currentPage-1)*perPage + 1}-${Math.min(currentPage*perPage, data.total)}`;
+
+            // Table
+            const tbody = document.getElementById('matching-body');
+            if (!data.items || data.items.length === 0) {
+                tbody.innerHTML = '<tr><td colspan="4" class="py-8 text-center text-gray-500">데이터 없음</td></tr>';
+                return;
+            }
+
+            tbody.innerHTML = data.items.map(item => {
+                const statusBadge = getStatusBadge(item.status);
+                const source = item.source || {};
+                const target = item.target;
+                const size = formatSize(source.size_bytes);
+
+                return `
+                    <tr class="border-b border-gray-700/50 hover:bg-gray-700/30">
+                        <td class="py-2">${statusBadge}</td>
+                        <td class="py-2">
+                            <div class="text-sm">${source.filename || '-'}</div>
+                            <div class="text-xs text-gray-500">${source.path || ''}</div>
+                            <div class="text-xs text-gray-600">${size} | ${item.is_hls_compatible ? 'HLS ✓' : 'HLS ✗'}</div>
+                            ${item.duplicates?.length ? `<div class="text-xs text-yellow-600">+${item.duplicates.length} 중복</div>` : ''}
+                        </td>
+                        <td class="py-2">
+                            ${target ? `
+                                <div class="text-sm text-green-400">${target.filename}</div>
+                                <div class="text-xs text-gray-500">${target.nas_path || ''}</div>
+                            ` : `<span class="text-gray-600">${item.is_hls_compatible ? '미동기화' : 'HLS 비호환'}</span>`}
+                        </td>
+                        <td class="py-2 text-gray-500">${target?.id || '-'}</td>
+                    </tr>
+                `;
+            }).join('');
+        }
+
         async function loadMatching() {
             try {
                 const status = document.getElementById('status-filter').value;
                 const url = `/api/matching?page=${currentPage}&per_page=${perPage}` +
                            (status ? `&status=${status}` : '');
-                const res = await fetch(url);
-                const data = await res.json();
-
-                // Summary
-                const sum = data.summary || {};
-                document.getElementById('matching-summary').innerHTML =
-                    `✅ ${sum.synced || 0} | ❌ ${sum.not_synced || 0} | ⚠️ ${sum.synced_with_duplicates || 0}`;
-
-                // Pagination
-                document.getElementById('pagination-info').textContent =
-                    `${data.total}개 중 ${(currentPage-1)*perPage + 1}-${Math.min(currentPage*perPage, data.total)}`;
-
-                // Table
-                const tbody = document.getElementById('matching-body');
-                if (!data.items || data.items.length === 0) {
-                    tbody.innerHTML = '<tr><td colspan="4" class="py-8 text-center text-gray-500">데이터 없음</td></tr>';
-                    return;
-                }
-
-                tbody.innerHTML = data.items.map(item => {
-                    const statusBadge = getStatusBadge(item.status);
-                    const source = item.source || {};
-                    const target = item.target;
-                    const size = formatSize(source.size_bytes);
-
-                    return `
-                        <tr class="border-b border-gray-700/50 hover:bg-gray-700/30">
-                            <td class="py-2">${statusBadge}</td>
-                            <td class="py-2">
-                                <div class="text-sm">${source.filename || '-'}</div>
-                                <div class="text-xs text-gray-500">${source.path || ''}</div>
-                                <div class="text-xs text-gray-600">${size} | ${item.is_hls_compatible ? 'HLS ✓' : 'HLS ✗'}</div>
-                                ${item.duplicates?.length ? `<div class="text-xs text-yellow-600">+${item.duplicates.length} 중복</div>` : ''}
-                            </td>
-                            <td class="py-2">
-                                ${target ? `
-                                    <div class="text-sm text-green-400">${target.filename}</div>
-                                    <div class="text-xs text-gray-500">${target.nas_path || ''}</div>
-                                ` : `<span class="text-gray-600">${item.is_hls_compatible ? '미동기화' : 'HLS 비호환'}</span>`}
-                            </td>
-                            <td class="py-2 text-gray-500">${target?.id || '-'}</td>
-                        </tr>
-                    `;
-                }).join('');
+                const res = await fetchLatest('matching', url);
+                renderMatching(await res.json());
             } catch (e) {
-                console.error('Matching load error:', e);
+                if (e.name !== 'AbortError') console.error('Matching load error:', e);
             }
         }
 
@@ -1101,6 +2193,16 @@ def get_embedded_dashboard() -> HTMLResponse:
             loadMatching();
         }
 
+        // Load file history: 서버가 렌더링한 <tr> 조각을 그대로 삽입 (ETag 재검증으로 변경 없으면 304)
+        async function loadHistory() {
+            try {
+                const res = await fetchLatest('history', '/api/history.html');
+                if (res.ok) document.getElementById('history-body').innerHTML = await res.text();
+            } catch (e) {
+                if (e.name !== 'AbortError') console.error('History load error:', e);
+            }
+        }
+
         // Load tree view
         async function loadTree() {
             try {
@@ -1113,50 +2215,50 @@ def get_embedded_dashboard() -> HTMLResponse:
                     return;
                 }
 
-                container.innerHTML = data.catalogs.map(cat => `
-                    <div class="mb-4">
-                        <div class="flex items-center gap-2 cursor-pointer hover:bg-gray-700/50 p-2 rounded"
-                             onclick="toggleCatalog('${cat.name}')">
-                            <span id="icon-${cat.name}">📂</span>
-                            <span class="font-medium">${cat.name}</span>
-                            <span class="text-sm text-gray-400">(${cat.total_files} 파일)</span>
-                            <span class="text-xs text-green-500">✅ ${cat.synced}</span>
-                            <span class="text-xs text-red-500">❌ ${cat.not_synced}</span>
-                        </div>
-                        <div id="files-${cat.name}" class="hidden ml-6 border-l border-gray-700 pl-4">
-                            ${cat.files.slice(0, 20).map(f => `
-                                <div class="flex items-center gap-2 text-sm py-1">
-                                    <span>${f.status === 'synced' ? '✅' : '❌'}</span>
-                                    <span class="text-gray-300">${f.name}</span>
-                                    <span class="text-xs text-gray-600">${formatSize(f.size_bytes)}</span>
-                                </div>
-                            `).join('')}
-                            ${cat.files.length > 20 ? `<div class="text-xs text-gray-500">... 외 ${cat.files.length - 20}개</div>` : ''}
-                        </div>
-                    </div>
-                `).join('');
+                // <template> 복제 + textContent: 행마다 HTML 파싱 없이 노드 생성 (이스케이프 불필요)
+                const catalogTpl = document.getElementById('tpl-catalog').content.firstElementChild;
+                const fileTpl = document.getElementById('tpl-file').content.firstElementChild;
+                const fragment = document.createDocumentFragment();
+                for (const cat of data.catalogs) {
+                    const node = catalogTpl.cloneNode(true);
+                    node.querySelector('.name').textContent = cat.name;
+                    node.querySelector('.count').textContent = `(${cat.total_files} 파일)`;
+                    node.querySelector('.synced').textContent = `✅ ${cat.synced}`;
+                    node.querySelector('.not-synced').textContent = `❌ ${cat.not_synced}`;
+                    const files = node.querySelector('.files');
+                    node.querySelector('.catalog-header').addEventListener(
+                        'click', () => files.classList.toggle('hidden'));
+                    for (const f of cat.files.slice(0, 20)) {
+                        const row = fileTpl.cloneNode(true);
+                        row.querySelector('.status').textContent = f.status === 'synced' ? '✅' : '❌';
+                        row.querySelector('.name').textContent = f.name;
+                        row.querySelector('.size').textContent = formatSize(f.size_bytes);
+                        files.appendChild(row);
+                    }
+                    if (cat.files.length > 20) {
+                        const more = document.createElement('div');
+                        more.className = 'text-xs text-gray-500';
+                        more.textContent = `... 외 ${cat.files.length - 20}개`;
+                        files.appendChild(more);
+                    }
+                    fragment.appendChild(node);
+                }
+                container.replaceChildren(fragment);
             } catch (e) {
                 console.error('Tree load error:', e);
             }
         }
 
-        function toggleCatalog(name) {
-            const files = document.getElementById('files-' + name);
-            const icon = document.getElementById('icon-' + name);
-            files.classList.toggle('hidden');
-            icon.textContent = files.classList.contains('hidden') ? '📂' : '📂';
-        }
-
         // Actions
         async function triggerSync() {
-            if (!confirm('동기화를 시작하시겠습니까?')) return;
+            if (!await showDialog('동기화를 시작하시겠습니까?', { confirm: true })) return;
             try {
                 const res = await fetch('/api/sync', { method: 'POST' });
                 const data = await res.json();
-                alert(data.message || data.error);
+                showDialog(data.message || data.error);
                 loadDashboard();
             } catch (e) {
-                alert('Error: ' + e.message);
+                showDialog('Error: ' + e.message);
             }
         }
 
@@ -1164,54 +2266,213 @@ def get_embedded_dashboard() -> HTMLResponse:
             document.getElementById('logs').innerHTML = '';
         }
 
-        // WebSocket for logs
+        // 재연결 지연: 지수 백오프(최대 30초) + full jitter → 서버 재시작 후 동시 재접속 폭주 방지
+        function reconnectDelay(retry) {
+            return Math.min(30000, 500 * 2 ** retry) * Math.random();
+        }
+
+        // 로그 DOM 갱신: 한 프레임 동안 받은 줄을 모아 rAF에서 한 번에 추가 (레이아웃 1회)
+        const LOG_MAX_LINES = 5000;
+        const LOG_KEEP_LINES = 2000;
+        let pendingLogLines = [];
+        let logFrame = 0;
+        function scheduleLogLines(lines) {
+            pendingLogLines.push(...lines);
+            if (!logFrame) logFrame = requestAnimationFrame(flushLogLines);
+        }
+
+        function flushLogLines() {
+            const logsDiv = document.getElementById('logs');
+            const fragment = document.createDocumentFragment();
+            for (const text of pendingLogLines) {
+                const line = document.createElement('div');
+                line.textContent = text;
+                fragment.appendChild(line);
+            }
+            logsDiv.appendChild(fragment);
+            pendingLogLines = [];
+            logFrame = 0;
+            // 오래된 줄은 한도 초과 시 한꺼번에 정리 (매 줄마다 삭제하지 않음)
+            if (logsDiv.childElementCount > LOG_MAX_LINES) {
+                while (logsDiv.childElementCount > LOG_KEEP_LINES) logsDiv.firstElementChild.remove();
+            }
+            const container = document.getElementById('log-container');
+            container.scrollTop = container.scrollHeight;
+        }
+
+        // 로그 스트림 메시지 ({type:'log', data} | {type:'status', payload}) - SSE/WebSocket 공통
+        function handleLogMessage(raw) {
+            const msg = JSON.parse(raw);
+            if (msg.type === 'status') {
+                renderStatus(msg.payload);
+                return;
+            }
+            scheduleLogLines(msg.data);
+        }
+
+        // 로그 스트림: SSE 우선 (재연결/Last-Event-ID 이어받기는 브라우저가 처리)
+        function connectLogStream() {
+            if (!window.EventSource) {
+                connectWebSocket();
+                return;
+            }
+            const source = new EventSource('/api/logs/stream');
+            source.onmessage = (event) => handleLogMessage(event.data);
+            source.onerror = () => {
+                // 일시적 오류는 EventSource가 자동 재연결, 영구 실패(CLOSED) 시에만 WebSocket으로 전환
+                if (source.readyState === EventSource.CLOSED) connectWebSocket();
+            };
+        }
+
+        // WebSocket for logs (SSE 미지원/차단 환경 대체 경로)
+        let logSocketRetry = 0;
         function connectWebSocket() {
             const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
             const ws = new WebSocket(`${protocol}//${window.location.host}/ws/logs`);
-            ws.onmessage = (event) => {
-                const logsDiv = document.getElementById('logs');
-                const line = document.createElement('div');
-                line.textContent = event.data;
-                logsDiv.appendChild(line);
-                const container = document.getElementById('log-container');
-                container.scrollTop = container.scrollHeight;
-            };
-            ws.onclose = () => setTimeout(connectWebSocket, 3000);
+            ws.onopen = () => { logSocketRetry = 0; };
+            ws.onmessage = (event) => handleLogMessage(event.data);
+            ws.onclose = () => setTimeout(connectWebSocket, reconnectDelay(logSocketRetry++));
         }
 
-        // Status check
+        // Status: 평소엔 로그 스트림의 status 메시지로 갱신, fetch는 탭 복귀 시 보정용
         async function checkStatus() {
             try {
-                const res = await fetch('/api/status');
-                const data = await res.json();
-                const indicator = document.getElementById('status-indicator');
-                const dot = indicator.querySelector('.status-dot');
-                const text = indicator.querySelector('span:last-child');
-
-                if (data.sync_in_progress) {
-                    dot.className = 'status-dot status-syncing';
-                    text.textContent = '동기화 중...';
-                } else if (data.is_running) {
-                    dot.className = 'status-dot status-running';
-                    text.textContent = '정상 동작 중';
-                } else {
-                    dot.className = 'status-dot status-stopped';
-                    text.textContent = '중지됨';
-                }
+                const res = await fetchLatest('status', '/api/status');
+                renderStatus(await res.json());
             } catch (e) {}
         }
 
-        // Init
-        loadDashboard();
-        loadMatching();
-        connectWebSocket();
-        setInterval(loadDashboard, 30000);
-        setInterval(checkStatus, 5000);
+        function renderStatus(data) {
+            const indicator = document.getElementById('status-indicator');
+            const dot = indicator.querySelector('.status-dot');
+            const text = indicator.querySelector('span:last-child');
+
+            if (data.sync_in_progress) {
+                dot.className = 'status-dot status-syncing';
+                text.textContent = '동기화 중...';
+            } else if (data.is_running) {
+                dot.className = 'status-dot status-running';
+                text.textContent = '정상 동작 중';
+            } else {
+                dot.className = 'status-dot status-stopped';
+                text.textContent = '중지됨';
+            }
+        }
+
+        // 탭이 보일 때만 주기 실행 (숨김 시 타이머 해제, 복귀 시 즉시 1회 실행 후 재개)
+        function startWhenVisible(fn, ms) {
+            let timer = null;
+            const sync = () => {
+                if (document.visibilityState === 'visible') {
+                    if (timer === null) {
+                        fn();
+                        timer = setInterval(fn, ms);
+                    }
+                } else if (timer !== null) {
+                    clearInterval(timer);
+                    timer = null;
+                }
+            };
+            document.addEventListener('visibilitychange', sync);
+            if (document.visibilityState === 'visible') timer = setInterval(fn, ms);
+        }
+
+        // Dashboard push: 이 서버에서 실행한 동기화 완료 시 최신 데이터를 즉시 전송
+        let dashboardSocketOpened = false;
+        let dashboardSocketRetry = 0;
+        function connectDashboardSocket() {
+            const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+            const ws = new WebSocket(`${protocol}//${window.location.host}/ws/dashboard`);
+            ws.onopen = () => {
+                dashboardSocketRetry = 0;
+                // 재연결 시 끊긴 동안의 변경분 반영
+                if (dashboardSocketOpened) loadDashboard();
+                dashboardSocketOpened = true;
+            };
+            ws.onmessage = (event) => refreshViews(JSON.parse(event.data));
+            ws.onclose = () => setTimeout(connectDashboardSocket, reconnectDelay(dashboardSocketRetry++));
+        }
+
+        // 대시보드 데이터가 바뀌면 요약/매칭 테이블/(보이는 경우) 변경 이력을 함께 갱신
+        function refreshViews(data) {
+            renderDashboard(data);
+            loadMatching();
+            if (!document.getElementById('content-history').classList.contains('hidden')) loadHistory();
+        }
+
+        // 다른 프로세스(nas_auto_sync)의 DB 변경은 푸시되지 않으므로 저빈도 재검증으로 반영
+        // (ETag 일치 시 서버는 304만 반환, ETag가 바뀐 경우에만 화면 갱신)
+        let dashboardEtag = null;
+        async function pollDashboard() {
+            try {
+                const res = await fetchLatest('dashboard', '/api/dashboard');
+                const etag = res.headers.get('etag');
+                if (etag && etag === dashboardEtag) return;
+                dashboardEtag = etag;
+                refreshViews(await res.json());
+            } catch (e) {
+                if (e.name !== 'AbortError') console.error('Dashboard poll error:', e);
+            }
+        }
+
+        // Init: 서버가 인라인한 초기 데이터가 있으면 첫 화면은 fetch 없이 렌더링
+        const initialState = window.__INITIAL_STATE__ || {};
+        if (initialState.dashboard) renderDashboard(initialState.dashboard); else loadDashboard();
+        if (initialState.matching) renderMatching(initialState.matching); else loadMatching();
+        connectLogStream();
+        connectDashboardSocket();
+        // 상태는 푸시로 받으므로 폴링은 소켓 유실 대비 저빈도 보정만
+        startWhenVisible(checkStatus, 60000);
+        startWhenVisible(pollDashboard, DASHBOARD_POLL_MS);
     </script>
 </body>
 </html>
     """
-    return HTMLResponse(content=html)
+
+# 정적 HTML이므로 인코딩/gzip 압축은 모듈 로드 시 1회만 수행
+_EMBEDDED_DASHBOARD_BYTES = EMBEDDED_DASHBOARD_HTML.encode("utf-8")
+_EMBEDDED_DASHBOARD_GZIP = gzip.compress(_EMBEDDED_DASHBOARD_BYTES)
+_EMBEDDED_HEAD, _, _EMBEDDED_TAIL = _EMBEDDED_DASHBOARD_BYTES.partition(b"</head>")
+
+# 인라인 초기 데이터의 매칭 테이블 페이지 크기 (JS perPage와 동일)
+EMBEDDED_MATCHING_PER_PAGE = 20
+
+
+def render_embedded_dashboard(initial_state: Dict[str, Any]) -> bytes:
+    """초기 데이터를 window.__INITIAL_STATE__로 </head> 앞에 인라인한 대시보드 HTML"""
+    # 데이터 안의 "</script>"가 스크립트 블록을 닫지 않도록 이스케이프
+    blob = _dumps(initial_state).replace(b"</", b"<\\/")
+    return b"".join(
+        (
+            _EMBEDDED_HEAD,
+            b"<script>window.__INITIAL_STATE__=",
+            blob,
+            b";</script>\n</head>",
+            _EMBEDDED_TAIL,
+        )
+    )
+
+
+def get_embedded_dashboard(
+    accept_encoding: str = "",
+    page: Optional[Tuple[bytes, bytes]] = None,
+    etag: Optional[str] = None,
+) -> Response:
+    """내장 대시보드 응답 (gzip 지원 클라이언트에는 미리 압축한 본문 전송)
+
+    Args:
+        accept_encoding: 요청 Accept-Encoding 헤더
+        page: (본문, gzip 본문). 없으면 초기 데이터 없는 기본 HTML
+        etag: 지정 시 ETag/Cache-Control 헤더 추가 (재검증용)
+    """
+    body, compressed = page or (_EMBEDDED_DASHBOARD_BYTES, _EMBEDDED_DASHBOARD_GZIP)
+    headers = {"Vary": "Accept-Encoding"}
+    if etag is not None:
+        headers.update({"ETag": etag, "Cache-Control": API_CACHE_CONTROL})
+    if "gzip" in accept_encoding:
+        headers["Content-Encoding"] = "gzip"
+        return Response(compressed, media_type="text/html", headers=headers)
+    return HTMLResponse(body, headers=headers)
 
 
 # 기본 앱 인스턴스
@@ -1223,6 +2484,11 @@ app = create_app()
 # =============================================================================
 
 
+# WebSocket 전송 설정 (uvicorn)
+WS_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+WS_PING_INTERVAL_SECONDS = 30.0
+
+
 def main():
     import argparse
 
@@ -1240,11 +2506,20 @@ def main():
 
     args = parser.parse_args()
 
+    # loop/http는 auto: uvicorn[standard]로 설치된 uvloop/httptools를 우선 사용
+    # 동기화 작업/로그 버퍼/WebSocket 목록이 프로세스 상태이므로 워커는 1개로 유지
     uvicorn.run(
         "archive_analyzer.web.app:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        loop="auto",
+        http="auto",
+        workers=1,
+        # 로그 프레임(타임스탬프/레벨 반복)은 deflate 압축 효과가 크므로 명시적으로 유지
+        ws_per_message_deflate=True,
+        ws_max_size=WS_MAX_MESSAGE_BYTES,
+        ws_ping_interval=WS_PING_INTERVAL_SECONDS,
     )
 
 
@@ -1,9 +1,37 @@
 """pytest 설정 파일"""
 
 import sys
+import tempfile
+import uuid
 from pathlib import Path
 
+import pytest
+
 # 프로젝트 src 디렉토리를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(scope="session")
+def tmp_db_root():
+    """세션 공용 임시 DB 디렉토리 (-wal/-shm 부속 파일까지 세션 종료 시 일괄 삭제)"""
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as d:
+        yield Path(d)
+
+
+@pytest.fixture
+def tmp_db_path(tmp_db_root):
+    """테스트별 고유 SQLite 파일 경로 (개별 unlink 불필요)"""
+    return str(tmp_db_root / f"{uuid.uuid4().hex}.db")
+
+
+@pytest.fixture(autouse=True)
+def _clear_module_caches():
+    """테스트 간 모듈 수준 캐시 초기화 (앞 테스트 결과가 다음 테스트에 새지 않도록)"""
+    yield
+    # 이미 import된 경우에만 정리 (fastapi 미설치 환경에서 불필요한 import 방지)
+    web_app = sys.modules.get("archive_analyzer.web.app")
+    if web_app is not None:
+        web_app.invalidate_caches()
+        web_app._history_table_exists.clear()
@@ -203,3 +203,34 @@ class TestServiceUnavailable:
             response = client.get("/search/files?q=test")
 
         assert response.status_code == 503
+
+
+@pytest.mark.skipif(not FASTAPI_AVAILABLE, reason="fastapi 패키지 필요")
+class TestSyncEndpoints:
+    """동기화 엔드포인트 테스트"""
+
+    def test_sync_stats_runs_off_event_loop(self, mock_client, monkeypatch):
+        """SyncService 호출은 전용 동기화 스레드에서 실행"""
+        import threading
+        import archive_analyzer.sync as sync_module
+
+        client, _ = mock_client
+        threads = []
+
+        class FakeSyncService:
+            def get_sync_stats(self):
+                threads.append(threading.current_thread().name)
+                return {
+                    "archive_video_count": 1,
+                    "archive_media_info_count": 2,
+                    "pokervod_file_count": 3,
+                    "pokervod_catalog_count": 4,
+                    "pokervod_subcatalog_count": 5,
+                }
+
+        monkeypatch.setattr(sync_module, "SyncService", FakeSyncService)
+        response = client.get("/sync/stats")
+
+        assert response.status_code == 200
+        assert response.json()["pokervod_file_count"] == 3
+        assert threads[0].startswith("pokervod-sync")
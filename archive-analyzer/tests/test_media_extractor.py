@@ -4,14 +4,10 @@ Issue #8: 미디어 메타데이터 추출기 구현 (FR-002)
 """
 
 import os
-import sys
-import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from archive_analyzer.media_extractor import (
     MediaInfo,
     FFprobeExtractor,
@@ -84,6 +80,20 @@ class TestMediaInfo:
         assert d['resolution_label'] == "1080p"
         assert d['video_codec'] == "h264"
 
+    def test_to_dict_has_all_fields(self):
+        """모든 필드 + 파생 값 포함, datetime은 ISO 문자열"""
+        from dataclasses import fields
+        from datetime import datetime
+
+        info = MediaInfo(extracted_at=datetime(2024, 1, 1, 12, 0, 0))
+        d = info.to_dict()
+        assert set(d) == {f.name for f in fields(MediaInfo)} | {
+            "resolution",
+            "resolution_label",
+            "duration_formatted",
+        }
+        assert d['extracted_at'] == "2024-01-01T12:00:00"
+
 
 class TestFFprobeExtractor:
     """FFprobe 추출기 테스트"""
@@ -188,6 +198,76 @@ class TestFFprobeExtractor:
             assert "File not found" in info.extraction_error
 
 
+class TestSMBDownload:
+    """SMB 분석용 임시 다운로드 테스트"""
+
+    def _extractor(self, data: bytes, tmp_path):
+        import io
+        from contextlib import contextmanager
+
+        connector = MagicMock()
+
+        @contextmanager
+        def open_file(path, mode="rb"):
+            yield io.BytesIO(data)
+
+        connector.open_file = open_file
+        with patch("archive_analyzer.media_extractor.FFprobeExtractor"):
+            return SMBMediaExtractor(connector, temp_dir=str(tmp_path))
+
+    def test_downloads_header_only(self, tmp_path):
+        """큰 파일은 HEADER_SIZE만 다운로드"""
+        data = os.urandom(SMBMediaExtractor.HEADER_SIZE + 1000)
+        extractor = self._extractor(data, tmp_path)
+
+        temp_path = extractor._download_for_analysis("a.mp4", len(data), full_download=False)
+
+        assert Path(temp_path).read_bytes() == data[: SMBMediaExtractor.HEADER_SIZE]
+
+    def test_full_download_in_chunks(self, tmp_path, monkeypatch):
+        """전체 다운로드는 버퍼 크기 단위로 나눠 읽어도 내용 동일"""
+        monkeypatch.setattr(SMBMediaExtractor, "COPY_CHUNK_SIZE", 1000)
+        data = os.urandom(4500)
+        extractor = self._extractor(data, tmp_path)
+
+        temp_path = extractor._download_for_analysis("a.mp4", len(data), full_download=True)
+
+        assert Path(temp_path).read_bytes() == data
+
+
+class TestMediaMetadataExtractor:
+    """일괄 추출기 테스트 (DB/SMB 추출기는 단순 스텁)"""
+
+    def test_progress_callback_per_file(self):
+        """파일마다 진행률 콜백 1회 호출"""
+        from types import SimpleNamespace
+        from archive_analyzer.database import FileRecord
+
+        files = [FileRecord(id=i, path=f"v/{i}.mp4") for i in (1, 2, 3)]
+        inserted = []
+        database = SimpleNamespace(
+            get_files_by_type=lambda file_type, limit: files,
+            get_existing_media_file_ids=lambda ids: {1},
+            insert_media_info=inserted.append,
+        )
+        with patch("archive_analyzer.media_extractor.FFprobeExtractor"):
+            extractor = MediaMetadataExtractor(connector=None, database=database)
+        extractor.smb_extractor = SimpleNamespace(
+            extract=lambda path, file_id: MediaInfo(
+                file_id=file_id, file_path=path, extraction_status="success"
+            )
+        )
+
+        captured = []
+        extractor.set_progress_callback(captured.append)
+        result = extractor.extract_all(parallel=False)
+
+        assert [p.current_file for p in captured] == ["v/2.mp4", "v/3.mp4"]
+        assert captured[-1].processed_files == 3
+        assert [info.file_id for info in inserted] == [2, 3]
+        assert (result["successful"], result["failed"]) == (3, 0)
+
+
 class TestExtractionProgress:
     """추출 진행률 테스트"""
 
@@ -239,15 +319,11 @@ class TestDatabaseMediaInfo:
     """데이터베이스 미디어 정보 테스트"""
 
     @pytest.fixture
-    def db(self):
+    def db(self, tmp_db_path):
         """임시 데이터베이스"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        db = Database(db_path)
+        db = Database(tmp_db_path)
         yield db
         db.close()
-        os.unlink(db_path)
 
     def test_insert_media_info(self, db):
         """미디어 정보 삽입"""
@@ -5,7 +5,6 @@ Issue #17: NAS 신규 데이터 자동 감지 및 DB 등록
 
 import sqlite3
 import sys
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -117,12 +116,12 @@ class TestNASAutoSync:
 
         # Mock DB 설정
         mock_connection = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
-            ("/path/to/file1.mp4",),
-            ("/path/to/file2.mp4",),
-        ]
-        mock_connection.execute.return_value = mock_cursor
+        mock_connection.execute.return_value = iter(
+            [
+                ("/path/to/file1.mp4",),
+                ("\\Path\\To\\File2.mp4",),
+            ]
+        )
 
         mock_database = MagicMock()
         mock_database._get_connection.return_value = mock_connection
@@ -134,6 +133,7 @@ class TestNASAutoSync:
         # 검증
         assert len(paths) == 2
         assert "/path/to/file1.mp4" in paths
+        assert "/path/to/file2.mp4" in paths
 
     def test_incremental_scan_result_aggregation(self):
         """증분 스캔 결과 집계"""
@@ -152,10 +152,9 @@ class TestIntegration:
     """통합 테스트"""
 
     @pytest.fixture
-    def temp_db(self):
+    def temp_db(self, tmp_db_path):
         """임시 DB 생성"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
+        db_path = tmp_db_path
 
         # 스키마 생성
         conn = sqlite3.connect(db_path)
@@ -177,18 +176,7 @@ class TestIntegration:
         conn.commit()
         conn.close()
 
-        yield db_path
-
-        # 정리 (Windows에서 파일 잠금 대기)
-        import gc
-        import time
-
-        gc.collect()
-        time.sleep(0.1)
-        try:
-            Path(db_path).unlink(missing_ok=True)
-        except PermissionError:
-            pass  # Windows에서 파일 잠금 시 무시
+        return db_path
 
     def test_save_batch(self, temp_db):
         """배치 저장 테스트"""
@@ -231,6 +219,36 @@ class TestIntegration:
 
         assert count == 2
 
+    def test_save_batch_counts_ignored_duplicates(self, temp_db):
+        """UNIQUE 제약으로 무시된 행은 skipped로 집계"""
+        from archive_analyzer.database import Database
+
+        config = AutoSyncConfig(archive_db=temp_db)
+        sync = NASAutoSync(config)
+        sync.database = Database(temp_db)
+
+        def record(path):
+            return {
+                "path": path,
+                "filename": Path(path).name,
+                "extension": ".mp4",
+                "size_bytes": 1000,
+                "modified_at": None,
+                "file_type": "video",
+                "parent_folder": "/test",
+                "scan_status": "scanned",
+            }
+
+        sync._save_batch([record("/test/file1.mp4")])
+        result = IncrementalScanResult()
+        inserted = sync._save_batch(
+            [record("/test/file1.mp4"), record("/test/file2.mp4")], result
+        )
+
+        assert inserted == 1
+        assert result.new_files == 1
+        assert result.skipped_files == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
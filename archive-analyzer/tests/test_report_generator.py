@@ -5,8 +5,6 @@ Issue #11: 상세 스캔 리포트 생성기 구현 (FR-005)
 
 import pytest
 import json
-import tempfile
-import os
 from datetime import datetime
 
 from archive_analyzer.database import Database, FileRecord, MediaInfoRecord
@@ -27,16 +25,12 @@ from archive_analyzer.report_generator import (
 
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_db_path):
     """테스트용 임시 데이터베이스"""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-
-    db = Database(path)
+    db = Database(tmp_db_path)
     yield db
 
     db.close()
-    os.unlink(path)
 
 
 @pytest.fixture
@@ -1,12 +1,7 @@
 """아카이브 스캐너 테스트"""
 
 import os
-import sys
-import tempfile
 import pytest
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from archive_analyzer.file_classifier import (
     FileType,
@@ -120,15 +115,11 @@ class TestDatabase:
     """데이터베이스 테스트"""
 
     @pytest.fixture
-    def db(self):
+    def db(self, tmp_db_path):
         """임시 데이터베이스"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        db = Database(db_path)
+        db = Database(tmp_db_path)
         yield db
         db.close()
-        os.unlink(db_path)
 
     def test_insert_file(self, db):
         """파일 삽입 테스트"""
@@ -252,15 +243,11 @@ class TestArchiveScanner:
             conn.disconnect()
 
     @pytest.fixture
-    def db(self):
+    def db(self, tmp_db_path):
         """임시 데이터베이스"""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
-
-        db = Database(db_path)
+        db = Database(tmp_db_path)
         yield db
         db.close()
-        os.unlink(db_path)
 
     def test_quick_scan(self, connector, db):
         """빠른 스캔 테스트"""
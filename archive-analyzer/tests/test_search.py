@@ -6,8 +6,6 @@ MeiliSearch 서버가 실행 중이지 않으면 일부 테스트는 건너뜁
 
 import pytest
 import sqlite3
-import tempfile
-from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 # MeiliSearch 가용성 확인
@@ -89,10 +87,9 @@ def mock_meilisearch_client():
 
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_db_path):
     """임시 테스트 DB 생성"""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
+    db_path = tmp_db_path
 
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
@@ -171,10 +168,7 @@ def temp_db():
     conn.commit()
     conn.close()
 
-    yield db_path
-
-    # 정리
-    Path(db_path).unlink(missing_ok=True)
+    return db_path
 
 
 class TestSearchServiceMocked:
@@ -3,20 +3,88 @@
 #18: Google Sheets <-> SQLite 동기화 테스트
 """
 
-import hashlib
+import json
 import os
+import shutil
 import sqlite3
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, NonCallableMock, patch
 
 import pytest
 
 
+# =============================================
+# gspread 스텁 (MagicMock 트리 대신 필요한 메서드만 구현)
+# =============================================
+
+
+class _StubWorksheet:
+    """gspread.Worksheet 스텁"""
+
+    def __init__(self, records=()):
+        self.records = list(records)
+
+    def get_all_records(self):
+        return self.records
+
+
+class _StubSpreadsheet:
+    """gspread.Spreadsheet 스텁 (이름 -> 워크시트)"""
+
+    def __init__(self):
+        self.worksheets = {}
+
+    def worksheet(self, name):
+        from gspread import WorksheetNotFound
+
+        if name not in self.worksheets:
+            raise WorksheetNotFound(name)
+        return self.worksheets[name]
+
+
+class _StubSheetsClient:
+    """SheetsClient 스텁 (워크시트 이름 -> 레코드 목록)"""
+
+    def __init__(self, records=None):
+        self.records = records or {}
+
+    def get_all_records(self, worksheet_name):
+        return self.records.get(worksheet_name, [])
+
+    def get_worksheet_hash(self, worksheet_name):
+        from archive_analyzer.sheets_sync import content_hash
+
+        return content_hash(json.dumps(self.get_all_records(worksheet_name), sort_keys=True))
+
+    def update_worksheet(self, worksheet_name, headers, rows):
+        self.records[worksheet_name] = [dict(zip(headers, row)) for row in rows]
+
+
+def _build_service(db_path, sheet_records=None):
+    """시트 연결 없이 SheetsSyncService 구성 (__init__ 생략, 시트는 스텁)"""
+    from archive_analyzer.sheets_sync import DatabaseClient, SheetsSyncService
+
+    service = object.__new__(SheetsSyncService)
+    service.config = SimpleNamespace(tables_to_sync=["test_table"])
+    service.sheets = _StubSheetsClient(sheet_records)
+    service.db = DatabaseClient(str(db_path))
+    service._last_hashes = {}
+    service.title_generator = None
+    return service
+
+
 class TestSyncConfig:
     """SyncConfig 테스트"""
 
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch):
+        """SyncConfig가 읽는 환경변수 제거 (환경 전체 복사/복원 없이)"""
+        for name in ("SYNC_INTERVAL", "TABLES_TO_SYNC"):
+            monkeypatch.delenv(name, raising=False)
+
     def test_default_values(self):
         """기본값 테스트"""
         from archive_analyzer.sheets_sync import SyncConfig
@@ -26,96 +94,110 @@ class TestSyncConfig:
             spreadsheet_id="test_sheet_id",
             db_path="test.db",
         )
-        assert config.credentials_path == "test/creds.json"
-        assert config.spreadsheet_id == "test_sheet_id"
-        assert config.db_path == "test.db"
-        assert config.sync_interval_seconds == 300
+        assert (
+            config.credentials_path,
+            config.spreadsheet_id,
+            config.db_path,
+            config.sync_interval_seconds,
+        ) == ("test/creds.json", "test_sheet_id", "test.db", 300)
         assert len(config.tables_to_sync) > 0
 
-    def test_env_override(self):
+    def test_env_override(self, monkeypatch):
         """환경변수 오버라이드 테스트"""
-        with patch.dict(
-            "os.environ",
-            {
-                "SYNC_INTERVAL": "600",
-                "TABLES_TO_SYNC": "table1,table2,table3",
-            },
-        ):
-            from archive_analyzer.sheets_sync import SyncConfig
-
-            config = SyncConfig(
-                credentials_path="test/creds.json",
-                spreadsheet_id="test_sheet_id",
-                db_path="test.db",
-            )
-            assert config.sync_interval_seconds == 600
-            assert config.tables_to_sync == ["table1", "table2", "table3"]
+        from archive_analyzer.sheets_sync import SyncConfig
+
+        monkeypatch.setenv("SYNC_INTERVAL", "600")
+        monkeypatch.setenv("TABLES_TO_SYNC", "table1,table2,table3")
+
+        config = SyncConfig(
+            credentials_path="test/creds.json",
+            spreadsheet_id="test_sheet_id",
+            db_path="test.db",
+        )
+        assert config.sync_interval_seconds == 600
+        assert config.tables_to_sync == ["table1", "table2", "table3"]
 
     def test_tables_to_sync_default(self):
         """기본 동기화 테이블 목록 테스트"""
-        with patch.dict("os.environ", {}, clear=True):
-            from archive_analyzer.sheets_sync import SyncConfig
+        from archive_analyzer.sheets_sync import SyncConfig
 
-            config = SyncConfig(
-                credentials_path="test/creds.json",
-                spreadsheet_id="test_sheet_id",
-                db_path="test.db",
-            )
-            expected_tables = [
-                # V3.0 Core Tables
-                "catalogs",
-                "series",
-                "contents",
-                "tags",
-                # V3.0 Link Tables
-                "content_players",
-                "content_tags",
-                # Legacy Tables
-                "subcatalogs",
-                "players",
-                "events",
-                "tournaments",
-                "hands",
-                "files",
-                "wsoptv_player_aliases",
-            ]
-            assert config.tables_to_sync == expected_tables
+        config = SyncConfig(
+            credentials_path="test/creds.json",
+            spreadsheet_id="test_sheet_id",
+            db_path="test.db",
+        )
+        expected_tables = [
+            # V3.0 Core Tables
+            "catalogs",
+            "series",
+            "contents",
+            "tags",
+            # V3.0 Link Tables
+            "content_players",
+            "content_tags",
+            # Legacy Tables
+            "subcatalogs",
+            "players",
+            "events",
+            "tournaments",
+            "hands",
+            "files",
+            "wsoptv_player_aliases",
+        ]
+        assert config.tables_to_sync == expected_tables
 
 
-class TestDatabaseClient:
-    """DatabaseClient 테스트"""
+# 샘플 행의 created_at (CURRENT_TIMESTAMP 대신 고정값)
+_FIXED_CREATED_AT = "2024-01-01 12:00:00"
 
-    @pytest.fixture
-    def temp_db(self) -> Generator[Path, None, None]:
-        """임시 SQLite DB 생성 (Windows 호환)"""
-        # Windows에서 파일 잠금 문제 방지를 위해 tempfile.TemporaryDirectory 사용
-        tmpdir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
-        db_path = Path(tmpdir.name) / "test.db"
-
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-
-        # 테스트 테이블 생성
-        cursor.execute("""
-            CREATE TABLE test_table (
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                value INTEGER,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
 
-        # 샘플 데이터 삽입
-        cursor.executemany(
-            "INSERT INTO test_table (id, name, value) VALUES (?, ?, ?)",
-            [(1, "item1", 100), (2, "item2", 200), (3, "item3", 300)],
+@pytest.fixture(scope="module")
+def template_db() -> Generator[Path, None, None]:
+    """스키마+샘플 데이터 DB를 모듈당 1회 생성 (Windows 호환)"""
+    # Windows에서 파일 잠금 문제 방지를 위해 tempfile.TemporaryDirectory 사용
+    tmpdir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+    db_path = Path(tmpdir.name) / "template.db"
+
+    conn = sqlite3.connect(str(db_path))
+    cursor = conn.cursor()
+
+    # 테스트 테이블 생성
+    cursor.execute("""
+        CREATE TABLE test_table (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            value INTEGER,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
         )
+    """)
+
+    # 샘플 데이터 삽입 (created_at 고정 - 결과 비교를 결정적으로)
+    cursor.executemany(
+        "INSERT INTO test_table (id, name, value, created_at) VALUES (?, ?, ?, ?)",
+        [
+            (1, "item1", 100, _FIXED_CREATED_AT),
+            (2, "item2", 200, _FIXED_CREATED_AT),
+            (3, "item3", 300, _FIXED_CREATED_AT),
+        ],
+    )
+
+    conn.commit()
+    conn.close()
+
+    yield db_path
+    tmpdir.cleanup()
+
+
+@pytest.fixture
+def temp_db(template_db, tmp_path) -> Path:
+    """테스트별 DB (템플릿 파일 복사 - 쓰기 테스트 간 격리)"""
+    db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db, db_path)
+    return db_path
 
-        conn.commit()
-        conn.close()
 
-        yield db_path
-        # cleanup은 TemporaryDirectory가 자동 처리 (ignore_cleanup_errors=True)
+class TestDatabaseClient:
+    """DatabaseClient 테스트"""
 
     def test_get_connection(self, temp_db):
         """데이터베이스 연결 테스트"""
@@ -133,12 +215,12 @@ class TestDatabaseClient:
         client = DatabaseClient(str(temp_db))
         schema = client.get_table_schema("test_table")
 
-        assert len(schema) == 4
-        column_names = [col["name"] for col in schema]
-        assert "id" in column_names
-        assert "name" in column_names
-        assert "value" in column_names
-        assert "created_at" in column_names
+        assert schema == [
+            {"name": "id", "type": "INTEGER", "pk": True},
+            {"name": "name", "type": "TEXT", "pk": False},
+            {"name": "value", "type": "INTEGER", "pk": False},
+            {"name": "created_at", "type": "TEXT", "pk": False},
+        ]
 
     def test_get_primary_key(self, temp_db):
         """Primary Key 조회 테스트"""
@@ -155,10 +237,12 @@ class TestDatabaseClient:
         client = DatabaseClient(str(temp_db))
         headers, records = client.get_all_records("test_table")
 
-        assert "id" in headers
-        assert "name" in headers
-        assert len(records) == 3
-        assert records[0]["name"] == "item1"
+        assert headers == ["id", "name", "value", "created_at"]
+        assert records == [
+            {"id": 1, "name": "item1", "value": 100, "created_at": _FIXED_CREATED_AT},
+            {"id": 2, "name": "item2", "value": 200, "created_at": _FIXED_CREATED_AT},
+            {"id": 3, "name": "item3", "value": 300, "created_at": _FIXED_CREATED_AT},
+        ]
 
     def test_get_table_hash(self, temp_db):
         """테이블 해시 계산 테스트"""
@@ -169,7 +253,7 @@ class TestDatabaseClient:
         hash2 = client.get_table_hash("test_table")
 
         assert hash1 == hash2  # 동일 데이터는 동일 해시
-        assert len(hash1) == 32  # MD5 해시 길이
+        assert len(hash1) == 32  # xxh3_128/MD5 모두 32자리 hex
 
     def test_upsert_record_insert(self, temp_db):
         """레코드 삽입 테스트"""
@@ -226,83 +310,92 @@ class TestDatabaseClient:
         assert item1["name"] == "item1_bulk"
 
 
+@pytest.fixture(scope="module")
+def sync_config():
+    """읽기 전용 공용 SyncConfig (테스트에서 수정 금지)"""
+    from archive_analyzer.sheets_sync import SyncConfig
+
+    return SyncConfig(
+        credentials_path="test/creds.json",
+        spreadsheet_id="test_sheet_id",
+        db_path="test.db",
+    )
+
+
 class TestSheetsClient:
     """SheetsClient 테스트 (Mocked)"""
 
     @pytest.fixture
-    def mock_gspread(self):
-        """gspread 모듈 모킹"""
+    def mock_gspread(self, monkeypatch):
+        """gspread 모듈 모킹 (인증 호출만 Mock, 시트는 스텁)"""
+        from archive_analyzer.sheets_sync import SheetsClient
+
+        # Rate limit 대기(API_DELAY) 없이 실행
+        monkeypatch.setattr(SheetsClient, "API_DELAY", 0)
         with patch("archive_analyzer.sheets_sync.gspread") as mock_gspread:
             with patch("archive_analyzer.sheets_sync.Credentials") as mock_creds:
-                mock_creds.from_service_account_file.return_value = MagicMock()
+                import gspread
+
+                # except 절에서 쓰는 예외 클래스는 실제 것 유지
+                mock_gspread.WorksheetNotFound = gspread.WorksheetNotFound
+                mock_creds.from_service_account_file.return_value = object()
 
                 mock_client = MagicMock()
                 mock_gspread.authorize.return_value = mock_client
 
-                mock_spreadsheet = MagicMock()
-                mock_client.open_by_key.return_value = mock_spreadsheet
+                spreadsheet = _StubSpreadsheet()
+                mock_client.open_by_key.return_value = spreadsheet
 
                 yield {
                     "gspread": mock_gspread,
                     "creds": mock_creds,
                     "client": mock_client,
-                    "spreadsheet": mock_spreadsheet,
+                    "spreadsheet": spreadsheet,
                 }
 
-    def test_client_initialization(self, mock_gspread):
+    def test_client_initialization(self, mock_gspread, sync_config):
         """클라이언트 초기화 테스트"""
-        from archive_analyzer.sheets_sync import SheetsClient, SyncConfig
+        from archive_analyzer.sheets_sync import SheetsClient
 
-        config = SyncConfig(
-            credentials_path="test/creds.json",
-            spreadsheet_id="test_sheet_id",
-            db_path="test.db",
-        )
-        client = SheetsClient(config)
+        client = SheetsClient(sync_config)
 
         assert client.client is not None
         assert client.spreadsheet is not None
         mock_gspread["creds"].from_service_account_file.assert_called_once()
         mock_gspread["gspread"].authorize.assert_called_once()
 
-    def test_get_or_create_worksheet_existing(self, mock_gspread):
+    def test_get_or_create_worksheet_existing(self, mock_gspread, sync_config):
         """기존 워크시트 조회 테스트"""
-        from archive_analyzer.sheets_sync import SheetsClient, SyncConfig
+        from archive_analyzer.sheets_sync import SheetsClient
 
-        mock_worksheet = MagicMock()
-        mock_gspread["spreadsheet"].worksheet.return_value = mock_worksheet
+        worksheet = _StubWorksheet()
+        mock_gspread["spreadsheet"].worksheets["test_sheet"] = worksheet
 
-        config = SyncConfig(
-            credentials_path="test/creds.json",
-            spreadsheet_id="test_sheet_id",
-            db_path="test.db",
-        )
-        client = SheetsClient(config)
+        client = SheetsClient(sync_config)
         result = client.get_or_create_worksheet("test_sheet", ["col1", "col2"])
 
-        assert result == mock_worksheet
+        assert result is worksheet
 
-    def test_get_all_records(self, mock_gspread):
+    def test_get_all_records(self, mock_gspread, sync_config):
         """전체 레코드 조회 테스트 (Mocked)"""
-        from archive_analyzer.sheets_sync import SheetsClient, SyncConfig
+        from archive_analyzer.sheets_sync import SheetsClient
 
-        mock_worksheet = MagicMock()
-        mock_worksheet.get_all_records.return_value = [
-            {"id": 1, "name": "test1"},
-            {"id": 2, "name": "test2"},
-        ]
-        mock_gspread["spreadsheet"].worksheet.return_value = mock_worksheet
-
-        config = SyncConfig(
-            credentials_path="test/creds.json",
-            spreadsheet_id="test_sheet_id",
-            db_path="test.db",
+        mock_gspread["spreadsheet"].worksheets["test_sheet"] = _StubWorksheet(
+            [{"id": 1, "name": "test1"}, {"id": 2, "name": "test2"}]
         )
-        client = SheetsClient(config)
+
+        client = SheetsClient(sync_config)
         records = client.get_all_records("test_sheet")
 
-        assert len(records) == 2
-        assert records[0]["id"] == 1
+        assert records == [{"id": 1, "name": "test1"}, {"id": 2, "name": "test2"}]
+
+    def test_get_all_records_missing_worksheet(self, mock_gspread, sync_config):
+        """없는 워크시트는 빈 목록"""
+        from archive_analyzer.sheets_sync import SheetsClient
+
+        client = SheetsClient(sync_config)
+
+        assert client.get_all_records("missing") == []
 
 
 class TestSheetsSyncServiceInit:
@@ -311,12 +404,15 @@ class TestSheetsSyncServiceInit:
     @pytest.fixture
     def mock_clients(self):
         """클라이언트 모킹"""
-        with patch("archive_analyzer.sheets_sync.SheetsClient") as mock_sheets:
-            with patch("archive_analyzer.sheets_sync.DatabaseClient") as mock_db:
-                mock_sheets_instance = MagicMock()
+        from archive_analyzer.sheets_sync import DatabaseClient, SheetsClient
+
+        # spec_set: 실제 클래스에 없는 속성 접근/설정은 AttributeError (자동 자식 Mock 생성 방지)
+        with patch("archive_analyzer.sheets_sync.SheetsClient", spec_set=True) as mock_sheets:
+            with patch("archive_analyzer.sheets_sync.DatabaseClient", spec_set=True) as mock_db:
+                mock_sheets_instance = NonCallableMock(spec_set=SheetsClient)
                 mock_sheets.return_value = mock_sheets_instance
 
-                mock_db_instance = MagicMock()
+                mock_db_instance = NonCallableMock(spec_set=DatabaseClient)
                 mock_db.return_value = mock_db_instance
 
                 yield {
@@ -326,41 +422,107 @@ class TestSheetsSyncServiceInit:
                     "db": mock_db_instance,
                 }
 
-    def test_service_initialization(self, mock_clients):
+    def test_service_initialization(self, mock_clients, sync_config):
         """서비스 초기화 테스트"""
-        from archive_analyzer.sheets_sync import SheetsSyncService, SyncConfig
+        from archive_analyzer.sheets_sync import SheetsSyncService
 
-        config = SyncConfig(
-            credentials_path="test/creds.json",
-            spreadsheet_id="test_sheet_id",
-            db_path="test.db",
-        )
-        service = SheetsSyncService(config)
+        service = SheetsSyncService(sync_config)
 
-        assert service.config == config
-        mock_clients["sheets_class"].assert_called_once_with(config)
-        mock_clients["db_class"].assert_called_once_with(config.db_path)
+        assert service.config is sync_config
+        mock_clients["sheets_class"].assert_called_once_with(sync_config)
+        mock_clients["db_class"].assert_called_once_with(sync_config.db_path)
 
 
-class TestHashComparison:
-    """해시 비교 로직 테스트"""
+class TestSyncTable:
+    """테이블 동기화 테스트 (DB는 실제 SQLite, 시트는 스텁)"""
 
-    def test_hash_consistency(self):
-        """해시 일관성 테스트"""
-        data1 = [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}]
-        data2 = [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}]
+    def test_schema_loaded_once_per_table(self, temp_db):
+        """행마다 스키마를 다시 조회하지 않음"""
+        service = _build_service(temp_db)
+        db = service.db
 
-        hash1 = hashlib.md5(str(data1).encode()).hexdigest()
-        hash2 = hashlib.md5(str(data2).encode()).hexdigest()
+        sheet_records = [
+            {"id": "1", "name": "item1", "value": "101"},
+            {"id": "4", "name": "item4", "value": "400.0"},
+        ]
+        _, db_rows = db.get_all_records("test_table")
+        with patch.object(db, "get_table_schema", wraps=db.get_table_schema) as schema:
+            service._sync_sheet_to_db(
+                "test_table", sheet_records, db_rows, "id", ["id", "name", "value"]
+            )
+
+        assert schema.call_count == 1
+
+    def test_existing_int_pks_match_sheet_str_pks(self, temp_db):
+        """DB의 int PK와 시트의 str PK가 같으면 갱신으로 집계하고 삭제하지 않음"""
+        service = _build_service(temp_db)
+        db = service.db
+
+        sheet_records = [
+            {"id": "1", "name": "item1", "value": "101"},
+            {"id": "2", "name": "item2", "value": "200"},
+            {"id": "4", "name": "item4", "value": "400.0"},
+        ]
+        _, db_rows = db.get_all_records("test_table")
+        assert all(isinstance(row["id"], int) for row in db_rows)
+
+        stats = service._sync_sheet_to_db(
+            "test_table", sheet_records, db_rows, "id", ["id", "name", "value"]
+        )
+
+        assert stats == {"inserted": 1, "updated": 2, "deleted": 1}
+        _, rows = db.get_all_records("test_table")
+        assert [(r["id"], r["value"]) for r in rows] == [(1, 101), (2, 200), (4, 400)]
+
+    def test_first_sync_only_stores_hashes(self, temp_db):
+        """최초 실행은 해시만 저장하고 변경 없음"""
+        service = _build_service(temp_db, {"test_table": []})
 
-        assert hash1 == hash2
+        assert service.sync_table("test_table") == {"inserted": 0, "updated": 0, "deleted": 0}
+        assert service._last_hashes == {"test_table": service._current_hashes("test_table")}
+        _, rows = service.db.get_all_records("test_table")
+        assert len(rows) == 3
 
-    def test_hash_different_data(self):
-        """다른 데이터는 다른 해시"""
-        data1 = [{"id": 1, "name": "test"}]
-        data2 = [{"id": 1, "name": "test_modified"}]
+    def test_sheet_edit_applied_to_db(self, temp_db):
+        """Sheet만 바뀌면 Sheet -> DB 반영"""
+        service = _build_service(temp_db)
+        service.init_sheets()
+        service.sync_table("test_table")
 
-        hash1 = hashlib.md5(str(data1).encode()).hexdigest()
-        hash2 = hashlib.md5(str(data2).encode()).hexdigest()
+        service.sheets.records["test_table"][0]["name"] = "edited"
+        stats = service.sync_table("test_table")
 
-        assert hash1 != hash2
+        assert stats == {"inserted": 0, "updated": 3, "deleted": 0}
+        _, rows = service.db.get_all_records("test_table")
+        assert rows[0]["name"] == "edited"
+
+
+class TestHashComparison:
+    """해시 비교 로직 테스트 (content_hash: xxh3_128 / MD5 폴백)"""
+
+    @pytest.mark.parametrize(
+        "data1,data2,same",
+        [
+            (
+                [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}],
+                [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}],
+                True,
+            ),
+            ([{"id": 1, "name": "test"}], [{"id": 1, "name": "test_modified"}], False),
+        ],
+        ids=["same_data", "different_data"],
+    )
+    @pytest.mark.parametrize("use_xxhash", [True, False], ids=["xxh3", "md5"])
+    def test_content_hash(self, monkeypatch, use_xxhash, data1, data2, same):
+        """동일 데이터는 동일 해시, 다른 데이터는 다른 해시"""
+        from archive_analyzer import sheets_sync
+
+        if use_xxhash and not sheets_sync.XXHASH_AVAILABLE:
+            pytest.skip("xxhash not installed")
+        monkeypatch.setattr(sheets_sync, "XXHASH_AVAILABLE", use_xxhash)
+
+        hash1 = sheets_sync.content_hash(str(data1))
+        hash2 = sheets_sync.content_hash(str(data2))
+
+        assert (hash1 == hash2) is same
+        assert len(hash1) == 32
@@ -6,12 +6,7 @@
 """
 
 import os
-import sys
 import pytest
-from pathlib import Path
-
-# 프로젝트 루트 경로 추가
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from archive_analyzer.config import SMBConfig, AnalyzerConfig, create_default_config
 from archive_analyzer.smb_connector import (
@@ -5,8 +5,7 @@ pokervod.db 동기화 서비스 테스트입니다.
 
 import pytest
 import sqlite3
-import tempfile
-from pathlib import Path
+import uuid
 from unittest.mock import MagicMock, patch
 
 from archive_analyzer.sync import (
@@ -23,6 +22,30 @@ from archive_analyzer.sync import (
 )
 
 
+def _memory_db_uri(name: str) -> str:
+    """테스트별 고유 공유 캐시 메모리 DB URI (파일 I/O 없음)"""
+    return f"file:{name}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+def _connect(db_uri: str) -> sqlite3.Connection:
+    """메모리 DB URI 연결 (컬럼 이름으로 접근)"""
+    conn = sqlite3.connect(db_uri, uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _clone_template(template: sqlite3.Connection, name: str):
+    """템플릿 DB를 새 메모리 DB로 페이지 복사 (backup API)
+
+    Returns:
+        (DB URI, DB를 유지하는 연결)
+    """
+    db_path = _memory_db_uri(name)
+    conn = _connect(db_path)  # 연결이 열려 있는 동안 메모리 DB 유지
+    template.backup(conn)
+    return db_path, conn
+
+
 class TestHelperFunctions:
     """헬퍼 함수 테스트"""
 
@@ -41,110 +64,117 @@ class TestHelperFunctions:
         path3 = "//10.10.100.122/docker/test/other.mp4"
         assert generate_file_id(path1) != generate_file_id(path3)
 
-    def test_classify_path_wsop(self):
-        """WSOP 경로 분류"""
-        assert classify_path("WSOP/WSOP ARCHIVE/2024/file.mp4") == ("WSOP", "wsop-archive")
-        assert classify_path("WSOP/WSOP-BR/WSOP-EUROPE/file.mp4") == ("WSOP", "wsop-europe")
-        assert classify_path("WSOP/WSOP-BR/WSOP-PARADISE/file.mp4") == ("WSOP", "wsop-paradise")
-
-    def test_classify_path_other_catalogs(self):
-        """기타 카탈로그 분류"""
-        assert classify_path("HCL/2024/file.mp4") == ("HCL", None)
-        assert classify_path("PAD/file.mp4") == ("PAD", None)
-        assert classify_path("MPP/test/file.mp4") == ("MPP", None)
-
-    def test_classify_path_unknown(self):
-        """알 수 없는 경로"""
-        assert classify_path("UNKNOWN/file.mp4") == ("OTHER", None)
+    def test_generate_file_id_is_stable(self):
+        """저장된 ID와 호환되도록 해시 값 고정 (알고리즘 변경 방지)"""
+        assert generate_file_id("//10.10.100.122/docker/GGPNAs/ARCHIVE/test.mp4") == "31302c9ba6e7fbb7"
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("WSOP/WSOP ARCHIVE/2024/file.mp4", ("WSOP", "wsop-archive")),
+            ("WSOP/WSOP-BR/WSOP-EUROPE/file.mp4", ("WSOP", "wsop-europe")),
+            ("WSOP/WSOP-BR/WSOP-PARADISE/file.mp4", ("WSOP", "wsop-paradise")),
+            # 기타 카탈로그
+            ("HCL/2024/file.mp4", ("HCL", None)),
+            ("PAD/file.mp4", ("PAD", None)),
+            ("MPP/test/file.mp4", ("MPP", None)),
+            # 알 수 없는 경로
+            ("UNKNOWN/file.mp4", ("OTHER", None)),
+        ],
+    )
+    def test_classify_path(self, path, expected):
+        """경로 분류 (레거시)"""
+        assert classify_path(path) == expected
 
 
 class TestMultilevelClassify:
     """다단계 분류 테스트"""
 
-    def test_wsop_br_depth1(self):
-        """WSOP-BR depth=1"""
-        match = classify_path_multilevel("WSOP/WSOP-BR/somefile.mp4")
-        assert match.catalog_id == "WSOP"
-        assert match.subcatalog_id == "wsop-br"
-        assert match.depth == 1
-        assert match.year is None
-
-    def test_wsop_europe_depth2(self):
-        """WSOP Europe depth=2"""
-        match = classify_path_multilevel("WSOP/WSOP-BR/WSOP-EUROPE/tournament.mp4")
-        assert match.catalog_id == "WSOP"
-        assert match.subcatalog_id == "wsop-europe"
-        assert match.depth == 2
-        assert match.year is None
-
-    def test_wsop_europe_with_year_depth3(self):
-        """WSOP Europe 2024 depth=3"""
-        match = classify_path_multilevel("WSOP/WSOP-BR/WSOP-EUROPE/2024/main_event.mp4")
-        assert match.catalog_id == "WSOP"
-        assert match.subcatalog_id == "wsop-europe-{year}"
-        assert match.full_subcatalog_id == "wsop-europe-2024"
-        assert match.depth == 3
-        assert match.year == "2024"
-
-    def test_wsop_paradise_with_year(self):
-        """WSOP Paradise 2023 depth=3"""
-        match = classify_path_multilevel("WSOP/WSOP-BR/WSOP-PARADISE/2023/day1.mp4")
-        assert match.catalog_id == "WSOP"
-        assert match.full_subcatalog_id == "wsop-paradise-2023"
-        assert match.depth == 3
-        assert match.year == "2023"
-
-    def test_wsop_archive_era_classification(self):
-        """WSOP Archive 연대별 분류"""
-        # 1973-2002
-        match1 = classify_path_multilevel("WSOP/WSOP ARCHIVE/1995/classic.mp4")
-        assert match1.full_subcatalog_id == "wsop-archive-1973-2002"
-        assert match1.depth == 2
-
-        # 2003-2010
-        match2 = classify_path_multilevel("WSOP/WSOP ARCHIVE/2008/main.mp4")
-        assert match2.full_subcatalog_id == "wsop-archive-2003-2010"
-        assert match2.depth == 2
-
-        # 2011-2016
-        match3 = classify_path_multilevel("WSOP/WSOP ARCHIVE/2015/event.mp4")
-        assert match3.full_subcatalog_id == "wsop-archive-2011-2016"
-        assert match3.depth == 2
-
-    def test_hcl_year_extraction(self):
-        """HCL 연도 추출"""
-        match = classify_path_multilevel("HCL/2025/episode1.mp4")
-        assert match.catalog_id == "HCL"
-        assert match.full_subcatalog_id == "hcl-2025"
-        assert match.depth == 1
-
-    def test_hcl_clips(self):
-        """HCL 클립"""
-        match = classify_path_multilevel("HCL/Poker Clips/highlight.mp4")
-        assert match.catalog_id == "HCL"
-        assert match.full_subcatalog_id == "hcl-clips"
-        assert match.depth == 1
-
-    def test_pad_season(self):
-        """PAD 시즌"""
-        match = classify_path_multilevel("PAD/Season 12/ep1.mp4")
-        assert match.catalog_id == "PAD"
-        assert match.full_subcatalog_id == "pad-s12"
-        assert match.depth == 1
-
-    def test_mpp_prize(self):
-        """MPP 상금"""
-        match = classify_path_multilevel("MPP/5M GTD Main/final.mp4")
-        assert match.catalog_id == "MPP"
-        assert match.full_subcatalog_id == "mpp-5m"
-        assert match.depth == 1
-
-    def test_unknown_path(self):
-        """알 수 없는 경로"""
-        match = classify_path_multilevel("RANDOM/folder/file.mp4")
-        assert match.catalog_id == "OTHER"
-        assert match.subcatalog_id is None
-        assert match.depth == 0
+    @pytest.mark.parametrize(
+        "path, expected, full_subcatalog_id",
+        [
+            (
+                "WSOP/WSOP-BR/somefile.mp4",
+                SubcatalogMatch("WSOP", "wsop-br", 1),
+                "wsop-br",
+            ),
+            (
+                "WSOP/WSOP-BR/WSOP-EUROPE/tournament.mp4",
+                SubcatalogMatch("WSOP", "wsop-europe", 2),
+                "wsop-europe",
+            ),
+            (
+                "WSOP/WSOP-BR/WSOP-EUROPE/2024/main_event.mp4",
+                SubcatalogMatch("WSOP", "wsop-europe-{year}", 3, "2024"),
+                "wsop-europe-2024",
+            ),
+            (
+                "WSOP/WSOP-BR/WSOP-PARADISE/2023/day1.mp4",
+                SubcatalogMatch("WSOP", "wsop-paradise-{year}", 3, "2023"),
+                "wsop-paradise-2023",
+            ),
+            # WSOP Archive 연대별 분류
+            (
+                "WSOP/WSOP ARCHIVE/1995/classic.mp4",
+                SubcatalogMatch("WSOP", "wsop-archive-1973-2002", 2, "1995"),
+                "wsop-archive-1973-2002",
+            ),
+            (
+                "WSOP/WSOP ARCHIVE/2008/main.mp4",
+                SubcatalogMatch("WSOP", "wsop-archive-2003-2010", 2, "2008"),
+                "wsop-archive-2003-2010",
+            ),
+            (
+                "WSOP/WSOP ARCHIVE/2015/event.mp4",
+                SubcatalogMatch("WSOP", "wsop-archive-2011-2016", 2, "2015"),
+                "wsop-archive-2011-2016",
+            ),
+            (
+                "HCL/2025/episode1.mp4",
+                SubcatalogMatch("HCL", "hcl-{year}", 1, "2025"),
+                "hcl-2025",
+            ),
+            (
+                "HCL/Poker Clips/highlight.mp4",
+                SubcatalogMatch("HCL", "hcl-clips", 1),
+                "hcl-clips",
+            ),
+            ("PAD/Season 12/ep1.mp4", SubcatalogMatch("PAD", "pad-s12", 1), "pad-s12"),
+            ("MPP/5M GTD Main/final.mp4", SubcatalogMatch("MPP", "mpp-5m", 1), "mpp-5m"),
+            # 대소문자 무시 + 상위 경로 포함
+            (
+                "z:\\ggpnas\\archive\\wsop\\wsop-br\\file.mp4",
+                SubcatalogMatch("WSOP", "wsop-br", 1),
+                "wsop-br",
+            ),
+            # 알 수 없는 경로
+            ("RANDOM/folder/file.mp4", SubcatalogMatch("OTHER", None, 0), None),
+        ],
+    )
+    def test_classify_path_multilevel(self, path, expected, full_subcatalog_id):
+        """다단계 경로 분류"""
+        match = classify_path_multilevel(path)
+        assert match == expected
+        assert match.full_subcatalog_id == full_subcatalog_id
+
+    def test_compiled_patterns_cached(self):
+        """정규식은 1회만 컴파일되어 재사용됨"""
+        from archive_analyzer.sync import _get_compiled_multilevel_patterns
+
+        classify_path_multilevel("WSOP/WSOP-BR/somefile.mp4")
+        patterns = _get_compiled_multilevel_patterns()
+        classify_path_multilevel("HCL/2025/episode1.mp4")
+        assert _get_compiled_multilevel_patterns() is patterns
+
+    def test_ids_are_interned(self):
+        """같은 카탈로그/서브카탈로그 ID는 같은 문자열 객체"""
+        br = classify_path_multilevel("WSOP/WSOP-BR/a.mp4")
+        archive = classify_path_multilevel("WSOP/WSOP ARCHIVE/b.mp4")
+        assert br.catalog_id is archive.catalog_id
+
+        day1 = classify_path_multilevel("WSOP/WSOP-BR/WSOP-EUROPE/2024/day1.mp4")
+        day2 = classify_path_multilevel("WSOP/WSOP-BR/WSOP-EUROPE/2024/day2.mp4")
+        assert day1.full_subcatalog_id is day2.full_subcatalog_id
 
     def test_local_to_nas(self):
         """경로 변환"""
@@ -191,14 +221,13 @@ class TestSyncConfig:
         assert config.default_analysis_status == "pending"
 
 
-@pytest.fixture
-def temp_archive_db():
-    """임시 archive.db 생성"""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-
-    conn = sqlite3.connect(db_path)
+@pytest.fixture(scope="module")
+def archive_template():
+    """archive.db 템플릿 (스키마/데이터는 모듈당 1회만 생성)"""
+    conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
+    # 스키마 + 데이터를 단일 트랜잭션으로 기록 (DDL 자동 커밋 방지)
+    cursor.execute("BEGIN")
 
     # files 테이블
     cursor.execute("""
@@ -237,21 +266,28 @@ def temp_archive_db():
     """)
 
     conn.commit()
-    conn.close()
 
-    yield db_path
+    yield conn
 
-    Path(db_path).unlink(missing_ok=True)
+    conn.close()
 
 
 @pytest.fixture
-def temp_pokervod_db():
-    """임시 pokervod.db 생성"""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
+def temp_archive_db(archive_template):
+    """임시 archive.db 생성 (템플릿 복사)"""
+    db_path, conn = _clone_template(archive_template, "archive")
+
+    yield db_path
+
+    conn.close()
 
-    conn = sqlite3.connect(db_path)
+
+@pytest.fixture(scope="module")
+def pokervod_template():
+    """pokervod.db 템플릿 (스키마/데이터는 모듈당 1회만 생성)"""
+    conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
+    cursor.execute("BEGIN")
 
     # catalogs 테이블
     cursor.execute("""
@@ -307,11 +343,38 @@ def temp_pokervod_db():
     """)
 
     conn.commit()
+
+    yield conn
+
     conn.close()
 
-    yield db_path
 
-    Path(db_path).unlink(missing_ok=True)
+@pytest.fixture
+def pokervod_db(pokervod_template):
+    """임시 pokervod.db 생성 (템플릿 복사) - (URI, DB를 유지하는 연결)"""
+    db_path, conn = _clone_template(pokervod_template, "pokervod")
+
+    yield db_path, conn
+
+    conn.close()
+
+
+@pytest.fixture
+def temp_pokervod_db(pokervod_db):
+    """임시 pokervod.db URI"""
+    return pokervod_db[0]
+
+
+@pytest.fixture
+def pokervod_conn(pokervod_db):
+    """검증용 pokervod.db 연결 (DB를 유지하는 연결을 재사용, 테스트마다 새로 열지 않음)"""
+    return pokervod_db[1]
+
+
+@pytest.fixture
+def service(temp_archive_db, temp_pokervod_db):
+    """임시 DB에 연결된 SyncService"""
+    return SyncService(SyncConfig(archive_db=temp_archive_db, pokervod_db=temp_pokervod_db))
 
 
 class TestSyncService:
@@ -335,13 +398,8 @@ class TestSyncService:
         with pytest.raises(FileNotFoundError):
             SyncService(config)
 
-    def test_sync_files_dry_run(self, temp_archive_db, temp_pokervod_db):
+    def test_sync_files_dry_run(self, service, pokervod_conn):
         """파일 동기화 dry run"""
-        config = SyncConfig(
-            archive_db=temp_archive_db,
-            pokervod_db=temp_pokervod_db,
-        )
-        service = SyncService(config)
         result = service.sync_files(dry_run=True)
 
         # dry run에서는 삽입 카운트만 증가
@@ -349,44 +407,24 @@ class TestSyncService:
         assert result.updated == 0
 
         # 실제 DB에는 기록 없음
-        conn = sqlite3.connect(temp_pokervod_db)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM files")
-        assert cursor.fetchone()[0] == 0
-        conn.close()
+        row = pokervod_conn.execute("SELECT COUNT(*) AS count FROM files").fetchone()
+        assert row["count"] == 0
 
-    def test_sync_files_actual(self, temp_archive_db, temp_pokervod_db):
+    def test_sync_files_actual(self, service, pokervod_conn):
         """파일 동기화 실제 실행"""
-        config = SyncConfig(
-            archive_db=temp_archive_db,
-            pokervod_db=temp_pokervod_db,
-        )
-        service = SyncService(config)
         result = service.sync_files(dry_run=False)
 
         assert result.inserted == 1
         assert result.updated == 0
 
         # 실제 DB에 기록됨
-        conn = sqlite3.connect(temp_pokervod_db)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM files")
-        assert cursor.fetchone()[0] == 1
-
-        cursor.execute("SELECT filename, resolution, codec FROM files")
-        row = cursor.fetchone()
-        assert row[0] == "test.mp4"
-        assert row[1] == "1920x1080"
-        assert row[2] == "h264"
-        conn.close()
+        rows = pokervod_conn.execute("SELECT filename, resolution, codec FROM files").fetchall()
+        assert [dict(row) for row in rows] == [
+            {"filename": "test.mp4", "resolution": "1920x1080", "codec": "h264"}
+        ]
 
-    def test_sync_files_update(self, temp_archive_db, temp_pokervod_db):
+    def test_sync_files_update(self, service):
         """파일 업데이트 동기화"""
-        config = SyncConfig(
-            archive_db=temp_archive_db,
-            pokervod_db=temp_pokervod_db,
-        )
-        service = SyncService(config)
 
         # 첫 번째 동기화
         service.sync_files(dry_run=False)
@@ -396,46 +434,64 @@ class TestSyncService:
         assert result.inserted == 0
         assert result.updated == 1
 
-    def test_sync_catalogs(self, temp_archive_db, temp_pokervod_db):
-        """카탈로그 동기화"""
-        config = SyncConfig(
-            archive_db=temp_archive_db,
-            pokervod_db=temp_pokervod_db,
+    @pytest.mark.parametrize("update_from", [True, False], ids=["update-from", "subquery"])
+    def test_sync_files_update_overwrites_media(
+        self, service, pokervod_conn, monkeypatch, update_from
+    ):
+        """기존 레코드 미디어 정보 갱신 (SQLite 3.33 미만 대체 경로 포함)"""
+        monkeypatch.setattr("archive_analyzer.sync.SQLITE_HAS_UPDATE_FROM", update_from)
+        service.sync_files(dry_run=False)
+        pokervod_conn.execute("UPDATE files SET codec = 'stale', resolution = NULL")
+        pokervod_conn.commit()
+
+        result = service.sync_files(dry_run=False)
+
+        assert (result.inserted, result.updated) == (0, 1)
+        row = pokervod_conn.execute("SELECT resolution, codec FROM files").fetchone()
+        assert dict(row) == {"resolution": "1920x1080", "codec": "h264"}
+
+    def test_sync_files_skips_id_collision(self, service, temp_archive_db):
+        """대소문자만 다른 경로는 같은 ID → 한 건만 삽입, 나머지는 건너뜀"""
+        conn = _connect(temp_archive_db)
+        conn.execute(
+            "INSERT INTO files (id, path, filename, extension, size_bytes, file_type) "
+            "VALUES (2, 'Z:/GGPNAs/ARCHIVE/WSOP/WSOP ARCHIVE/2024/TEST.mp4', 'TEST.mp4', "
+            "'.mp4', 1000000, 'video')"
         )
-        service = SyncService(config)
+        conn.commit()
+        conn.close()
+
+        result = service.sync_files(dry_run=False)
+
+        assert (result.inserted, result.updated, result.skipped) == (1, 0, 1)
+
+    def test_sync_files_dry_run_after_sync(self, service):
+        """동기화 후 dry run - 기존 파일은 업데이트 예정으로 집계"""
+        service.sync_files(dry_run=False)
+
+        result = service.sync_files(dry_run=True)
+        assert (result.inserted, result.updated) == (0, 1)
+
+    def test_sync_catalogs(self, service, pokervod_conn):
+        """카탈로그 동기화"""
         result = service.sync_catalogs(dry_run=False)
 
         # WSOP 카탈로그 + wsop-archive 서브카탈로그
         assert result.inserted == 2
 
-        conn = sqlite3.connect(temp_pokervod_db)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM catalogs")
-        assert cursor.fetchone()[0] == "WSOP"
-        cursor.execute("SELECT id FROM subcatalogs")
-        assert cursor.fetchone()[0] == "wsop-archive"
-        conn.close()
+        assert pokervod_conn.execute("SELECT id FROM catalogs").fetchone()["id"] == "WSOP"
+        assert pokervod_conn.execute("SELECT id FROM subcatalogs").fetchone()["id"] == "wsop-archive"
 
-    def test_get_sync_stats(self, temp_archive_db, temp_pokervod_db):
+    def test_get_sync_stats(self, service):
         """동기화 통계"""
-        config = SyncConfig(
-            archive_db=temp_archive_db,
-            pokervod_db=temp_pokervod_db,
-        )
-        service = SyncService(config)
         stats = service.get_sync_stats()
 
         assert stats["archive_video_count"] == 1
         assert stats["archive_media_info_count"] == 1
         assert stats["pokervod_file_count"] == 0
 
-    def test_run_full_sync(self, temp_archive_db, temp_pokervod_db):
+    def test_run_full_sync(self, service):
         """전체 동기화"""
-        config = SyncConfig(
-            archive_db=temp_archive_db,
-            pokervod_db=temp_pokervod_db,
-        )
-        service = SyncService(config)
         results = service.run_full_sync(dry_run=False)
 
         assert "catalogs" in results
@@ -459,6 +515,10 @@ class TestHLSFiltering:
         assert "webm" not in HLS_COMPATIBLE_EXTENSIONS
         assert "avi" not in HLS_COMPATIBLE_EXTENSIONS
 
+    def test_hls_compatible_extensions_is_frozenset(self):
+        """HLS 확장자 상수는 불변 집합 (O(1) 멤버십 검사)"""
+        assert isinstance(HLS_COMPATIBLE_EXTENSIONS, frozenset)
+
     def test_sync_config_hls_only_default(self):
         """SyncConfig hls_only 기본값 확인"""
         config = SyncConfig()
@@ -470,14 +530,12 @@ class TestHLSFiltering:
         assert config.hls_only is True
 
 
-@pytest.fixture
-def temp_archive_db_with_mixed_formats():
-    """HLS/비-HLS 혼합 archive.db 생성"""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-
-    conn = sqlite3.connect(db_path)
+@pytest.fixture(scope="module")
+def mixed_archive_template():
+    """HLS/비-HLS 혼합 archive.db 템플릿 (스키마/데이터는 모듈당 1회만 생성)"""
+    conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
+    cursor.execute("BEGIN")
 
     cursor.execute("""
         CREATE TABLE files (
@@ -515,22 +573,27 @@ def temp_archive_db_with_mixed_formats():
         (7, "Z:/ARCHIVE/test7.avi", "test7.avi", ".avi", 900000, "video"),
     ]
 
-    for fid, path, filename, ext, size, ftype in test_files:
-        cursor.execute(
-            "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
-            (fid, path, filename, ext, size, ftype)
-        )
-        cursor.execute(
-            "INSERT INTO media_info (id, file_id, video_codec, width, height) VALUES (?, ?, 'h264', 1920, 1080)",
-            (fid, fid)
-        )
+    cursor.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)", test_files)
+    cursor.executemany(
+        "INSERT INTO media_info (id, file_id, video_codec, width, height) VALUES (?, ?, 'h264', 1920, 1080)",
+        [(fid, fid) for fid, *_ in test_files],
+    )
 
     conn.commit()
+
+    yield conn
+
     conn.close()
 
+
+@pytest.fixture
+def temp_archive_db_with_mixed_formats(mixed_archive_template):
+    """HLS/비-HLS 혼합 archive.db 생성 (템플릿 복사)"""
+    db_path, conn = _clone_template(mixed_archive_template, "archive_mixed")
+
     yield db_path
 
-    Path(db_path).unlink(missing_ok=True)
+    conn.close()
 
 
 class TestHLSFilteringSync:
@@ -549,7 +612,9 @@ class TestHLSFilteringSync:
         # 모든 7개 파일이 동기화됨
         assert result.inserted == 7
 
-    def test_sync_with_hls_filter(self, temp_archive_db_with_mixed_formats, temp_pokervod_db):
+    def test_sync_with_hls_filter(
+        self, temp_archive_db_with_mixed_formats, temp_pokervod_db, pokervod_conn
+    ):
         """HLS 필터 활성화 - HLS 호환 파일만 동기화됨"""
         config = SyncConfig(
             archive_db=temp_archive_db_with_mixed_formats,
@@ -563,11 +628,8 @@ class TestHLSFilteringSync:
         assert result.inserted == 3
 
         # 실제 DB 확인
-        conn = sqlite3.connect(temp_pokervod_db)
-        cursor = conn.cursor()
-        cursor.execute("SELECT filename FROM files ORDER BY filename")
-        filenames = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        rows = pokervod_conn.execute("SELECT filename FROM files ORDER BY filename").fetchall()
+        filenames = [row["filename"] for row in rows]
 
         assert "test1.mp4" in filenames
         assert "test2.mov" in filenames
@@ -578,7 +640,9 @@ class TestHLSFilteringSync:
         assert "test6.webm" not in filenames
         assert "test7.avi" not in filenames
 
-    def test_sync_hls_filter_dry_run(self, temp_archive_db_with_mixed_formats, temp_pokervod_db):
+    def test_sync_hls_filter_dry_run(
+        self, temp_archive_db_with_mixed_formats, temp_pokervod_db, pokervod_conn
+    ):
         """HLS 필터 dry-run 테스트"""
         config = SyncConfig(
             archive_db=temp_archive_db_with_mixed_formats,
@@ -592,8 +656,5 @@ class TestHLSFilteringSync:
         assert result.inserted == 3
 
         # 실제 DB에는 기록 없음
-        conn = sqlite3.connect(temp_pokervod_db)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM files")
-        assert cursor.fetchone()[0] == 0
-        conn.close()
+        row = pokervod_conn.execute("SELECT COUNT(*) AS count FROM files").fetchone()
+        assert row["count"] == 0
@@ -30,6 +30,17 @@ class TestHealthEndpoint:
         # healthy 또는 unhealthy 중 하나
         assert data["status"] in ("healthy", "unhealthy")
 
+    def test_health_body_reused_until_state_changes(self, client, monkeypatch):
+        """상태가 같으면 직렬화된 본문 재사용, 바뀌면 갱신"""
+        from archive_analyzer.web.app import _health_bytes, state
+
+        monkeypatch.setattr(state, "error_message", None)
+        body = _health_bytes()
+        assert _health_bytes() is body
+
+        monkeypatch.setattr(state, "error_message", "boom")
+        assert client.get("/health").json()["error"] == "boom"
+
 
 class TestAPIStatusEndpoint:
     """API 상태 엔드포인트 테스트"""
@@ -88,6 +99,54 @@ class TestAPISyncEndpoint:
         # 405 Method Not Allowed가 아니면 엔드포인트 존재
         assert response.status_code != 405
 
+    def test_sync_job_runs_on_dedicated_worker(self):
+        """동기화 작업은 전용 sync 워커 스레드에서 실행"""
+        import threading
+        from archive_analyzer.web.app import state, submit_sync_job
+
+        state.sync_in_progress = False
+        future = submit_sync_job(lambda: threading.current_thread().name)
+        assert future is state.sync_future
+        assert future.result(timeout=60).startswith("sync")
+        state.sync_in_progress = False
+
+    def test_concurrent_submits_accept_only_one(self):
+        """동시 제출 중 1건만 수락 (check-then-set 경쟁 없음)"""
+        import threading
+        from archive_analyzer.web.app import state, submit_sync_job
+
+        state.sync_in_progress = False
+        release = threading.Event()
+        barrier = threading.Barrier(8)
+        accepted = []
+
+        def submit():
+            barrier.wait()
+            future = submit_sync_job(release.wait)
+            if future is not None:
+                accepted.append(future)
+
+        threads = [threading.Thread(target=submit) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        release.set()
+
+        assert len(accepted) == 1
+        accepted[0].result(timeout=60)
+        state.sync_in_progress = False
+
+    def test_submit_rejected_while_in_progress(self):
+        """진행 중이면 새 작업을 제출하지 않음"""
+        from archive_analyzer.web.app import state, submit_sync_job
+
+        state.sync_in_progress = True
+        try:
+            assert submit_sync_job(lambda: None) is None
+        finally:
+            state.sync_in_progress = False
+
 
 class TestAPILogsEndpoint:
     """로그 API 엔드포인트 테스트"""
@@ -103,6 +162,22 @@ class TestAPILogsEndpoint:
         # 404가 아니면 엔드포인트 존재
         assert response.status_code != 404
 
+    def test_logs_returns_latest_in_order(self, client, monkeypatch):
+        """최근 limit개를 시간순으로 반환"""
+        from collections import deque
+        from archive_analyzer.web.app import state
+
+        monkeypatch.setattr(state, "log_buffer", deque(["a", "b", "c", "d"], maxlen=10))
+        assert client.get("/api/logs?limit=2").json() == {"logs": ["c", "d"]}
+        assert client.get("/api/logs?limit=0").json() == {"logs": []}
+
+    def test_log_buffer_size_from_env(self, monkeypatch):
+        """LOG_BUFFER_SIZE 환경변수로 버퍼 크기 설정"""
+        from archive_analyzer.web.app import WebConfig
+
+        monkeypatch.setenv("LOG_BUFFER_SIZE", "5000")
+        assert WebConfig().log_buffer_size == 5000
+
 
 # =============================================================================
 # Issue #45: 1:1 매칭 API 테스트
@@ -209,3 +284,913 @@ class TestAPIDashboardEndpoint:
         response = client.get("/api/dashboard")
         data = response.json()
         assert "sync_status" in data
+
+
+class TestWebSocketLogHandler:
+    """로그 핸들러 테스트"""
+
+    def test_pump_formats_and_buffers(self):
+        """펌프 태스크가 레코드를 포맷해 버퍼에 적재"""
+        import asyncio
+        import logging
+        from archive_analyzer.web.app import ServiceState, WebSocketLogHandler
+
+        svc_state = ServiceState()
+        handler = WebSocketLogHandler(svc_state)
+
+        async def run():
+            handler.start()
+            record = logging.LogRecord("t", logging.INFO, __file__, 1, "hello %s", ("x",), None)
+            handler.emit(record)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            await handler.stop()
+
+        asyncio.run(run())
+        assert len(svc_state.log_buffer) == 1
+        assert svc_state.log_buffer[0].endswith("[INFO] hello x")
+
+    def test_pump_coalesces_burst_into_one_frame(self):
+        """짧은 구간에 몰린 로그는 JSON 배열 한 프레임으로 브로드캐스트"""
+        import asyncio
+        import json
+        import logging
+        from unittest.mock import AsyncMock
+        from archive_analyzer.web.app import (
+            LOG_COALESCE_SECONDS,
+            ServiceState,
+            WebSocketLogHandler,
+        )
+
+        svc_state = ServiceState()
+        client = AsyncMock()
+        svc_state.connected_clients.add(client)
+        handler = WebSocketLogHandler(svc_state)
+
+        async def run():
+            handler.start()
+            for i in range(3):
+                handler.emit(logging.LogRecord("t", logging.INFO, __file__, 1, f"m{i}", (), None))
+            await asyncio.sleep(LOG_COALESCE_SECONDS * 3)
+            await handler.stop()
+
+        asyncio.run(run())
+        client.send_text.assert_awaited_once()
+        frame = json.loads(client.send_text.await_args.args[0])
+        assert frame["type"] == "log"
+        assert len(frame["data"]) == 3
+        assert len(svc_state.log_buffer) == 3
+
+
+class TestWebSocketLogs:
+    """로그 WebSocket 테스트"""
+
+    def test_backlog_sent_as_single_frame(self):
+        """접속 시 현재 상태 후 백로그를 단일 프레임으로 전송"""
+        from archive_analyzer.web.app import app, state
+
+        state.log_buffer.clear()
+        state.log_buffer.extend(["line1", "line2", "line3"])
+        try:
+            with TestClient(app).websocket_connect("/ws/logs") as ws:
+                assert ws.receive_json()["type"] == "status"
+                assert ws.receive_json() == {"type": "log", "data": ["line1", "line2", "line3"]}
+        finally:
+            state.log_buffer.clear()
+
+    def test_status_pushed_on_job_start_and_finish(self, monkeypatch):
+        """작업 제출/종료 시 /ws/logs 클라이언트에게 상태 메시지 푸시"""
+        import sys
+        import threading
+        import time
+        import archive_analyzer.web.app  # noqa: F401
+
+        mod = sys.modules["archive_analyzer.web.app"]
+        monkeypatch.setattr(mod, "warm_caches", lambda: None)
+        release = threading.Event()
+
+        def job():
+            release.wait(5)
+            mod._finish_sync_job()
+
+        with TestClient(mod.app) as client:
+            with client.websocket_connect("/ws/logs") as ws:
+                assert ws.receive_json()["payload"]["sync_in_progress"] is False
+                for _ in range(100):
+                    if mod.state.connected_clients:
+                        break
+                    time.sleep(0.01)
+                assert mod.submit_sync_job(job) is not None
+                assert ws.receive_json()["payload"]["sync_in_progress"] is True
+                release.set()
+                assert ws.receive_json() == {
+                    "type": "status",
+                    "payload": {
+                        "is_running": mod.state.is_running,
+                        "sync_in_progress": False,
+                        "last_sync_time": mod.state.last_sync_time_iso,
+                        "error_message": mod.state.error_message,
+                    },
+                }
+
+    def test_broadcast_drops_failed_clients(self):
+        """전송 실패한 클라이언트는 목록에서 제거"""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from archive_analyzer.web.app import ServiceState, WebSocketLogHandler
+
+        svc_state = ServiceState()
+        ok, broken = AsyncMock(), AsyncMock()
+        broken.send_text.side_effect = RuntimeError("closed")
+        svc_state.connected_clients.update([ok, broken])
+
+        asyncio.run(WebSocketLogHandler(svc_state)._broadcast("msg"))
+
+        ok.send_text.assert_awaited_once_with("msg")
+        assert svc_state.connected_clients == {ok}
+
+
+class TestSSELogs:
+    """/api/logs/stream (SSE) 테스트"""
+
+    def test_pump_publishes_event_with_seq_id(self):
+        """펌프가 SSE 구독자 큐에 줄 번호(id)가 붙은 이벤트 적재"""
+        import asyncio
+        import json
+        import logging
+        from archive_analyzer.web.app import (
+            LOG_COALESCE_SECONDS,
+            ServiceState,
+            WebSocketLogHandler,
+        )
+
+        svc_state = ServiceState()
+        handler = WebSocketLogHandler(svc_state)
+
+        async def run():
+            queue = asyncio.Queue()
+            svc_state.log_streams.add(queue)
+            handler.start()
+            for i in range(2):
+                handler.emit(logging.LogRecord("t", logging.INFO, __file__, 1, f"m{i}", (), None))
+            await asyncio.sleep(LOG_COALESCE_SECONDS * 3)
+            await handler.stop()
+            return queue.get_nowait()
+
+        event = asyncio.run(run())
+        id_line, data_line = event.strip().split("\n")
+        assert id_line == "id: 2"
+        frame = json.loads(data_line.removeprefix("data: "))
+        assert frame == {"type": "log", "data": list(svc_state.log_buffer)}
+
+    def test_stalled_subscriber_dropped_when_queue_full(self):
+        """큐가 가득 찬 구독자는 제거되고 종료 표시만 남으며 다른 구독자는 유지"""
+        import asyncio
+        from archive_analyzer.web.app import _publish_sse
+
+        async def run():
+            stalled = asyncio.Queue(maxsize=2)
+            healthy = asyncio.Queue(maxsize=2)
+            streams = {stalled, healthy}
+            _publish_sse(streams, "e1")
+            _publish_sse(streams, "e2")
+            healthy.get_nowait()
+            healthy.get_nowait()
+            _publish_sse(streams, "e3")
+            return streams, stalled, healthy
+
+        streams, stalled, healthy = asyncio.run(run())
+        assert streams == {healthy}
+        assert stalled.get_nowait() is None and stalled.empty()
+        assert healthy.get_nowait() == "e3"
+
+    @pytest.mark.parametrize(
+        "last_event_id,expected",
+        [
+            (None, ["l1", "l2", "l3"]),
+            ("2", ["l3"]),
+            ("3", []),
+            ("99", ["l1", "l2", "l3"]),
+            ("bogus", ["l1", "l2", "l3"]),
+        ],
+    )
+    def test_backlog_resumes_after_last_event_id(self, monkeypatch, last_event_id, expected):
+        """Last-Event-ID 이후 줄만 재전송, 알 수 없는 ID면 버퍼 전체"""
+        import sys
+        from collections import deque
+        import archive_analyzer.web.app  # noqa: F401
+
+        app_module = sys.modules["archive_analyzer.web.app"]
+        monkeypatch.setattr(app_module.state, "log_buffer", deque(["l1", "l2", "l3"]))
+        monkeypatch.setattr(app_module.state, "log_seq", 3)
+
+        assert app_module._log_backlog(last_event_id) == expected
+
+
+class TestDashboardPush:
+    """대시보드 WebSocket 푸시 테스트"""
+
+    def test_sync_completion_pushes_dashboard(self):
+        """워커 스레드의 알림이 /ws/dashboard 구독자에게 전달"""
+        import json
+        import threading
+        import time
+        from archive_analyzer.web.app import app, notify_dashboard_subscribers, state
+
+        with TestClient(app) as client:
+            with client.websocket_connect("/ws/dashboard") as ws:
+                for _ in range(100):
+                    if state.dashboard_subscribers:
+                        break
+                    time.sleep(0.01)
+                worker = threading.Thread(target=notify_dashboard_subscribers)
+                worker.start()
+                worker.join()
+
+                data = json.loads(ws.receive_text())
+                assert "source" in data
+                assert data["sync_status"]["is_running"] is False
+        assert not state.dashboard_subscribers
+
+    def test_dashboard_polls_for_external_changes(self):
+        """외부 프로세스 변경 반영용 저빈도 재검증은 탭이 보일 때만 실행"""
+        from archive_analyzer.web.app import EMBEDDED_DASHBOARD_HTML
+
+        assert "startWhenVisible(pollDashboard, DASHBOARD_POLL_MS)" in EMBEDDED_DASHBOARD_HTML
+        assert "fetchLatest('dashboard', '/api/dashboard')" in EMBEDDED_DASHBOARD_HTML
+
+
+class TestCompression:
+    """응답 압축 테스트"""
+
+    def test_dashboard_html_is_gzipped(self):
+        """대시보드 HTML은 gzip으로 압축 전송"""
+        from archive_analyzer.web.app import app
+
+        response = TestClient(app).get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+
+    def test_embedded_dashboard_served_precompressed(self):
+        """내장 대시보드는 미리 압축한 본문을 그대로 전송"""
+        from archive_analyzer.web.app import (
+            _EMBEDDED_DASHBOARD_BYTES,
+            _EMBEDDED_DASHBOARD_GZIP,
+            get_embedded_dashboard,
+        )
+
+        compressed = get_embedded_dashboard("gzip, deflate")
+        assert compressed.body == _EMBEDDED_DASHBOARD_GZIP
+        assert compressed.headers["content-encoding"] == "gzip"
+
+        plain = get_embedded_dashboard("identity")
+        assert "content-encoding" not in plain.headers
+        assert plain.body == _EMBEDDED_DASHBOARD_BYTES
+
+    def test_dashboard_inlines_initial_state(self):
+        """GET /는 대시보드/매칭 초기 데이터를 인라인"""
+        from archive_analyzer.web.app import app
+
+        client = TestClient(app)
+        compressed = client.get("/", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert compressed.text == plain.text
+        assert "window.__INITIAL_STATE__=" in plain.text
+        assert plain.text.index("__INITIAL_STATE__") < plain.text.index("</head>")
+
+    def test_initial_state_escapes_script_close(self):
+        """인라인 데이터의 </script>는 이스케이프"""
+        import json
+        from archive_analyzer.web.app import render_embedded_dashboard
+
+        html = render_embedded_dashboard({"x": "</script><b>"}).decode()
+        blob = html.split("window.__INITIAL_STATE__=", 1)[1].split(";</script>", 1)[0]
+        assert "</script>" not in blob
+        assert json.loads(blob) == {"x": "</script><b>"}
+
+
+class TestDbStats:
+    """DB 통계 헬퍼 테스트"""
+
+    @pytest.fixture
+    def db_pair(self, tmp_path):
+        import sqlite3
+
+        archive = tmp_path / "archive.db"
+        conn = sqlite3.connect(archive)
+        conn.execute(
+            "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT,"
+            " file_type TEXT, scan_status TEXT, created_at TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO files (path, filename, file_type, scan_status, created_at)"
+            " VALUES ('a/x.mp4', 'x.mp4', 'video', 'done', '2024-01-01')"
+        )
+        conn.commit()
+        conn.close()
+
+        pokervod = tmp_path / "pokervod.db"
+        conn = sqlite3.connect(pokervod)
+        conn.execute(
+            "CREATE TABLE files (id TEXT PRIMARY KEY, nas_path TEXT, filename TEXT,"
+            " codec TEXT, analysis_status TEXT, updated_at TEXT)"
+        )
+        conn.commit()
+        conn.close()
+        return str(archive), str(pokervod)
+
+    def test_attached_stats_match_individual(self, db_pair):
+        """ATTACH 단일 연결 결과가 개별 조회와 동일"""
+        from archive_analyzer.web.app import get_both_db_stats, get_db_stats
+
+        archive, pokervod = db_pair
+        combined = get_both_db_stats(archive, pokervod)
+        assert combined["archive"] == get_db_stats(archive)
+        assert combined["pokervod"] == get_db_stats(pokervod)
+        assert combined["archive"]["total_files"] == 1
+
+
+    def test_stats_cached_until_db_changes(self, db_pair):
+        """DB mtime이 바뀌기 전까지 캐시된 통계 반환"""
+        import os
+        import sqlite3
+        from archive_analyzer.web.app import get_db_stats
+
+        archive, _ = db_pair
+        first = get_db_stats(archive)
+        assert get_db_stats(archive) is first
+
+        conn = sqlite3.connect(archive)
+        conn.execute("INSERT INTO files (path, filename) VALUES ('a/y.mp4', 'y.mp4')")
+        conn.commit()
+        conn.close()
+        st = os.stat(archive)
+        os.utime(archive, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert get_db_stats(archive)["total_files"] == 2
+    def test_readonly_connection_rejects_writes(self, db_pair):
+        """조회용 연결은 쓰기 불가"""
+        import sqlite3
+        from archive_analyzer.web.app import _open
+
+        archive, _ = db_pair
+        conn = _open(archive)
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM files")
+        finally:
+            conn.close()
+
+
+    def test_pool_reuses_connection_per_thread(self, db_pair):
+        """같은 스레드에서는 연결 재사용, close_pool()로 정리"""
+        from archive_analyzer.web.app import _get_conn, close_pool
+
+        archive, pokervod = db_pair
+        conn = _get_conn(archive)
+        assert _get_conn(archive) is conn
+        assert _get_conn(archive, attach_pv=pokervod) is not conn
+
+        close_pool()
+        assert _get_conn(archive) is not conn
+        close_pool()
+
+    def test_close_pool_invalidates_other_threads(self, db_pair):
+        """다른 스레드가 캐시한 연결도 close_pool() 후에는 새 연결로 교체"""
+        from concurrent.futures import ThreadPoolExecutor
+        from archive_analyzer.web.app import _get_conn, close_pool
+
+        archive, _ = db_pair
+        with ThreadPoolExecutor(max_workers=1) as worker:
+            old = worker.submit(_get_conn, archive).result()
+            close_pool()
+            new = worker.submit(_get_conn, archive).result()
+            assert new is not old
+            assert worker.submit(lambda: new.execute("SELECT 1").fetchone()[0]).result() == 1
+        close_pool()
+
+    def test_dashboard_bundle_uses_single_connection(self, db_pair):
+        """대시보드 번들은 ATTACH 연결 1개로 통계/매칭 요약 조회"""
+        from archive_analyzer.web.app import _POOL, close_pool, get_dashboard_bundle
+
+        archive, pokervod = db_pair
+        close_pool()
+        bundle = get_dashboard_bundle(archive, pokervod)
+
+        assert bundle["db_stats"]["archive"]["total_files"] == 1
+        assert "catalogs" in bundle["matching_summary"]
+        assert list(_POOL.conns) == [(archive, pokervod)]
+        close_pool()
+
+
+
+class TestHistoryHtmlEndpoint:
+    """이력 HTML 조각 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        import sqlite3
+        from archive_analyzer.web.app import app, state
+
+        db = tmp_path / "archive.db"
+        conn = sqlite3.connect(db)
+        conn.execute("CREATE TABLE files (id INTEGER PRIMARY KEY, filename TEXT)")
+        conn.execute(
+            "CREATE TABLE file_history (id INTEGER PRIMARY KEY, file_id INTEGER,"
+            " event_type TEXT, old_path TEXT, new_path TEXT, detected_at TEXT)"
+        )
+        conn.execute("INSERT INTO files VALUES (1, 'a.mp4')")
+        conn.execute(
+            "INSERT INTO file_history VALUES (7, 1, 'deleted', 'x/a.mp4', NULL, '2024-01-01')"
+        )
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(state.config, "archive_db", str(db))
+        return TestClient(app)
+
+    def test_renders_rows_with_event_class(self, client):
+        """이벤트 CSS 클래스가 서버에서 렌더링됨"""
+        response = client.get("/api/history.html")
+        assert response.status_code == 200
+        assert "bg-red-800" in response.text
+        assert "a.mp4" in response.text
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_not_modified_when_etag_matches(self, client):
+        """ETag 일치 시 304 반환"""
+        etag = client.get("/api/history.html").headers["etag"]
+        response = client.get("/api/history.html", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_etag_changes_on_external_write(self, client):
+        """다른 프로세스가 이력을 기록해도 ETag가 바뀌어 새 행을 반환"""
+        import sqlite3
+        import time
+        from archive_analyzer.web.app import state
+
+        etag = client.get("/api/history.html").headers["etag"]
+        time.sleep(0.01)  # mtime_ns 해상도가 낮은 파일시스템 대비
+        conn = sqlite3.connect(state.config.archive_db)
+        conn.execute(
+            "INSERT INTO file_history VALUES (8, 1, 'moved', 'x/a.mp4', 'y/a.mp4', '2024-01-02')"
+        )
+        conn.commit()
+        conn.close()
+
+        response = client.get("/api/history.html", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert "y/a.mp4" in response.text
+
+    def test_embedded_dashboard_loads_history_rows(self):
+        """내장 대시보드의 변경 이력 탭이 HTML 조각을 사용"""
+        from archive_analyzer.web.app import EMBEDDED_DASHBOARD_HTML
+
+        assert "fetchLatest('history', '/api/history.html')" in EMBEDDED_DASHBOARD_HTML
+        assert 'id="history-body"' in EMBEDDED_DASHBOARD_HTML
+
+
+class TestMatchingCache:
+    """매칭 조회 캐시 테스트"""
+
+    @pytest.fixture
+    def matching_dbs(self, tmp_path):
+        """archive 4건(중복 1) / pokervod 1건 매칭 DB"""
+        import sqlite3
+
+        archive = tmp_path / "archive.db"
+        conn = sqlite3.connect(archive)
+        conn.execute(
+            "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT,"
+            " file_type TEXT, size_bytes INTEGER)"
+        )
+        conn.executemany(
+            "INSERT INTO files (path, filename, file_type, size_bytes) VALUES (?, ?, 'video', 1)",
+            [
+                ("WSOP/a.mp4", "a.mp4"),
+                ("WSOP/dup/a.mp4", "a.mp4"),
+                ("HCL/b.mxf", "b.mxf"),
+                ("PAD/c.mp4", "c.mp4"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        pokervod = tmp_path / "pokervod.db"
+        conn = sqlite3.connect(pokervod)
+        conn.execute(
+            "CREATE TABLE files (id TEXT PRIMARY KEY, filename TEXT, nas_path TEXT, size_bytes INTEGER)"
+        )
+        conn.execute("INSERT INTO files VALUES ('x', 'a.mp4', '//nas/WSOP/a.mp4', 1)")
+        conn.commit()
+        conn.close()
+        return str(archive), str(pokervod)
+
+    def test_items_join_target(self, matching_dbs):
+        """매칭 아이템에 pokervod 대상 정보와 중복 경로 포함"""
+        from archive_analyzer.web.app import get_matching_items
+
+        items, total, _ = get_matching_items(*matching_dbs)
+        assert total == 4
+        first = items[0]
+        assert first["status"] == "synced_with_duplicates"
+        assert first["target"]["id"] == "x"
+        assert [d["path"] for d in first["duplicates"]] == ["WSOP/dup/a.mp4"]
+        assert items[2]["target"] is None
+
+    def test_items_filter_and_sort_in_sql(self, matching_dbs):
+        """상태 필터는 페이지네이션 전에 적용되고 total에 반영"""
+        from archive_analyzer.web.app import get_matching_items
+
+        items, total, summary = get_matching_items(
+            *matching_dbs, per_page=1, status_filter="not_synced"
+        )
+        assert total == 2
+        # summary는 페이지와 무관한 전체 상태별 건수
+        assert summary == {"synced": 0, "not_synced": 2, "synced_with_duplicates": 2}
+        assert [i["source"]["filename"] for i in items] == ["b.mxf"]
+
+        items, _, _ = get_matching_items(*matching_dbs, sort_by="filename", order="desc")
+        assert items[0]["source"]["filename"] == "c.mp4"
+
+    def test_summary_uses_extension_column(self, tmp_path):
+        """extension 컬럼이 있으면 해당 값으로 HLS 비호환 판정"""
+        import sqlite3
+        from archive_analyzer.web.app import get_matching_summary
+
+        archive = tmp_path / "archive.db"
+        conn = sqlite3.connect(archive)
+        conn.execute(
+            "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT, extension TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO files (path, filename, extension) VALUES (?, ?, ?)",
+            [("HCL/a.MXF", "a.MXF", ".mxf"), ("HCL/b.mp4", "b.mp4", ".mp4")],
+        )
+        conn.commit()
+        conn.close()
+
+        summary = get_matching_summary(str(archive), str(tmp_path / "missing.db"))
+        assert summary["not_synced"] == 1
+
+    def test_catalog_tree_synced_counts(self, matching_dbs):
+        """카탈로그 트리 synced 집계"""
+        from archive_analyzer.web.app import get_catalog_tree
+
+        tree = {c["name"]: c for c in get_catalog_tree(*matching_dbs)}
+        assert tree["WSOP"]["synced"] == 2
+        assert tree["HCL"]["not_synced"] == 1
+
+    def test_ensure_indexes_tolerates_locked_db(self, matching_dbs, monkeypatch):
+        """쓰기 연결이 실패해도 인덱스 보정은 예외 없이 1회만 시도하고 조회는 성공"""
+        import sqlite3
+        import sys
+        import archive_analyzer.web.app  # noqa: F401
+
+        web_app = sys.modules["archive_analyzer.web.app"]
+        archive, pokervod = matching_dbs
+        monkeypatch.setattr(web_app, "_indexed_dbs", set())
+        real_open = web_app._open
+        writer_calls = []
+
+        def locked_open(db_path, readonly=True):
+            if not readonly:
+                writer_calls.append(db_path)
+                raise sqlite3.OperationalError("database is locked")
+            return real_open(db_path, readonly=readonly)
+
+        monkeypatch.setattr(web_app, "_open", locked_open)
+        web_app._ensure_indexes(archive)
+        web_app._ensure_indexes(archive)
+        assert writer_calls == [archive]
+
+        web_app.invalidate_caches()
+        summary = web_app.get_matching_summary(archive, pokervod)
+        assert "error" not in summary
+        assert writer_calls == [archive]
+
+    def test_ensure_indexes_keeps_journal_mode(self, matching_dbs, monkeypatch):
+        """인덱스 보정이 archive.db의 journal_mode를 바꾸지 않음"""
+        import os
+        import sqlite3
+        import sys
+        import archive_analyzer.web.app  # noqa: F401
+
+        web_app = sys.modules["archive_analyzer.web.app"]
+        archive, _ = matching_dbs
+        monkeypatch.setattr(web_app, "_indexed_dbs", set())
+        web_app._ensure_indexes(archive)
+
+        conn = sqlite3.connect(archive)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            indexes = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+        finally:
+            conn.close()
+        assert "idx_files_filename" in indexes
+        assert not os.path.exists(f"{archive}-wal")
+
+    def test_summary_cached_and_invalidated(self, tmp_path):
+        """요약은 캐시되고 invalidate_caches()로 무효화"""
+        import sqlite3
+        from archive_analyzer.web.app import get_matching_summary, invalidate_caches
+
+        archive = tmp_path / "archive.db"
+        pokervod = tmp_path / "pokervod.db"
+        for db in (archive, pokervod):
+            conn = sqlite3.connect(db)
+            conn.execute("CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT)")
+            conn.commit()
+            conn.close()
+
+        first = get_matching_summary(str(archive), str(pokervod))
+        assert get_matching_summary(str(archive), str(pokervod)) is first
+
+        invalidate_caches()
+        assert get_matching_summary(str(archive), str(pokervod)) is not first
+
+    def test_concurrent_misses_run_query_once(self, tmp_path):
+        """동일 키 동시 미스는 쿼리 1회로 합쳐짐"""
+        import threading
+        import time
+        from archive_analyzer.web.app import _ttl_cache
+
+        db = tmp_path / "x.db"
+        db.write_bytes(b"")
+        calls = []
+
+        @_ttl_cache(60)
+        def slow(db_path):
+            calls.append(db_path)
+            time.sleep(0.05)
+            return {"ok": True}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(slow(str(db))))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        # 채운 뒤 키별 락은 남지 않음
+        assert not slow._inflight
+
+    def test_cache_bounded_lru(self, tmp_path):
+        """maxsize 초과 시 가장 오래 사용하지 않은 키부터 제거"""
+        from archive_analyzer.web.app import _ttl_cache
+
+        db = tmp_path / "x.db"
+        db.write_bytes(b"")
+        calls = []
+
+        @_ttl_cache(60, maxsize=2)
+        def query(db_path, n):
+            calls.append(n)
+            return {"n": n}
+
+        for n in (1, 2, 1, 3):  # 3 저장 시 가장 오래된 2 제거
+            query(str(db), n)
+        query(str(db), 1)
+        assert calls == [1, 2, 3]
+        query(str(db), 2)
+        assert calls == [1, 2, 3, 2]
+
+    def test_matching_params_normalized(self):
+        """범위 밖/화이트리스트 외 파라미터는 보정"""
+        from archive_analyzer.web.app import MATCHING_MAX_PER_PAGE, normalize_matching_params
+
+        assert normalize_matching_params(0, 10**9, "bogus", "rowid; --", "DESC") == (
+            1,
+            MATCHING_MAX_PER_PAGE,
+            None,
+            "id",
+            "desc",
+        )
+        assert normalize_matching_params(3, 0, "synced", "size", "up") == (
+            3,
+            1,
+            "synced",
+            "size",
+            "asc",
+        )
+
+    def test_summary_counts_from_sql(self, matching_dbs):
+        """ATTACH 기반 집계 결과 검증"""
+        from archive_analyzer.web.app import get_matching_summary
+
+        summary = get_matching_summary(*matching_dbs)
+        assert summary["synced"] == 2
+        assert summary["not_synced"] == 1
+        assert summary["pending"] == 1
+        assert summary["duplicates"] == 1
+        assert {c["name"]: c["count"] for c in summary["catalogs"]}["WSOP"] == 2
+
+    def test_dashboard_payload_has_summary_counts(self, matching_dbs):
+        """대시보드 응답에 사유별 건수 포함"""
+        from archive_analyzer.web.app import build_dashboard_payload, get_dashboard_bundle
+
+        bundle = get_dashboard_bundle(*matching_dbs)
+        payload = build_dashboard_payload(bundle["db_stats"], bundle["matching_summary"])
+        assert payload["summary_counts"] == {
+            "synced": 2,
+            "hls_incompatible": 1,
+            "duplicate_excluded": 1,
+            "pending_sync": 1,
+        }
+
+
+class TestConditionalGet:
+    """조회 API ETag/304 테스트"""
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        import sqlite3
+        from archive_analyzer.web.app import app, state
+
+        for name in ("archive.db", "pokervod.db"):
+            conn = sqlite3.connect(tmp_path / name)
+            conn.execute("CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT)")
+            conn.commit()
+            conn.close()
+
+        monkeypatch.setattr(state.config, "archive_db", str(tmp_path / "archive.db"))
+        monkeypatch.setattr(state.config, "pokervod_db", str(tmp_path / "pokervod.db"))
+        monkeypatch.setattr(state, "last_sync_time", None)
+        return TestClient(app)
+
+    @pytest.mark.parametrize(
+        "url",
+        ["/", "/api/stats", "/api/history", "/api/dashboard", "/api/matching", "/api/matching/tree"],
+    )
+    def test_not_modified_when_etag_matches(self, client, url):
+        """ETag 일치 시 304, Cache-Control 포함"""
+        first = client.get(url)
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "no-cache"
+
+        response = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert response.status_code == 304
+
+    def test_dashboard_etag_changes_after_sync(self, client, monkeypatch):
+        """동기화 완료 시 대시보드 ETag 변경"""
+        from datetime import datetime
+        from archive_analyzer.web.app import state
+
+        client.get("/api/dashboard")
+        etag = client.get("/api/dashboard").headers["etag"]
+        monkeypatch.setattr(state, "last_sync_time", datetime(2024, 1, 1))
+
+        response = client.get("/api/dashboard", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+class TestFastJSONResponse:
+    """orjson 응답 클래스 테스트"""
+
+    def test_renders_none_keys_like_stdlib(self):
+        """None 키는 표준 json과 같이 "null"로 직렬화"""
+        import json
+        from archive_analyzer.web.app import FastJSONResponse
+
+        body = FastJSONResponse({"by_type": {None: 1, "video": 2}}).body
+        assert json.loads(body) == {"by_type": {"null": 1, "video": 2}}
+
+    def test_default_response_class(self):
+        """API 응답이 FastJSONResponse로 직렬화"""
+        from archive_analyzer.web.app import FastJSONResponse, app
+
+        assert app.router.default_response_class is FastJSONResponse
+        response = TestClient(app).get("/api/status")
+        assert response.headers["content-type"] == "application/json"
+
+
+
+class TestWarmCaches:
+    """동기화 후 캐시 예열 테스트"""
+
+    def test_warm_caches_populates_summary_and_tree(self, tmp_path, monkeypatch):
+        """예열 후 요약/트리 조회는 DB 접근 없이 캐시에서 반환"""
+        import sqlite3
+        import sys
+        import archive_analyzer.web.app  # noqa: F401
+
+        web_app = sys.modules["archive_analyzer.web.app"]
+        for name in ("archive.db", "pokervod.db"):
+            conn = sqlite3.connect(tmp_path / name)
+            conn.execute(
+                "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT, filename TEXT,"
+                " size_bytes INTEGER)"
+            )
+            conn.execute("INSERT INTO files (path, filename) VALUES ('WSOP/a.mp4', 'a.mp4')")
+            conn.commit()
+            conn.close()
+        archive, pokervod = str(tmp_path / "archive.db"), str(tmp_path / "pokervod.db")
+        monkeypatch.setattr(web_app.state.config, "archive_db", archive)
+        monkeypatch.setattr(web_app.state.config, "pokervod_db", pokervod)
+
+        web_app.invalidate_caches()
+        web_app.warm_caches()
+
+        def fail(*args):
+            raise AssertionError("cache miss")
+
+        monkeypatch.setattr(web_app, "_get_matching_conn", fail)
+        assert web_app.get_matching_summary(archive, pokervod)["catalogs"] == [
+            {"name": "WSOP", "count": 1}
+        ]
+        assert web_app.get_catalog_tree(archive, pokervod)[0]["name"] == "WSOP"
+
+
+
+class TestTemplates:
+    """템플릿 설정 테스트"""
+
+    def test_templates_precompiled_without_auto_reload(self):
+        """템플릿은 기동 시 컴파일되고 auto_reload 비활성"""
+        from archive_analyzer.web.app import create_app
+
+        templates = create_app().state.templates
+        assert templates.env.auto_reload is False
+        assert len(templates.env.cache) > 0
+
+
+class TestSingleflight:
+    """동시 조회 합치기 테스트"""
+
+    def test_concurrent_calls_share_one_worker(self):
+        """동일 인자의 동시 호출은 워커 실행 1회"""
+        import asyncio
+        import time
+        from archive_analyzer.web.app import _inflight, _singleflight
+
+        calls = []
+
+        def slow(x):
+            calls.append(x)
+            time.sleep(0.05)
+            return [x]
+
+        async def run():
+            return await asyncio.gather(*(_singleflight(slow, 1) for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert calls == [1]
+        assert all(r is results[0] for r in results)
+        assert not _inflight
+
+
+class TestStaticFiles:
+    """정적 파일 캐시 헤더 테스트"""
+
+    def test_hashed_assets_are_immutable(self, tmp_path):
+        """해시가 붙은 파일은 immutable, 그 외는 no-cache"""
+        from fastapi import FastAPI
+        from archive_analyzer.web.app import _make_static_files
+
+        (tmp_path / "app.3f9a1c2b.js").write_text("x")
+        (tmp_path / "logo.png").write_bytes(b"x")
+        static_app = FastAPI()
+        static_app.mount("/static", _make_static_files(str(tmp_path)))
+        client = TestClient(static_app)
+
+        hashed = client.get("/static/app.3f9a1c2b.js")
+        assert hashed.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert client.get("/static/logo.png").headers["cache-control"] == "no-cache"
+        assert client.get("/static/missing.js").status_code == 404
+
+
+class TestStreamingJson:
+    """대용량 매칭 페이지 스트리밍 직렬화 테스트"""
+
+    def test_iter_json_items_matches_regular_encoding(self):
+        """청크 직렬화 결과가 일반 JSON과 동일"""
+        import json
+        from archive_analyzer.web.app import STREAM_CHUNK_ITEMS, _iter_json_items
+
+        payload = {
+            "total": 3,
+            "items": [{"id": i, "name": f"f{i}"} for i in range(STREAM_CHUNK_ITEMS * 2 + 5)],
+            "summary": {"synced": 1},
+        }
+        assert json.loads(b"".join(_iter_json_items(payload))) == payload
+        assert json.loads(b"".join(_iter_json_items({"items": []}))) == {"items": []}
+
+    def test_large_page_is_streamed(self):
+        """per_page가 임계값을 넘으면 스트리밍 응답"""
+        from archive_analyzer.web.app import MATCHING_STREAM_THRESHOLD, app
+
+        client = TestClient(app)
+        response = client.get(f"/api/matching?per_page={MATCHING_STREAM_THRESHOLD + 1}")
+        assert response.status_code == 200
+        assert "content-length" not in response.headers
+        assert {"total", "items", "summary"} <= response.json().keys()